@@ -3,17 +3,70 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.common import validation
+from raymann.math_tools.matrix4d import Matrix4D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+
+
+def slab_test(
+    box_min: np.ndarray,
+    box_max: np.ndarray,
+    origins: np.ndarray,
+    inv_dirs: np.ndarray,
+    dir_is_neg: np.ndarray,
+    tmin: "float | np.ndarray",
+    tmax: "float | np.ndarray",
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """Vectorized ray/box slab test, the arguments broadcast against each other.
+
+    The sign masks pick the near and far plane of every slab, so no min/max
+    is needed per axis. Returns (hit, tnear, tfar) where [tnear, tfar] is
+    the overlap of the ray interval [tmin, tmax] with the box.
+    """
+    near = np.where(dir_is_neg, box_max, box_min)
+    far = np.where(dir_is_neg, box_min, box_max)
+    with np.errstate(invalid="ignore"):
+        # 0 * inf is nan for rays in a slab plane, fmax/fmin ignore it
+        t0 = (near - origins) * inv_dirs
+        t1 = (far - origins) * inv_dirs
+    tnear = np.fmax(np.fmax.reduce(t0, axis=-1), tmin)
+    tfar = np.fmin(np.fmin.reduce(t1, axis=-1), tmax)
+    return tnear <= tfar, tnear, tfar
+
+
+def transform_bounds(
+    matrix: Matrix4D, mins: np.ndarray, maxs: np.ndarray
+) -> (np.ndarray, np.ndarray):
+    """Bounds of K transformed (K, 3) boxes, the same as transforming all 8 corners.
+
+    The center is transformed as a point and the half extent by the absolute
+    linear part, which gives the tight axis aligned box of an affine image.
+    Empty boxes stay empty.
+    """
+    with np.errstate(invalid="ignore"):
+        center = 0.5 * (mins + maxs)
+        half = 0.5 * (maxs - mins)
+        world_center = matrix.transform_points(center)
+        world_half = half @ np.abs(matrix.data[:3, :3]).T
+    world_min = world_center - world_half
+    world_max = world_center + world_half
+    empty = np.any(mins > maxs, axis=-1)
+    world_min[empty] = np.inf
+    world_max[empty] = -np.inf
+    return world_min, world_max
 
 
 class BoundingBox:
-    def __init__(
-        self,
-        min_point: Point3D = Point3D(np.inf, np.inf, np.inf),
-        max_point: Point3D = Point3D(-np.inf, -np.inf, -np.inf),
-    ):
-        if isinstance(min_point, Point3D) and isinstance(max_point, Point3D):
+    def __init__(self, min_point: Point3D = None, max_point: Point3D = None):
+        if min_point is None:
+            min_point = Point3D(np.inf, np.inf, np.inf)
+        if max_point is None:
+            max_point = Point3D(-np.inf, -np.inf, -np.inf)
+        if not validation.CHECKED or (
+            isinstance(min_point, Point3D) and isinstance(max_point, Point3D)
+        ):
             self._min_point = min_point
             self._max_point = max_point
         else:
@@ -27,7 +80,7 @@ class BoundingBox:
 
     @min_point.setter
     def min_point(self, point: Point3D):
-        if isinstance(point, Point3D):
+        if not validation.CHECKED or isinstance(point, Point3D):
             self._min_point = point
         else:
             raise TypeError("must be Point3D")
@@ -38,36 +91,67 @@ class BoundingBox:
 
     @max_point.setter
     def max_point(self, point: Point3D):
-        if isinstance(point, Point3D):
+        if not validation.CHECKED or isinstance(point, Point3D):
             self._max_point = point
         else:
             raise TypeError("must be Point3D")
 
+    @classmethod
+    def from_points(cls, points: np.ndarray) -> "BoundingBox":
+        """bounds of an (N, 3) array of points"""
+        box = cls()
+        box.add_points(points)
+        return box
+
     def add_point(self, point: Point3D):
-        if isinstance(point, Point3D):
-            if point.x < self._min_point.x:
-                self._min_point.x = point.x
-            if point.y < self._min_point.y:
-                self._min_point.y = point.y
-            if point.z < self._min_point.z:
-                self._min_point.z = point.z
-
-            if point.x > self._max_point.x:
-                self._max_point.x = point.x
-            if point.y > self._max_point.y:
-                self._max_point.y = point.y
-            if point.z > self._max_point.z:
-                self._max_point.z = point.z
+        if not validation.CHECKED or isinstance(point, Point3D):
+            self._min_point = Point3D._from_array(np.minimum(self._min_point.data, point.data))
+            self._max_point = Point3D._from_array(np.maximum(self._max_point.data, point.data))
         else:
             raise TypeError("cannot add unknown type to BBox")
 
+    def add_points(self, points: np.ndarray):
+        """grows the box by an (N, 3) array of points in one reduction"""
+        if validation.CHECKED and not isinstance(points, np.ndarray):
+            raise TypeError("an (N, 3) numpy array must be provided")
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("points must have shape (N, 3)")
+        if points.shape[0] == 0:
+            return
+        lo = np.minimum(self._min_point.data, points.min(axis=0))
+        hi = np.maximum(self._max_point.data, points.max(axis=0))
+        self._min_point = Point3D._from_array(lo.astype(np.float64))
+        self._max_point = Point3D._from_array(hi.astype(np.float64))
+
     def add_box(self, box: "BoundingBox"):
-        if isinstance(box, BoundingBox):
-            self.add_point(box.min_point)
-            self.add_point(box.max_point)
+        if not validation.CHECKED or isinstance(box, BoundingBox):
+            self._min_point = Point3D._from_array(np.minimum(self._min_point.data, box.min_point.data))
+            self._max_point = Point3D._from_array(np.maximum(self._max_point.data, box.max_point.data))
         else:
             raise TypeError("cannot add unknown type to BBox")
 
+    def is_empty(self) -> bool:
+        return bool(np.any(self._min_point.data > self._max_point.data))
+
+    def centroid(self) -> Point3D:
+        return Point3D._from_array(0.5 * (self._min_point.data + self._max_point.data))
+
+    def corners(self) -> np.ndarray:
+        """(8, 3) array of the box corners, bit k of the row index selects max on axis k"""
+        lo = self._min_point.data
+        hi = self._max_point.data
+        idx = np.arange(8)[:, np.newaxis] >> np.arange(3) & 1
+        return np.where(idx == 1, hi, lo)
+
+    def transformed(self, matrix: Matrix4D) -> "BoundingBox":
+        """axis aligned bounds of the box transformed by matrix"""
+        if validation.CHECKED and not isinstance(matrix, Matrix4D):
+            raise TypeError("Matrix4D must be provided")
+        lo, hi = transform_bounds(
+            matrix, self._min_point.data[np.newaxis], self._max_point.data[np.newaxis]
+        )
+        return BoundingBox(Point3D._from_array(lo[0]), Point3D._from_array(hi[0]))
+
     def contains_point(self, point: Point3D) -> bool:
         if isinstance(point, Point3D):
             return (
@@ -85,19 +169,33 @@ class BoundingBox:
         return False
 
     def intersects_ray(self, ray: Ray) -> bool:
-        if not isinstance(ray, Ray):
+        if validation.CHECKED and not isinstance(ray, Ray):
             raise TypeError("ray needed as parameter")
         o = ray.origin
         d = ray.direction
-        xminmax = self._hit_axis(o.x, d.x, self.min_point.x, self.min_point.x)
-        yminmax = self._hit_axis(o.y, d.y, self.min_point.y, self.min_point.y)
-        zminmax = self._hit_axis(o.z, d.z, self.min_point.z, self.min_point.z)
-        tmin = max(max(xminmax[0], yminmax[0]), zminmax[0])
-        tmax = min(min(xminmax[1], yminmax[1]), zminmax[1])
+        xminmax = self._hit_axis(o.x, d.x, self.min_point.x, self.max_point.x)
+        yminmax = self._hit_axis(o.y, d.y, self.min_point.y, self.max_point.y)
+        zminmax = self._hit_axis(o.z, d.z, self.min_point.z, self.max_point.z)
+        tmin = max(xminmax[0], yminmax[0], zminmax[0], ray.tmin)
+        tmax = min(xminmax[1], yminmax[1], zminmax[1], ray.tmax)
         if tmin > tmax:
             return False
         return True
 
+    def intersects_rays(self, rays: RayBatch) -> (np.ndarray, np.ndarray, np.ndarray):
+        """(hit, tnear, tfar) of N rays against the box as (N,) arrays"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        return slab_test(
+            self._min_point.data,
+            self._max_point.data,
+            rays.origins,
+            rays.inv_directions,
+            rays.dir_is_negative,
+            rays.tmin,
+            rays.tmax,
+        )
+
     def _hit_axis(
         self,
         origin: int | float,
@@ -111,11 +209,105 @@ class BoundingBox:
         if abs(direction) >= 0.00001:
             tmin = tmin_numer / direction
             tmax = tmax_numer / direction
+        elif mmin <= origin <= mmax:
+            # parallel to the slab and inside it, the axis does not clip the ray
+            tmin, tmax = -np.inf, np.inf
         else:
-            tmin = tmin_numer * np.inf
-            tmax = tmax_numer * np.inf
+            tmin, tmax = np.inf, -np.inf
+            return tmin, tmax
 
         if tmin > tmax:
             tmin, tmax = tmax, tmin
 
         return tmin, tmax
+
+
+class BoxArray:
+    """K axis aligned boxes stored as contiguous (K, 3) min and max arrays"""
+
+    def __init__(self, mins: np.ndarray, maxs: np.ndarray):
+        if validation.CHECKED and not (
+            isinstance(mins, (np.ndarray, list)) and isinstance(maxs, (np.ndarray, list))
+        ):
+            raise TypeError("mins and maxs must be (K, 3) arrays")
+        mins = np.ascontiguousarray(mins, dtype=np.float64)
+        maxs = np.ascontiguousarray(maxs, dtype=np.float64)
+        if mins.ndim != 2 or mins.shape[1] != 3 or maxs.shape != mins.shape:
+            raise ValueError("mins and maxs must have shape (K, 3)")
+        self._mins = mins
+        self._maxs = maxs
+
+    @classmethod
+    def from_boxes(cls, boxes: "list[BoundingBox]") -> "BoxArray":
+        """packs a sequence of BoundingBox objects"""
+        if validation.CHECKED and not all(isinstance(b, BoundingBox) for b in boxes):
+            raise TypeError("a sequence of BoundingBox must be provided")
+        mins = np.array([b.min_point.coordinates for b in boxes]).reshape(-1, 3)
+        maxs = np.array([b.max_point.coordinates for b in boxes]).reshape(-1, 3)
+        return cls(mins, maxs)
+
+    @property
+    def mins(self) -> np.ndarray:
+        return self._mins
+
+    @property
+    def maxs(self) -> np.ndarray:
+        return self._maxs
+
+    def __len__(self) -> int:
+        return self._mins.shape[0]
+
+    def __getitem__(self, i: int) -> BoundingBox:
+        return BoundingBox(Point3D(*self._mins[i]), Point3D(*self._maxs[i]))
+
+    def union(self) -> BoundingBox:
+        """the box enclosing all K boxes"""
+        box = BoundingBox()
+        if len(self):
+            box.min_point = Point3D._from_array(self._mins.min(axis=0))
+            box.max_point = Point3D._from_array(self._maxs.max(axis=0))
+        return box
+
+    def centroids(self) -> np.ndarray:
+        """(K, 3) box centers, NaN along the axes on which a box is unbounded"""
+        with np.errstate(invalid="ignore"):
+            return 0.5 * (self._mins + self._maxs)
+
+    def transformed(self, matrix: Matrix4D) -> "BoxArray":
+        """axis aligned bounds of all K boxes transformed by matrix"""
+        if validation.CHECKED and not isinstance(matrix, Matrix4D):
+            raise TypeError("Matrix4D must be provided")
+        return BoxArray(*transform_bounds(matrix, self._mins, self._maxs))
+
+    def intersects_ray(self, ray: Ray) -> (np.ndarray, np.ndarray, np.ndarray):
+        """(hit, tnear, tfar) of one ray against all K boxes as (K,) arrays"""
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        d = np.asarray(ray.direction, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            inv_dir = 1.0 / d
+        return slab_test(
+            self._mins,
+            self._maxs,
+            np.asarray(ray.origin, dtype=np.float64),
+            inv_dir,
+            np.signbit(d),
+            ray.tmin,
+            ray.tmax,
+        )
+
+    def intersects_rays(self, rays: RayBatch) -> (np.ndarray, np.ndarray, np.ndarray):
+        """(hit, tnear, tfar) of ray i against box i, K rays are required"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        if len(rays) != len(self):
+            raise ValueError("one ray per box must be provided")
+        return slab_test(
+            self._mins,
+            self._maxs,
+            rays.origins,
+            rays.inv_directions,
+            rays.dir_is_negative,
+            rays.tmin,
+            rays.tmax,
+        )
@@ -0,0 +1,754 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+from typing import Callable
+
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoxArray, slab_test
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.geometry.primitive import Primitive, primitive_bounds
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+
+# leaf_fn(prim_ids, tmax) -> (t, prim), (inf, -1) if none of prim_ids is hit
+LeafFunction = Callable[[np.ndarray, float], "tuple[float, int]"]
+# packet_leaf_fn(prim_ids, ray_ids, tmax) -> (t, prim) arrays for the rays ray_ids of a packet
+PacketLeafFunction = Callable[[np.ndarray, np.ndarray, np.ndarray], "tuple[np.ndarray, np.ndarray]"]
+
+
+def surface_areas(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """surface areas of the (..., 3) boxes, empty boxes have area 0"""
+    ext = np.maximum(maxs - mins, 0.0)
+    return 2.0 * (ext[..., 0] * ext[..., 1] + ext[..., 1] * ext[..., 2] + ext[..., 2] * ext[..., 0])
+
+
+def interval_cull(
+    box_min: np.ndarray,
+    box_max: np.ndarray,
+    origin_lo: np.ndarray,
+    origin_hi: np.ndarray,
+    inv_lo: np.ndarray,
+    inv_hi: np.ndarray,
+    negative: np.ndarray,
+    tmin: float,
+    tmax: float,
+) -> bool:
+    """True if no ray of a packet can hit the box, by interval arithmetic.
+
+    The packet is given by the per axis ranges of its origins and inverse
+    directions, all of its directions must have the signs in negative. The
+    slab distances are bounded over those ranges, which is a test against the
+    frustum of the packet. NaN bounds never cull.
+    """
+    near = np.where(negative, box_max, box_min)
+    far = np.where(negative, box_min, box_max)
+    with np.errstate(invalid="ignore"):
+        near_t = np.stack(
+            ((near - origin_hi) * inv_lo, (near - origin_hi) * inv_hi,
+             (near - origin_lo) * inv_lo, (near - origin_lo) * inv_hi)
+        )
+        far_t = np.stack(
+            ((far - origin_hi) * inv_lo, (far - origin_hi) * inv_hi,
+             (far - origin_lo) * inv_lo, (far - origin_lo) * inv_hi)
+        )
+    entry = max(np.fmax.reduce(np.fmin.reduce(near_t, axis=0)), tmin)
+    leave = min(np.fmin.reduce(np.fmax.reduce(far_t, axis=0)), tmax)
+    return bool(entry > leave)
+
+
+class BVH:
+    """Bounding volume hierarchy stored in flat node arrays.
+
+    Nodes are in depth-first order, so the first child of an interior node i
+    is node i + 1. node_offset is the index of the second child for interior
+    nodes and the first entry of prim_indices for leaves, node_count is 0
+    for interior nodes and the number of primitives for leaves. node_axis
+    is the split axis of interior nodes. Traversal tests both children of a
+    node in one slab test and visits them in order of entry distance.
+    """
+
+    def __init__(
+        self,
+        node_min: np.ndarray,
+        node_max: np.ndarray,
+        node_offset: np.ndarray,
+        node_count: np.ndarray,
+        node_axis: np.ndarray,
+        prim_indices: np.ndarray,
+    ):
+        self._node_min = np.ascontiguousarray(node_min, dtype=np.float64)
+        self._node_max = np.ascontiguousarray(node_max, dtype=np.float64)
+        self._node_offset = np.ascontiguousarray(node_offset, dtype=np.int64)
+        self._node_count = np.ascontiguousarray(node_count, dtype=np.int64)
+        self._node_axis = np.ascontiguousarray(node_axis, dtype=np.int8)
+        self._prim_indices = np.ascontiguousarray(prim_indices, dtype=np.int64)
+        k = self._node_offset.shape[0]
+        if self._node_min.shape != (k, 3) or self._node_max.shape != (k, 3):
+            raise ValueError("node bounds must have shape (K, 3)")
+        if self._node_count.shape != (k,) or self._node_axis.shape != (k,):
+            raise ValueError("node arrays must have shape (K,)")
+        self._levels = None
+        self._reference_cost = None
+
+    @classmethod
+    def build(
+        cls,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        centroids: np.ndarray = None,
+        max_leaf_size: int = 4,
+        n_bins: int = 16,
+        traversal_cost: float = 1.0,
+        intersection_cost: float = 1.0,
+    ) -> "BVH":
+        """Builds the hierarchy over N primitive boxes with the binned SAH.
+
+        mins and maxs are (N, 3) arrays of primitive bounds, centroids
+        defaults to the box centers.
+        """
+        mins = np.ascontiguousarray(mins, dtype=np.float64)
+        maxs = np.ascontiguousarray(maxs, dtype=np.float64)
+        if mins.ndim != 2 or mins.shape[1] != 3 or maxs.shape != mins.shape:
+            raise ValueError("mins and maxs must have shape (N, 3)")
+        if centroids is None:
+            centroids = 0.5 * (mins + maxs)
+        else:
+            centroids = np.ascontiguousarray(centroids, dtype=np.float64)
+            if centroids.shape != mins.shape:
+                raise ValueError("centroids must have shape (N, 3)")
+        if not isinstance(max_leaf_size, int) or max_leaf_size < 1:
+            raise ValueError("max_leaf_size must be a positive int")
+        if not isinstance(n_bins, int) or n_bins < 2:
+            raise ValueError("n_bins must be an int of at least 2")
+
+        n = mins.shape[0]
+        max_nodes = max(1, 2 * n - 1)
+        node_min = np.empty((max_nodes, 3))
+        node_max = np.empty((max_nodes, 3))
+        node_offset = np.zeros(max_nodes, dtype=np.int64)
+        node_count = np.zeros(max_nodes, dtype=np.int64)
+        node_axis = np.zeros(max_nodes, dtype=np.int8)
+        prims = np.arange(n, dtype=np.int64)
+
+        if n == 0:
+            node_min[0] = np.inf
+            node_max[0] = -np.inf
+            return cls(node_min, node_max, node_offset, node_count, node_axis, prims)
+
+        n_nodes = 0
+        # (start, end, parent) ranges of prims, parent >= 0 for second children
+        stack = [(0, n, -1)]
+        while stack:
+            start, end, parent = stack.pop()
+            node = n_nodes
+            n_nodes += 1
+            if parent >= 0:
+                node_offset[parent] = node
+            ids = prims[start:end]
+            node_min[node] = mins[ids].min(axis=0)
+            node_max[node] = maxs[ids].max(axis=0)
+            split = cls._find_split(
+                mins[ids],
+                maxs[ids],
+                centroids[ids],
+                node_min[node],
+                node_max[node],
+                max_leaf_size,
+                n_bins,
+                traversal_cost,
+                intersection_cost,
+            )
+            if split is None:
+                node_offset[node] = start
+                node_count[node] = end - start
+                continue
+            axis, left = split
+            prims[start:end] = np.concatenate((ids[left], ids[~left]))
+            mid = start + int(np.count_nonzero(left))
+            node_axis[node] = axis
+            stack.append((mid, end, node))
+            stack.append((start, mid, -1))
+
+        return cls(
+            node_min[:n_nodes],
+            node_max[:n_nodes],
+            node_offset[:n_nodes],
+            node_count[:n_nodes],
+            node_axis[:n_nodes],
+            prims,
+        )
+
+    @classmethod
+    def stitch(cls, top: "BVH", subtrees: "list[BVH]") -> "BVH":
+        """Joins subtrees under the upper levels of top into one hierarchy.
+
+        Every primitive of a top leaf is the index of a subtree that replaces
+        it. Leaves holding several subtrees are expanded into a chain of
+        interior nodes. The prim_indices of the subtrees are kept as they
+        are and concatenated in depth-first order.
+        """
+        if len(subtrees) == 0:
+            return cls.build(np.zeros((0, 3)), np.zeros((0, 3)))
+        if any(sub.prim_indices.shape[0] == 0 for sub in subtrees):
+            raise ValueError("subtrees must not be empty")
+        mins, maxs, offsets, counts, axes, prims = [], [], [], [], [], []
+        n_nodes = 0
+        n_prims = 0
+
+        def emit_interior(box_min: np.ndarray, box_max: np.ndarray, axis: int) -> np.ndarray:
+            nonlocal n_nodes
+            offset = np.zeros(1, dtype=np.int64)
+            mins.append(np.reshape(box_min, (1, 3)))
+            maxs.append(np.reshape(box_max, (1, 3)))
+            offsets.append(offset)
+            counts.append(np.zeros(1, dtype=np.int64))
+            axes.append(np.array([axis], dtype=np.int8))
+            n_nodes += 1
+            return offset  # second child offset, set once the first child is emitted
+
+        def emit_subtree(i: int):
+            nonlocal n_nodes, n_prims
+            sub = subtrees[i]
+            offset = sub.node_offset.copy()
+            leaf = sub.node_count > 0
+            offset[~leaf] += n_nodes
+            offset[leaf] += n_prims
+            mins.append(sub.node_min)
+            maxs.append(sub.node_max)
+            offsets.append(offset)
+            counts.append(sub.node_count)
+            axes.append(sub.node_axis)
+            prims.append(sub.prim_indices)
+            n_nodes += len(sub)
+            n_prims += sub.prim_indices.shape[0]
+
+        def emit_group(ids: np.ndarray):
+            if ids.shape[0] == 1:
+                emit_subtree(int(ids[0]))
+                return
+            box_min = np.min([subtrees[i].node_min[0] for i in ids], axis=0)
+            box_max = np.max([subtrees[i].node_max[0] for i in ids], axis=0)
+            second = emit_interior(box_min, box_max, 0)
+            emit_subtree(int(ids[0]))
+            second[0] = n_nodes
+            emit_group(ids[1:])
+
+        def emit(node: int):
+            count = top.node_count[node]
+            if count > 0:
+                offset = top.node_offset[node]
+                emit_group(top.prim_indices[offset : offset + count])
+                return
+            second = emit_interior(top.node_min[node], top.node_max[node], top.node_axis[node])
+            emit(node + 1)
+            second[0] = n_nodes
+            emit(int(top.node_offset[node]))
+
+        emit(0)
+        return cls(
+            np.concatenate(mins),
+            np.concatenate(maxs),
+            np.concatenate(offsets),
+            np.concatenate(counts),
+            np.concatenate(axes),
+            np.concatenate(prims),
+        )
+
+    @staticmethod
+    def _find_split(
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        centroids: np.ndarray,
+        box_min: np.ndarray,
+        box_max: np.ndarray,
+        max_leaf_size: int,
+        n_bins: int,
+        traversal_cost: float,
+        intersection_cost: float,
+    ) -> "tuple[int, np.ndarray] | None":
+        """returns (axis, left mask) of the cheapest binned split, None for a leaf"""
+        n = centroids.shape[0]
+        if n == 1:
+            return None
+        cmin = centroids.min(axis=0)
+        cmax = centroids.max(axis=0)
+        extent = cmax - cmin
+        if not np.any(extent > 0.0):
+            return None  # all centroids coincide, no split separates them
+
+        parent_area = float(surface_areas(box_min, box_max))
+        # bins of every primitive along all three axes, flattened to axis * n_bins + bin
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(extent > 0.0, n_bins / extent, 0.0)
+        bins = ((centroids - cmin) * scale).astype(np.int64)
+        np.minimum(bins, n_bins - 1, out=bins)
+        flat = (bins + np.arange(3) * n_bins).ravel()
+        counts = np.bincount(flat, minlength=3 * n_bins).reshape(3, n_bins)
+        bin_min = np.full((3 * n_bins, 3), np.inf)
+        bin_max = np.full((3 * n_bins, 3), -np.inf)
+        np.minimum.at(bin_min, flat, np.repeat(mins, 3, axis=0))
+        np.maximum.at(bin_max, flat, np.repeat(maxs, 3, axis=0))
+        bin_min = bin_min.reshape(3, n_bins, 3)
+        bin_max = bin_max.reshape(3, n_bins, 3)
+        # the split after bin i puts bins 0..i on the left
+        left_area = surface_areas(
+            np.minimum.accumulate(bin_min, axis=1), np.maximum.accumulate(bin_max, axis=1)
+        )[:, :-1]
+        right_area = surface_areas(
+            np.minimum.accumulate(bin_min[:, ::-1], axis=1),
+            np.maximum.accumulate(bin_max[:, ::-1], axis=1),
+        )[:, ::-1][:, 1:]
+        left_count = np.cumsum(counts, axis=1)[:, :-1]
+        right_count = n - left_count
+        cost = left_area * left_count + right_area * right_count
+        cost[(left_count == 0) | (right_count == 0)] = np.inf
+        best_axis, best_split = np.unravel_index(int(np.argmin(cost)), cost.shape)
+        best_cost = cost[best_axis, best_split]
+        if np.isinf(best_cost):
+            return None
+        if parent_area > 0.0:
+            split_cost = traversal_cost + intersection_cost * best_cost / parent_area
+        else:
+            split_cost = traversal_cost + intersection_cost * n
+        if n <= max_leaf_size and split_cost >= intersection_cost * n:
+            return None
+        return int(best_axis), bins[:, best_axis] <= best_split
+
+    @property
+    def node_min(self) -> np.ndarray:
+        return self._node_min
+
+    @property
+    def node_max(self) -> np.ndarray:
+        return self._node_max
+
+    @property
+    def node_offset(self) -> np.ndarray:
+        return self._node_offset
+
+    @property
+    def node_count(self) -> np.ndarray:
+        return self._node_count
+
+    @property
+    def node_axis(self) -> np.ndarray:
+        return self._node_axis
+
+    @property
+    def prim_indices(self) -> np.ndarray:
+        return self._prim_indices
+
+    def __len__(self) -> int:
+        """number of nodes"""
+        return self._node_offset.shape[0]
+
+    def bounds(self) -> (np.ndarray, np.ndarray):
+        """min and max corner of the root node"""
+        return self._node_min[0], self._node_max[0]
+
+    def _interior_levels(self) -> "list[np.ndarray]":
+        """interior node ids grouped by depth, computed once top-down"""
+        if self._levels is None:
+            levels = []
+            frontier = np.zeros(1, dtype=np.int64)
+            while frontier.shape[0]:
+                frontier = frontier[self._node_count[frontier] == 0]
+                if frontier.shape[0] == 0:
+                    break
+                levels.append(frontier)
+                frontier = np.concatenate((frontier + 1, self._node_offset[frontier]))
+            self._levels = levels
+        return self._levels
+
+    def sah_cost(self, traversal_cost: float = 1.0, intersection_cost: float = 1.0) -> float:
+        """SAH cost of the hierarchy relative to the surface area of the root"""
+        areas = surface_areas(self._node_min, self._node_max)
+        if areas[0] <= 0.0:
+            return float(intersection_cost * self._prim_indices.shape[0])
+        leaf = self._node_count > 0
+        cost = traversal_cost * areas[~leaf].sum()
+        cost += intersection_cost * (areas[leaf] * self._node_count[leaf]).sum()
+        return float(cost / areas[0])
+
+    def refit(self, mins: np.ndarray, maxs: np.ndarray) -> float:
+        """Recomputes the node bounds bottom-up from new (N, 3) primitive bounds.
+
+        The topology is kept. Leaves are reduced in one reduceat pass and the
+        interior nodes one depth level at a time. Returns the SAH cost growth,
+        the cost now divided by the cost of the hierarchy before its first
+        refit. A rebuild pays off when it grows well above 1.
+        """
+        mins = np.asarray(mins, dtype=np.float64)
+        maxs = np.asarray(maxs, dtype=np.float64)
+        n = self._prim_indices.shape[0]
+        if mins.shape != (n, 3) or maxs.shape != (n, 3):
+            raise ValueError("mins and maxs must have shape (N, 3) of the build")
+        if self._reference_cost is None:
+            self._reference_cost = self.sah_cost()
+        if n == 0:
+            return 1.0
+        leaves = np.flatnonzero(self._node_count > 0)
+        leaves = leaves[np.argsort(self._node_offset[leaves], kind="stable")]
+        starts = self._node_offset[leaves]
+        self._node_min[leaves] = np.minimum.reduceat(mins[self._prim_indices], starts, axis=0)
+        self._node_max[leaves] = np.maximum.reduceat(maxs[self._prim_indices], starts, axis=0)
+        for ids in reversed(self._interior_levels()):
+            second = self._node_offset[ids]
+            self._node_min[ids] = np.minimum(self._node_min[ids + 1], self._node_min[second])
+            self._node_max[ids] = np.maximum(self._node_max[ids + 1], self._node_max[second])
+        if self._reference_cost <= 0.0:
+            return 1.0
+        return self.sah_cost() / self._reference_cost
+
+    def _traverse(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        leaf_fn: LeafFunction,
+        any_hit: bool,
+        root: int = 0,
+    ) -> (float, int):
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            inv_dir = 1.0 / direction
+        negative = np.signbit(direction)
+        t_best, prim_best = np.inf, -1
+        hit, tnear, _ = slab_test(
+            self._node_min[root], self._node_max[root], origin, inv_dir, negative, tmin, tmax
+        )
+        if not hit:
+            return t_best, prim_best
+        # (entry distance, node), entries behind the closest hit are dropped on pop
+        stack = [(float(tnear), root)]
+        while stack:
+            entry, node = stack.pop()
+            if entry > tmax:
+                continue
+            count = self._node_count[node]
+            if count > 0:
+                offset = self._node_offset[node]
+                t, prim = leaf_fn(self._prim_indices[offset : offset + count], tmax)
+                if t < tmax:
+                    t_best, prim_best, tmax = t, prim, t
+                    if any_hit:
+                        break
+                continue
+            children = (node + 1, self._node_offset[node])
+            hit, tnear, _ = slab_test(
+                self._node_min[children, :],
+                self._node_max[children, :],
+                origin,
+                inv_dir,
+                negative,
+                tmin,
+                tmax,
+            )
+            # push the farther child first so the nearer one is visited next
+            order = (1, 0) if tnear[0] <= tnear[1] else (0, 1)
+            for i in order:
+                if hit[i]:
+                    stack.append((float(tnear[i]), children[i]))
+        return t_best, prim_best
+
+    def closest_hit(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        leaf_fn: LeafFunction,
+    ) -> (float, int):
+        """Closest (t, prim) along the ray, (inf, -1) on a miss.
+
+        tmax shrinks to every hit found, so leaves behind it are skipped.
+        """
+        return self._traverse(origin, direction, tmin, tmax, leaf_fn, False)
+
+    def closest_hit_packet(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        leaf_fn: PacketLeafFunction,
+        min_active: float = 0.25,
+    ) -> (np.ndarray, np.ndarray):
+        """Closest (t, prim) arrays of a packet of coherent rays, (inf, -1) on a miss.
+
+        The packet walks the tree together. A node is culled for all rays at
+        once when the packet frustum misses it, otherwise the rays still
+        active are slab tested together and leaves get them in one leaf_fn
+        call. Once fewer than min_active of the rays remain in a subtree, the
+        packet has diverged and each of them finishes the subtree alone.
+        """
+        return self._traverse_packet(origins, directions, tmin, tmax, leaf_fn, min_active, False)
+
+    def any_hit_packet(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        leaf_fn: PacketLeafFunction,
+        min_active: float = 0.25,
+    ) -> (np.ndarray, np.ndarray):
+        """(t, prim) arrays of the first hits found for a packet, rays leave the packet at their first hit"""
+        return self._traverse_packet(origins, directions, tmin, tmax, leaf_fn, min_active, True)
+
+    def _traverse_packet(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        leaf_fn: PacketLeafFunction,
+        min_active: float,
+        any_hit: bool,
+    ) -> (np.ndarray, np.ndarray):
+        origins = np.ascontiguousarray(origins, dtype=np.float64)
+        directions = np.ascontiguousarray(directions, dtype=np.float64)
+        n = origins.shape[0]
+        tmin = np.broadcast_to(np.asarray(tmin, dtype=np.float64), (n,))
+        tmax = np.array(np.broadcast_to(np.asarray(tmax, dtype=np.float64), (n,)))
+        t_best = np.full(n, np.inf)
+        prim_best = np.full(n, -1, dtype=np.int64)
+        if n == 0:
+            return t_best, prim_best
+        with np.errstate(divide="ignore"):
+            inv_dirs = 1.0 / directions
+        negative = np.signbit(directions)
+        # the frustum test needs every ray to cross the slabs in the same order
+        coherent = bool(np.all(negative == negative[0]))
+        if coherent:
+            frustum = (
+                origins.min(axis=0),
+                origins.max(axis=0),
+                inv_dirs.min(axis=0),
+                inv_dirs.max(axis=0),
+                negative[0],
+                float(tmin.min()),
+            )
+        min_rays = min_active * n
+
+        stack = [(0, np.arange(n))]
+        while stack:
+            node, active = stack.pop()
+            if any_hit:
+                active = active[prim_best[active] < 0]
+                if active.shape[0] == 0:
+                    continue
+            if coherent and interval_cull(
+                self._node_min[node], self._node_max[node], *frustum, float(tmax[active].max())
+            ):
+                continue
+            hit, _, _ = slab_test(
+                self._node_min[node],
+                self._node_max[node],
+                origins[active],
+                inv_dirs[active],
+                negative[active],
+                tmin[active],
+                tmax[active],
+            )
+            active = active[hit]
+            if active.shape[0] == 0:
+                continue
+            if active.shape[0] < min_rays:
+                for i in active:
+                    t, prim = self._traverse(
+                        origins[i],
+                        directions[i],
+                        tmin[i],
+                        tmax[i],
+                        lambda ids, tm, i=i: self._single_leaf(leaf_fn, ids, i, tm),
+                        any_hit,
+                        node,
+                    )
+                    if t < tmax[i]:
+                        t_best[i], prim_best[i], tmax[i] = t, prim, t
+                continue
+            count = self._node_count[node]
+            if count > 0:
+                offset = self._node_offset[node]
+                t, prim = leaf_fn(self._prim_indices[offset : offset + count], active, tmax[active])
+                closer = t < tmax[active]
+                rays = active[closer]
+                t_best[rays] = t[closer]
+                prim_best[rays] = prim[closer]
+                tmax[rays] = t[closer]
+                continue
+            # the majority direction along the split axis decides the near child
+            axis = self._node_axis[node]
+            if 2 * np.count_nonzero(negative[active, axis]) > active.shape[0]:
+                stack.append((node + 1, active))
+                stack.append((int(self._node_offset[node]), active))
+            else:
+                stack.append((int(self._node_offset[node]), active))
+                stack.append((node + 1, active))
+        return t_best, prim_best
+
+    @staticmethod
+    def _single_leaf(leaf_fn: PacketLeafFunction, ids: np.ndarray, ray: int, tmax: float) -> (float, int):
+        t, prim = leaf_fn(ids, np.array([ray]), np.array([tmax]))
+        return float(t[0]), int(prim[0])
+
+    def any_hit(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        leaf_fn: LeafFunction,
+    ) -> bool:
+        """True as soon as any primitive is hit in [tmin, tmax)"""
+        t, _ = self._traverse(origin, direction, tmin, tmax, leaf_fn, True)
+        return t < np.inf
+
+
+def occlusion_leaf(objects: list, rays: RayBatch) -> PacketLeafFunction:
+    """Packet leaf function of an any hit traversal over objects with occluded_batch.
+
+    Each object of a leaf tests the rays of the packet not yet occluded in
+    one occluded_batch call, a hit is reported at tmin.
+    """
+
+    def leaf_fn(ids: np.ndarray, ray_ids: np.ndarray, tmax: np.ndarray) -> (np.ndarray, np.ndarray):
+        hit = np.full(ray_ids.shape[0], -1, dtype=np.int64)
+        for i in ids:
+            pending = np.flatnonzero(hit < 0)
+            if pending.shape[0] == 0:
+                break
+            sub = ray_ids[pending]
+            batch = RayBatch._from_arrays(rays.origins[sub], rays.directions[sub], rays.tmin[sub], tmax[pending])
+            hit[pending[objects[i].occluded_batch(batch)]] = i
+        return np.where(hit >= 0, rays.tmin[ray_ids], np.inf), hit
+
+    return leaf_fn
+
+
+class BVHAggregate:
+    """A BVH over a list of primitives, answering closest and any hit queries"""
+
+    def __init__(self, primitives: "list[Primitive]", max_leaf_size: int = 4):
+        if validation.CHECKED and not all(isinstance(p, Primitive) for p in primitives):
+            raise TypeError("a list of Primitive must be provided")
+        self._primitives = list(primitives)
+        self._max_leaf_size = max_leaf_size
+        self.rebuild()
+
+    @classmethod
+    def from_bvh(cls, primitives: "list[Primitive]", bvh: BVH, max_leaf_size: int = 4) -> "BVHAggregate":
+        """wraps a hierarchy built before over the primitives, without rebuilding it"""
+        if validation.CHECKED and not all(isinstance(p, Primitive) for p in primitives):
+            raise TypeError("a list of Primitive must be provided")
+        if bvh.prim_indices.shape[0] != len(primitives):
+            raise ValueError("the hierarchy must hold every primitive once")
+        aggregate = cls.__new__(cls)
+        aggregate._primitives = list(primitives)
+        aggregate._max_leaf_size = max_leaf_size
+        aggregate._bvh = bvh
+        return aggregate
+
+    @property
+    def primitives(self) -> "list[Primitive]":
+        return self._primitives
+
+    @property
+    def bvh(self) -> BVH:
+        return self._bvh
+
+    @property
+    def max_leaf_size(self) -> int:
+        return self._max_leaf_size
+
+    def _bounds(self) -> BoxArray:
+        """world bounds of the primitives, unbounded primitives cannot be put into a BVH"""
+        bounds = primitive_bounds(self._primitives)
+        finite = np.all(np.isfinite(bounds.mins) & np.isfinite(bounds.maxs), axis=1)
+        if not np.all(finite):
+            raise ValueError(
+                f"primitive {int(np.argmin(finite))} is unbounded, use a Scene to mix it with bounded primitives"
+            )
+        return bounds
+
+    def rebuild(self):
+        """builds the hierarchy from scratch over the current world bounds"""
+        bounds = self._bounds()
+        self._bvh = BVH.build(
+            bounds.mins, bounds.maxs, bounds.centroids(), max_leaf_size=self._max_leaf_size
+        )
+
+    def refit(self, max_cost_growth: float = None) -> float:
+        """Refits the hierarchy to the moved primitives, returns the SAH cost growth.
+
+        With max_cost_growth the hierarchy is rebuilt once the growth exceeds
+        it, the growth before the rebuild is returned.
+        """
+        bounds = self._bounds()
+        growth = self._bvh.refit(bounds.mins, bounds.maxs)
+        if max_cost_growth is not None and growth > max_cost_growth:
+            self.rebuild()
+        return growth
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        """closest hit of the ray, record is filled only on a hit"""
+        if validation.CHECKED and (
+            not isinstance(ray, Ray) or not isinstance(record, Intersection)
+        ):
+            raise TypeError("invalid parameters, should be (Ray, Intersection)")
+        # every primitive sits in one leaf, its record is the one of the winning prim id
+        records = {}
+
+        def leaf_fn(prim_ids: np.ndarray, tmax: float) -> (float, int):
+            t_best, prim_best = np.inf, -1
+            for i in prim_ids:
+                rec = Intersection()
+                if self._primitives[i].intersect(Ray(origin=ray.origin, direction=ray.direction, tmin=ray.tmin, tmax=tmax), rec):
+                    if rec.t_hit < t_best:
+                        t_best, prim_best = rec.t_hit, int(i)
+                        records[prim_best] = rec
+            return t_best, prim_best
+
+        t, prim = self._bvh.closest_hit(
+            ray.origin.data, ray.direction.data, ray.tmin, ray.tmax, leaf_fn
+        )
+        if prim < 0:
+            return False
+        hit = records[prim]
+        record.t_hit = hit.t_hit
+        record.hit_point = hit.hit_point
+        record.normal = hit.normal
+        record.wo = hit.wo
+        return True
+
+    def occluded(self, ray: Ray) -> bool:
+        """True if any primitive is hit in [tmin, tmax), traversal stops at the first hit"""
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+
+        def leaf_fn(prim_ids: np.ndarray, tmax: float) -> (float, int):
+            shadow = Ray(origin=ray.origin, direction=ray.direction, tmin=ray.tmin, tmax=tmax)
+            for i in prim_ids:
+                if self._primitives[i].occluded(shadow):
+                    return ray.tmin, int(i)
+            return np.inf, -1
+
+        return self._bvh.any_hit(ray.origin.data, ray.direction.data, ray.tmin, ray.tmax, leaf_fn)
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        """occluded for N rays as a bool array"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        _, prim = self._bvh.any_hit_packet(
+            rays.origins, rays.directions, rays.tmin, rays.tmax, occlusion_leaf(self._primitives, rays)
+        )
+        return prim >= 0
+
+    def any_hit(self, ray: Ray) -> bool:
+        """same as occluded"""
+        return self.occluded(ray)
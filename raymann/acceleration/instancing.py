@@ -0,0 +1,170 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import transform_bounds
+from raymann.acceleration.bvh import BVH, BVHAggregate, occlusion_leaf
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.transformation.transformer import Transformer
+
+
+class Instance:
+    """A placement of shared geometry: a bottom level hierarchy and a Transformer.
+
+    The geometry is referenced, not copied, so any number of instances cost
+    one Transformer each.
+    """
+
+    def __init__(self, geometry: BVHAggregate, transf: Transformer = None):
+        if transf is None:
+            transf = Transformer()
+        if validation.CHECKED and not (
+            isinstance(geometry, BVHAggregate) and isinstance(transf, Transformer)
+        ):
+            raise TypeError("invalid input for instance, should be (BVHAggregate, Transformer)")
+        self._geometry = geometry
+        self._transformation = transf
+
+    @property
+    def geometry(self) -> BVHAggregate:
+        return self._geometry
+
+    @property
+    def transformation(self) -> Transformer:
+        """instance to world Transformer, setting it moves the instance"""
+        return self._transformation
+
+    @transformation.setter
+    def transformation(self, transformation: Transformer):
+        if validation.CHECKED and not isinstance(transformation, Transformer):
+            raise TypeError("expects a Transformer object")
+        self._transformation = transformation
+
+    def world_bounds(self) -> (np.ndarray, np.ndarray):
+        """world space min and max corner of the instanced geometry"""
+        lo, hi = self._geometry.bvh.bounds()
+        wmin, wmax = transform_bounds(self._transformation.matrix, lo[np.newaxis], hi[np.newaxis])
+        return wmin[0], wmax[0]
+
+    def _local_ray(self, ray: Ray, tmax: float) -> Ray:
+        """the ray in instance space, t values are the same in both spaces"""
+        world = Ray(origin=ray.origin, direction=ray.direction, tmin=ray.tmin, tmax=tmax)
+        return self._transformation.world_to_obj_space(world)
+
+    def intersect(self, ray: Ray, record: Intersection, tmax: float = None) -> bool:
+        """closest hit with the instanced geometry, record is in world space"""
+        local = Intersection()
+        if not self._geometry.intersect(self._local_ray(ray, ray.tmax if tmax is None else tmax), local):
+            return False
+        record.t_hit = local.t_hit
+        record.hit_point = self._transformation.obj_to_world_space(local.hit_point)
+        record.normal = self._transformation.obj_to_world_space(local.normal).normalized()
+        record.wo = -ray.direction
+        return True
+
+    def occluded(self, ray: Ray, tmax: float = None) -> bool:
+        return self._geometry.occluded(self._local_ray(ray, ray.tmax if tmax is None else tmax))
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        """occlusion of N world space rays by the instanced geometry"""
+        return self._geometry.occluded_batch(self._transformation.world_to_obj_space_batch(rays))
+
+
+class TwoLevelBVH:
+    """Top level hierarchy over instances of shared bottom level hierarchies.
+
+    Rays are tested against the instance bounds in world space and moved
+    into instance space on entry to a bottom level hierarchy.
+    """
+
+    def __init__(self, instances: "list[Instance]", max_leaf_size: int = 2):
+        if validation.CHECKED and not all(isinstance(i, Instance) for i in instances):
+            raise TypeError("a list of Instance must be provided")
+        self._instances = list(instances)
+        self._max_leaf_size = max_leaf_size
+        self.rebuild()
+
+    @property
+    def instances(self) -> "list[Instance]":
+        return self._instances
+
+    @property
+    def bvh(self) -> BVH:
+        return self._bvh
+
+    def _instance_bounds(self) -> (np.ndarray, np.ndarray):
+        n = len(self._instances)
+        mins = np.empty((n, 3))
+        maxs = np.empty((n, 3))
+        for i, instance in enumerate(self._instances):
+            mins[i], maxs[i] = instance.world_bounds()
+        return mins, maxs
+
+    def rebuild(self):
+        """builds the top level from scratch, the bottom levels are kept"""
+        mins, maxs = self._instance_bounds()
+        self._bvh = BVH.build(mins, maxs, max_leaf_size=self._max_leaf_size)
+
+    def refit(self) -> float:
+        """refits the top level to moved instances, returns the SAH cost growth"""
+        return self._bvh.refit(*self._instance_bounds())
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        """closest hit over all instances, record is filled only on a hit"""
+        if validation.CHECKED and (
+            not isinstance(ray, Ray) or not isinstance(record, Intersection)
+        ):
+            raise TypeError("invalid parameters, should be (Ray, Intersection)")
+        best = Intersection()
+
+        def leaf_fn(ids: np.ndarray, tmax: float) -> (float, int):
+            t_best, hit = np.inf, -1
+            for i in ids:
+                rec = Intersection()
+                if self._instances[i].intersect(ray, rec, tmax) and rec.t_hit < t_best:
+                    t_best, hit = rec.t_hit, int(i)
+                    best.t_hit = rec.t_hit
+                    best.hit_point = rec.hit_point
+                    best.normal = rec.normal
+                    best.wo = rec.wo
+                    tmax = rec.t_hit
+            return t_best, hit
+
+        _, hit = self._bvh.closest_hit(ray.origin.data, ray.direction.data, ray.tmin, ray.tmax, leaf_fn)
+        if hit < 0:
+            return False
+        record.t_hit = best.t_hit
+        record.hit_point = best.hit_point
+        record.normal = best.normal
+        record.wo = best.wo
+        return True
+
+    def occluded(self, ray: Ray) -> bool:
+        """True if any instance is hit in [tmin, tmax), traversal stops at the first hit"""
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+
+        def leaf_fn(ids: np.ndarray, tmax: float) -> (float, int):
+            for i in ids:
+                if self._instances[i].occluded(ray, tmax):
+                    return ray.tmin, int(i)
+            return np.inf, -1
+
+        return self._bvh.any_hit(ray.origin.data, ray.direction.data, ray.tmin, ray.tmax, leaf_fn)
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        """occluded for N rays as a bool array"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        _, hit = self._bvh.any_hit_packet(
+            rays.origins, rays.directions, rays.tmin, rays.tmax, occlusion_leaf(self._instances, rays)
+        )
+        return hit >= 0
+
+    def any_hit(self, ray: Ray) -> bool:
+        """same as occluded"""
+        return self.occluded(ray)
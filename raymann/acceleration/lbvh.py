@@ -0,0 +1,272 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+"""Linear BVH construction from Morton codes.
+
+Primitive centroids are quantized on a grid, interleaved into 30 or 63 bit
+Morton codes and radix sorted. The hierarchy is then built one level at a
+time: every range of sorted codes is split where its highest differing bit
+flips, which needs one searchsorted for the whole level. The result uses the
+flat depth-first node layout of BVH.
+"""
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+
+_U = np.uint64
+
+
+def _expand_bits_10(x: np.ndarray) -> np.ndarray:
+    """spreads the low 10 bits of x so that two zero bits follow every bit"""
+    x = x & _U(0x3FF)
+    x = (x | (x << _U(16))) & _U(0x30000FF)
+    x = (x | (x << _U(8))) & _U(0x300F00F)
+    x = (x | (x << _U(4))) & _U(0x30C30C3)
+    x = (x | (x << _U(2))) & _U(0x9249249)
+    return x
+
+
+def _expand_bits_21(x: np.ndarray) -> np.ndarray:
+    """spreads the low 21 bits of x so that two zero bits follow every bit"""
+    x = x & _U(0x1FFFFF)
+    x = (x | (x << _U(32))) & _U(0x1F00000000FFFF)
+    x = (x | (x << _U(16))) & _U(0x1F0000FF0000FF)
+    x = (x | (x << _U(8))) & _U(0x100F00F00F00F00F)
+    x = (x | (x << _U(4))) & _U(0x10C30C30C30C30C3)
+    x = (x | (x << _U(2))) & _U(0x1249249249249249)
+    return x
+
+
+def morton_codes(centroids: np.ndarray, bits: int = 30) -> np.ndarray:
+    """Morton codes of (N, 3) points quantized on their bounding box.
+
+    bits is 30 (10 bits per axis) or 63 (21 bits per axis). Bit 3i of a code
+    comes from x, 3i + 1 from y and 3i + 2 from z.
+    """
+    if bits not in (30, 63):
+        raise ValueError("bits must be 30 or 63")
+    centroids = np.asarray(centroids, dtype=np.float64)
+    if centroids.ndim != 2 or centroids.shape[1] != 3:
+        raise ValueError("centroids must have shape (N, 3)")
+    if centroids.shape[0] == 0:
+        return np.zeros(0, dtype=np.uint64)
+    axis_bits = bits // 3
+    cells = float((1 << axis_bits) - 1)
+    cmin = centroids.min(axis=0)
+    extent = centroids.max(axis=0) - cmin
+    scale = np.divide(cells, extent, out=np.zeros(3), where=extent > 0.0)
+    q = np.clip((centroids - cmin) * scale, 0.0, cells).astype(np.uint64)
+    expand = _expand_bits_10 if bits == 30 else _expand_bits_21
+    return expand(q[:, 0]) | (expand(q[:, 1]) << _U(1)) | (expand(q[:, 2]) << _U(2))
+
+
+def radix_sort(codes: np.ndarray, bits: int = 64) -> np.ndarray:
+    """Stable permutation sorting unsigned codes, LSD radix sort on 16 bit digits.
+
+    Every pass is a stable argsort of uint16 digits, which numpy runs as a
+    counting radix sort.
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    order = np.arange(codes.shape[0], dtype=np.int64)
+    for shift in range(0, bits, 16):
+        digits = ((codes[order] >> _U(shift)) & _U(0xFFFF)).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+    return order
+
+
+def _highest_bit(x: np.ndarray) -> np.ndarray:
+    """index of the highest set bit of every nonzero uint64, by binary search"""
+    h = np.zeros(x.shape, dtype=np.int64)
+    for s in (32, 16, 8, 4, 2, 1):
+        upper = x >> _U(s)
+        found = upper != 0
+        h += s * found
+        x = np.where(found, upper, x)
+    return h
+
+
+def _build_forest(
+    codes: np.ndarray, starts: np.ndarray, ends: np.ndarray, max_leaf_size: int
+) -> dict:
+    """Level by level build of one tree per [start, end) range of sorted codes.
+
+    Nodes are numbered breadth first, left and right are -1 for leaves.
+    levels holds the first node id of every level.
+    """
+    start_parts, end_parts, left_parts, right_parts, axis_parts = [], [], [], [], []
+    levels = []
+    s, e = starts, ends
+    next_id = 0
+    while s.shape[0]:
+        k = s.shape[0]
+        levels.append(next_id)
+        next_id += k
+        left = np.full(k, -1, dtype=np.int64)
+        right = np.full(k, -1, dtype=np.int64)
+        axis = np.zeros(k, dtype=np.int8)
+        split = np.flatnonzero(e - s > max_leaf_size)
+        ss, ee = s[split], e[split]
+        first = codes[ss]
+        diff = first ^ codes[ee - 1]
+        same = diff == 0
+        h = _highest_bit(diff)
+        # first code of the range with bit h set, the prefix above h is shared
+        target = ((first >> h.astype(np.uint64)) | _U(1)) << h.astype(np.uint64)
+        mid = np.searchsorted(codes, target, side="left")
+        # equal codes cannot be told apart, those ranges are halved
+        mid = np.where(same, (ss + ee) // 2, mid)
+        axis[split] = np.where(same, 0, h % 3)
+        children = next_id + 2 * np.arange(split.shape[0])
+        left[split] = children
+        right[split] = children + 1
+        start_parts.append(s)
+        end_parts.append(e)
+        left_parts.append(left)
+        right_parts.append(right)
+        axis_parts.append(axis)
+        s = np.column_stack((ss, mid)).ravel()
+        e = np.column_stack((mid, ee)).ravel()
+    return {
+        "start": np.concatenate(start_parts),
+        "end": np.concatenate(end_parts),
+        "left": np.concatenate(left_parts),
+        "right": np.concatenate(right_parts),
+        "axis": np.concatenate(axis_parts),
+        "levels": levels + [next_id],
+        "n_roots": starts.shape[0],
+    }
+
+
+def _forest_to_arrays(forest: dict, mins: np.ndarray, maxs: np.ndarray) -> dict:
+    """Bottom-up bounds and depth-first positions of the breadth first forest.
+
+    mins and maxs are the primitive bounds in sorted order. The trees are laid
+    out one after another, root_pos and root_size locate each of them.
+    """
+    start, end, left, right = forest["start"], forest["end"], forest["left"], forest["right"]
+    levels = forest["levels"]
+    n = start.shape[0]
+    leaf = left < 0
+    size = np.ones(n, dtype=np.int64)
+    node_min = np.empty((n, 3))
+    node_max = np.empty((n, 3))
+    leaf_ids = np.flatnonzero(leaf)
+    leaf_ids = leaf_ids[np.argsort(start[leaf_ids], kind="stable")]
+    node_min[leaf_ids] = np.minimum.reduceat(mins, start[leaf_ids], axis=0)
+    node_max[leaf_ids] = np.maximum.reduceat(maxs, start[leaf_ids], axis=0)
+    for lo, hi in zip(reversed(levels[:-1]), reversed(levels[1:])):
+        ids = np.arange(lo, hi)
+        ids = ids[~leaf[ids]]
+        size[ids] = 1 + size[left[ids]] + size[right[ids]]
+        node_min[ids] = np.minimum(node_min[left[ids]], node_min[right[ids]])
+        node_max[ids] = np.maximum(node_max[left[ids]], node_max[right[ids]])
+
+    n_roots = forest["n_roots"]
+    pos = np.zeros(n, dtype=np.int64)
+    root_size = size[:n_roots]
+    pos[:n_roots] = np.cumsum(root_size) - root_size
+    for lo, hi in zip(levels[:-1], levels[1:]):
+        ids = np.arange(lo, hi)
+        ids = ids[~leaf[ids]]
+        pos[left[ids]] = pos[ids] + 1
+        pos[right[ids]] = pos[ids] + 1 + size[left[ids]]
+
+    out_min = np.empty((n, 3))
+    out_max = np.empty((n, 3))
+    out_offset = np.empty(n, dtype=np.int64)
+    out_count = np.zeros(n, dtype=np.int64)
+    out_axis = np.empty(n, dtype=np.int8)
+    out_min[pos] = node_min
+    out_max[pos] = node_max
+    out_axis[pos] = forest["axis"]
+    out_offset[pos[leaf]] = start[leaf]
+    out_count[pos[leaf]] = end[leaf] - start[leaf]
+    out_offset[pos[~leaf]] = pos[right[~leaf]]
+    return {
+        "node_min": out_min,
+        "node_max": out_max,
+        "node_offset": out_offset,
+        "node_count": out_count,
+        "node_axis": out_axis,
+        "root_pos": pos[:n_roots],
+        "root_size": root_size,
+    }
+
+
+def build_lbvh(
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    centroids: np.ndarray = None,
+    bits: int = 30,
+    max_leaf_size: int = 4,
+    optimize_treelets: bool = False,
+    treelet_bits: int = 12,
+) -> BVH:
+    """Builds a BVH over N primitive boxes from the Morton codes of their centroids.
+
+    With optimize_treelets the primitives are grouped into treelets by the
+    top treelet_bits of their codes. Each treelet is built as an LBVH and the
+    levels above the treelets are rebuilt with the SAH builder, as in HLBVH.
+    """
+    mins = np.ascontiguousarray(mins, dtype=np.float64)
+    maxs = np.ascontiguousarray(maxs, dtype=np.float64)
+    if mins.ndim != 2 or mins.shape[1] != 3 or maxs.shape != mins.shape:
+        raise ValueError("mins and maxs must have shape (N, 3)")
+    if centroids is None:
+        centroids = 0.5 * (mins + maxs)
+    if not isinstance(max_leaf_size, int) or max_leaf_size < 1:
+        raise ValueError("max_leaf_size must be a positive int")
+    if not isinstance(treelet_bits, int) or not 0 < treelet_bits <= bits:
+        raise ValueError("treelet_bits must be an int in (0, bits]")
+    n = mins.shape[0]
+    if n == 0:
+        return BVH.build(mins, maxs)
+
+    codes = morton_codes(centroids, bits)
+    order = radix_sort(codes, bits)
+    codes = codes[order]
+    sorted_min = mins[order]
+    sorted_max = maxs[order]
+
+    if optimize_treelets:
+        prefix = codes >> _U(bits - treelet_bits)
+        bounds = np.flatnonzero(prefix[1:] != prefix[:-1]) + 1
+        starts = np.concatenate(([0], bounds)).astype(np.int64)
+        ends = np.concatenate((bounds, [n])).astype(np.int64)
+    else:
+        starts = np.zeros(1, dtype=np.int64)
+        ends = np.full(1, n, dtype=np.int64)
+
+    forest = _build_forest(codes, starts, ends, max_leaf_size)
+    arrays = _forest_to_arrays(forest, sorted_min, sorted_max)
+    if starts.shape[0] == 1:
+        return BVH(
+            arrays["node_min"],
+            arrays["node_max"],
+            arrays["node_offset"],
+            arrays["node_count"],
+            arrays["node_axis"],
+            order,
+        )
+
+    subtrees = []
+    for root, size, start, end in zip(arrays["root_pos"], arrays["root_size"], starts, ends):
+        nodes = slice(root, root + size)
+        offset = arrays["node_offset"][nodes].copy()
+        leaf = arrays["node_count"][nodes] > 0
+        offset[leaf] -= start
+        offset[~leaf] -= root
+        subtrees.append(
+            BVH(
+                arrays["node_min"][nodes],
+                arrays["node_max"][nodes],
+                offset,
+                arrays["node_count"][nodes],
+                arrays["node_axis"][nodes],
+                order[start:end],
+            )
+        )
+    root_min = arrays["node_min"][arrays["root_pos"]]
+    root_max = arrays["node_max"][arrays["root_pos"]]
+    top = BVH.build(root_min, root_max, max_leaf_size=1)
+    return BVH.stitch(top, subtrees)
@@ -0,0 +1,197 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+"""Multi process SAH construction of a BVH.
+
+The top levels are split in the calling process with the same binned SAH as
+BVH.build until every range holds at most subtree_size primitives. The
+ranges are built in a process pool that reads the primitive bounds from
+shared memory, and the subtrees are stitched under the top levels. The
+partition does not depend on the number of workers and results are stitched
+in submission order, so the hierarchy is the same for any worker count and
+equal to the one of BVH.build.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+
+
+def _split_top(
+    bounds: np.ndarray,
+    subtree_size: int,
+    max_leaf_size: int,
+    n_bins: int,
+    traversal_cost: float,
+    intersection_cost: float,
+) -> (BVH, np.ndarray, list):
+    """SAH splits of the ranges larger than subtree_size.
+
+    bounds is the (3, N, 3) stack of mins, maxs and centroids. Returns the
+    top hierarchy, whose leaves hold the index of one subtree, the primitive
+    order and the [start, end) range of every subtree in it.
+    """
+    mins, maxs, centroids = bounds
+    n = mins.shape[0]
+    node_min, node_max, node_offset, node_count, node_axis = [], [], [], [], []
+    prims = np.arange(n, dtype=np.int64)
+    ranges = []
+    stack = [(0, n, -1)]
+    while stack:
+        start, end, parent = stack.pop()
+        node = len(node_offset)
+        if parent >= 0:
+            node_offset[parent] = node
+        ids = prims[start:end]
+        box_min = mins[ids].min(axis=0)
+        box_max = maxs[ids].max(axis=0)
+        node_min.append(box_min)
+        node_max.append(box_max)
+        split = None
+        if end - start > subtree_size:
+            split = BVH._find_split(
+                mins[ids],
+                maxs[ids],
+                centroids[ids],
+                box_min,
+                box_max,
+                max_leaf_size,
+                n_bins,
+                traversal_cost,
+                intersection_cost,
+            )
+        if split is None:
+            node_offset.append(len(ranges))
+            node_count.append(1)
+            node_axis.append(0)
+            ranges.append((start, end))
+            continue
+        axis, left = split
+        prims[start:end] = np.concatenate((ids[left], ids[~left]))
+        mid = start + int(np.count_nonzero(left))
+        node_offset.append(0)
+        node_count.append(0)
+        node_axis.append(axis)
+        stack.append((mid, end, node))
+        stack.append((start, mid, -1))
+
+    top = BVH(
+        np.array(node_min),
+        np.array(node_max),
+        np.array(node_offset),
+        np.array(node_count),
+        np.array(node_axis),
+        np.arange(len(ranges)),
+    )
+    return top, prims, ranges
+
+
+def _build_range(bounds_buf, prims_buf, n: int, start: int, end: int, kwargs: dict) -> tuple:
+    bounds = np.ndarray((3, n, 3), dtype=np.float64, buffer=bounds_buf)
+    ids = np.ndarray((n,), dtype=np.int64, buffer=prims_buf)[start:end].copy()
+    sub = BVH.build(bounds[0, ids], bounds[1, ids], bounds[2, ids], **kwargs)
+    return (
+        sub.node_min,
+        sub.node_max,
+        sub.node_offset,
+        sub.node_count,
+        sub.node_axis,
+        ids[sub.prim_indices],
+    )
+
+
+def _build_subtree(task: tuple) -> tuple:
+    """builds one range in a worker, the inputs are read from shared memory"""
+    bounds_name, prims_name, n, start, end, kwargs = task
+    bounds_shm = SharedMemory(name=bounds_name)
+    prims_shm = SharedMemory(name=prims_name)
+    try:
+        return _build_range(bounds_shm.buf, prims_shm.buf, n, start, end, kwargs)
+    finally:
+        bounds_shm.close()
+        prims_shm.close()
+
+
+def _build_shared(
+    bounds_shm: SharedMemory,
+    prims_shm: SharedMemory,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    centroids: np.ndarray,
+    workers: int,
+    subtree_size: int,
+    kwargs: dict,
+) -> (BVH, list):
+    n = mins.shape[0]
+    bounds = np.ndarray((3, n, 3), dtype=np.float64, buffer=bounds_shm.buf)
+    bounds[0] = mins
+    bounds[1] = maxs
+    bounds[2] = centroids
+    top, order, ranges = _split_top(bounds, subtree_size, **kwargs)
+    np.ndarray((n,), dtype=np.int64, buffer=prims_shm.buf)[:] = order
+    tasks = [(bounds_shm.name, prims_shm.name, n, s, e, kwargs) for s, e in ranges]
+    if workers == 1 or len(tasks) == 1:
+        return top, [_build_subtree(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return top, list(pool.map(_build_subtree, tasks))
+
+
+def build_parallel(
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    centroids: np.ndarray = None,
+    workers: int = None,
+    subtree_size: int = None,
+    max_leaf_size: int = 4,
+    n_bins: int = 16,
+    traversal_cost: float = 1.0,
+    intersection_cost: float = 1.0,
+) -> BVH:
+    """Builds the SAH hierarchy of BVH.build over N primitive boxes on several cores.
+
+    workers defaults to the number of CPUs, with one worker everything runs
+    in the calling process. subtree_size is the largest range handed to a
+    worker, by default N / 64 but at least 4096 primitives.
+    """
+    mins = np.ascontiguousarray(mins, dtype=np.float64)
+    maxs = np.ascontiguousarray(maxs, dtype=np.float64)
+    if mins.ndim != 2 or mins.shape[1] != 3 or maxs.shape != mins.shape:
+        raise ValueError("mins and maxs must have shape (N, 3)")
+    if centroids is None:
+        centroids = 0.5 * (mins + maxs)
+    centroids = np.ascontiguousarray(centroids, dtype=np.float64)
+    if centroids.shape != mins.shape:
+        raise ValueError("centroids must have shape (N, 3)")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive int")
+    n = mins.shape[0]
+    if subtree_size is None:
+        subtree_size = max(4096, -(-n // 64))
+    if not isinstance(subtree_size, int) or subtree_size < 1:
+        raise ValueError("subtree_size must be a positive int")
+    kwargs = {
+        "max_leaf_size": max_leaf_size,
+        "n_bins": n_bins,
+        "traversal_cost": traversal_cost,
+        "intersection_cost": intersection_cost,
+    }
+    if n == 0:
+        return BVH.build(mins, maxs, centroids, **kwargs)
+
+    bounds_shm = SharedMemory(create=True, size=3 * n * 3 * 8)
+    prims_shm = SharedMemory(create=True, size=n * 8)
+    try:
+        top, results = _build_shared(
+            bounds_shm, prims_shm, mins, maxs, centroids, workers, subtree_size, kwargs
+        )
+    finally:
+        bounds_shm.close()
+        bounds_shm.unlink()
+        prims_shm.close()
+        prims_shm.unlink()
+    return BVH.stitch(top, [BVH(*arrays) for arrays in results])
@@ -4,8 +4,8 @@
 from raymann.math_tools.ray import Ray
 import numpy as np
 from raymann.math_tools.matrix4d import Matrix4D
-from raymann.math_tools.vector4d import Vector4D
 from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray_batch import RayBatch
 
 
 class Camera:
@@ -23,11 +23,15 @@ class Camera:
             raise ValueError(
                 "invalid value for horizontal, vertical or field of view given"
             )
+        self._hsize = hsize
+        self._vsize = vsize
         self._fov = fov
         half_view = np.tan(self._fov / 2.0)
         aspect = hsize / vsize
         self._trans_matrix = trans_mat
         self._inv_trans_matrix = self._trans_matrix.inverse
+        # the eye sits at the camera space origin for every pixel
+        self._origin = (self._inv_trans_matrix * Point3D()).coordinates
         if aspect >= 1.0:
             self._half_height = half_view / aspect
             self._half_width = half_view
@@ -40,12 +44,84 @@ class Camera:
     def pixel_size(self) -> float:
         return self._pixel_size
 
+    @property
+    def hsize(self) -> int | float:
+        return self._hsize
+
+    @property
+    def vsize(self) -> int | float:
+        return self._vsize
+
     def get_ray(self, pixel_x: int | float, pixel_y: int | float) -> Ray:
         xoffset = (pixel_x + 0.5) * self._pixel_size
         yoffset = (pixel_y + 0.5) * self._pixel_size
         world_x = self._half_width - xoffset
         world_y = self._half_height - yoffset
         pixel = self._inv_trans_matrix * Point3D(world_x, world_y, -1)
-        o = self._inv_trans_matrix * Point3D()
+        o = Point3D(*self._origin)
         d = (pixel - o).normalized()
         return Ray(origin=o, direction=d)
+
+    def generate_rays(
+        self,
+        x0: int = 0,
+        y0: int = 0,
+        x1: int | None = None,
+        y1: int | None = None,
+        jitter: np.ndarray | None = None,
+    ) -> RayBatch:
+        """Generates the primary rays of the pixel rectangle [x0, x1) x [y0, y1).
+
+        The full frame is used by default. Rays are ordered row by row, so
+        ray i belongs to pixel (x0 + i % width, y0 + i // width). jitter holds
+        per-pixel sample offsets in [0, 1) with shape (height, width, 2) or
+        (height * width, 2); the pixel center (0.5, 0.5) is used without it.
+        """
+        x1 = int(np.ceil(self._hsize)) if x1 is None else x1
+        y1 = int(np.ceil(self._vsize)) if y1 is None else y1
+        if not all(isinstance(v, (int, np.integer)) for v in (x0, y0, x1, y1)):
+            raise TypeError("pixel rectangle bounds must be int")
+        if x0 < 0 or y0 < 0 or x1 <= x0 or y1 <= y0:
+            raise ValueError("invalid pixel rectangle")
+        width = x1 - x0
+        height = y1 - y0
+        n = width * height
+
+        px = np.tile(np.arange(x0, x1, dtype=np.float64), height)
+        py = np.repeat(np.arange(y0, y1, dtype=np.float64), width)
+        if jitter is None:
+            px += 0.5
+            py += 0.5
+        else:
+            jitter = np.asarray(jitter, dtype=np.float64)
+            if jitter.shape not in ((height, width, 2), (n, 2)):
+                raise ValueError("jitter must have shape (height, width, 2) or (N, 2)")
+            jitter = jitter.reshape(n, 2)
+            px += jitter[:, 0]
+            py += jitter[:, 1]
+
+        screen = np.empty((n, 3), dtype=np.float64)
+        screen[:, 0] = self._half_width - px * self._pixel_size
+        screen[:, 1] = self._half_height - py * self._pixel_size
+        screen[:, 2] = -1.0
+        directions = self._inv_trans_matrix.transform_points(screen, out=screen)
+        directions -= self._origin
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        origins = np.broadcast_to(self._origin, (n, 3))
+        return RayBatch._from_arrays(origins, directions, 0.001, np.inf)
+
+    def generate_tiles(self, tile_size: int = 8):
+        """Yields (x0, y0, RayBatch) for the tiles of the frame, row by row.
+
+        Rays of a tile are coherent, which packet traversal relies on. Tiles
+        at the right and bottom border are clipped to the frame.
+        """
+        if not isinstance(tile_size, int) or tile_size < 1:
+            raise ValueError("tile_size must be a positive int")
+        width = int(np.ceil(self._hsize))
+        height = int(np.ceil(self._vsize))
+        for y0 in range(0, height, tile_size):
+            for x0 in range(0, width, tile_size):
+                x1 = min(x0 + tile_size, width)
+                y1 = min(y0 + tile_size, height)
+                yield x0, y0, self.generate_rays(x0, y0, x1, y1)
@@ -3,6 +3,7 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.common import validation
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.vector3d import Vector3D
@@ -24,7 +25,7 @@ class Intersection:
 
     @hit_point.setter
     def hit_point(self, point):
-        if isinstance(point, Point3D):
+        if not validation.CHECKED or isinstance(point, Point3D):
             self._hit_point = point
         else:
             raise TypeError("point should be provided")
@@ -36,7 +37,7 @@ class Intersection:
 
     @normal.setter
     def normal(self, n):
-        if isinstance(n, Normal3D):
+        if not validation.CHECKED or isinstance(n, Normal3D):
             self._normal = n
         else:
             raise TypeError("normal should be provided")
@@ -48,7 +49,7 @@ class Intersection:
 
     @wo.setter
     def wo(self, v):
-        if isinstance(v, Vector3D):
+        if not validation.CHECKED or isinstance(v, Vector3D):
             self._wo = v
 
     @property
@@ -57,7 +58,7 @@ class Intersection:
 
     @surf_tangent.setter
     def surf_tangent(self, val:Vector3D):
-        if isinstance(val, Vector3D):
+        if not validation.CHECKED or isinstance(val, Vector3D):
             self._surf_tangent = val
         else:
             raise TypeError()
@@ -68,7 +69,7 @@ class Intersection:
 
     @surf_bitangent.setter
     def surf_bitangent(self, val: Vector3D):
-        if isinstance(val, Vector3D):
+        if not validation.CHECKED or isinstance(val, Vector3D):
             self._surf_bitangent = val
         else:
             raise TypeError()
@@ -79,7 +80,7 @@ class Intersection:
 
     @t_hit.setter
     def t_hit(self, val: (int, float)):
-        if isinstance(val, (int, float)):
+        if not validation.CHECKED or isinstance(val, (int, float)):
             self._hit_parameter = val
         else:
             raise TypeError("must be float or int")
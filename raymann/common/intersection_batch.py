@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.common.intersection import Intersection
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.vector3d import Vector3D
+
+
+class IntersectionBatch:
+    """The hit records of N rays as a structure of arrays.
+
+    Rays that miss have hit False and t_hit inf, their other rows are
+    left at zero. Points, normals and wo are in world coordinates.
+    prim_ids holds the index of the hit primitive inside its shape (0 for
+    single primitives, -1 for misses). barycentrics holds the (b1, b2)
+    weights of the second and third vertex for triangle hits.
+    """
+
+    def __init__(self, n: int):
+        if not isinstance(n, (int, np.integer)) or n < 0:
+            raise TypeError("the number of rays must be a non negative int")
+        self._hit = np.zeros(n, dtype=bool)
+        self._t_hit = np.full(n, np.inf)
+        self._hit_points = np.zeros((n, 3))
+        self._normals = np.zeros((n, 3))
+        self._wo = np.zeros((n, 3))
+        self._prim_ids = np.full(n, -1, dtype=np.int64)
+        self._barycentrics = np.zeros((n, 2))
+
+    @property
+    def hit(self) -> np.ndarray:
+        """(N,) mask of the rays that hit"""
+        return self._hit
+
+    @property
+    def t_hit(self) -> np.ndarray:
+        return self._t_hit
+
+    @property
+    def hit_points(self) -> np.ndarray:
+        return self._hit_points
+
+    @property
+    def normals(self) -> np.ndarray:
+        return self._normals
+
+    @property
+    def wo(self) -> np.ndarray:
+        return self._wo
+
+    @property
+    def prim_ids(self) -> np.ndarray:
+        return self._prim_ids
+
+    @property
+    def barycentrics(self) -> np.ndarray:
+        return self._barycentrics
+
+    def __len__(self) -> int:
+        return self._hit.shape[0]
+
+    def record(self, i: int) -> Intersection:
+        """returns the hit record of the i-th ray as an Intersection"""
+        rec = Intersection()
+        rec.t_hit = float(self._t_hit[i])
+        rec.hit_point = Point3D(*self._hit_points[i])
+        rec.normal = Normal3D(*self._normals[i])
+        rec.wo = Vector3D(*self._wo[i])
+        return rec
+
+    def update_closest(self, other: "IntersectionBatch") -> np.ndarray:
+        """takes over the rows of other that are closer, returns their mask"""
+        if not isinstance(other, IntersectionBatch) or len(other) != len(self):
+            raise TypeError("IntersectionBatch of the same size must be provided")
+        closer = other._hit & (other._t_hit < self._t_hit)
+        self._hit |= closer
+        self._t_hit[closer] = other._t_hit[closer]
+        self._hit_points[closer] = other._hit_points[closer]
+        self._normals[closer] = other._normals[closer]
+        self._wo[closer] = other._wo[closer]
+        self._prim_ids[closer] = other._prim_ids[closer]
+        self._barycentrics[closer] = other._barycentrics[closer]
+        return closer
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+"""Global switch between checked and unchecked mode.
+
+In checked mode (the default) constructors, setters and operators validate
+their arguments and raise TypeError on bad input. Unchecked mode skips the
+validation for values that are known to be produced internally, the results
+are identical in both modes. Modules read the flag as validation.CHECKED so
+that the switch is seen everywhere.
+"""
+from contextlib import contextmanager
+
+CHECKED = True
+
+
+def is_checked() -> bool:
+    return CHECKED
+
+
+def set_checked(checked: bool):
+    global CHECKED
+    if not isinstance(checked, bool):
+        raise TypeError("checked must be bool")
+    CHECKED = checked
+
+
+@contextmanager
+def unchecked():
+    """runs the enclosed block in unchecked mode"""
+    previous = CHECKED
+    set_checked(False)
+    try:
+        yield
+    finally:
+        set_checked(previous)
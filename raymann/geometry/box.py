@@ -0,0 +1,75 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox
+from raymann.common import validation
+from raymann.geometry.primitive import AnalyticPrimitive
+from raymann.math_tools.point3d import Point3D
+from raymann.transformation.transformer import Transformer
+
+
+class Box(AnalyticPrimitive):
+    """Axis aligned box between min_point and max_point in object space, the unit cube [-1, 1] by default"""
+
+    def __init__(
+        self,
+        transf: Transformer = Transformer(),
+        min_point: Point3D = Point3D(-1.0, -1.0, -1.0),
+        max_point: Point3D = Point3D(1.0, 1.0, 1.0),
+    ):
+        if validation.CHECKED and not (isinstance(min_point, Point3D) and isinstance(max_point, Point3D)):
+            raise TypeError("invalid input for box, should be (Point3D, Point3D)")
+        if np.any(min_point.data > max_point.data):
+            raise ValueError("min_point must not exceed max_point")
+        super().__init__(transf)
+        self._bbox = BoundingBox(min_point, max_point)
+
+    @property
+    def min_point(self) -> Point3D:
+        return self._bbox.min_point
+
+    @property
+    def max_point(self) -> Point3D:
+        return self._bbox.max_point
+
+    def _hit_params(
+        self, origins: np.ndarray, directions: np.ndarray, tmin: np.ndarray, tmax: np.ndarray
+    ) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_d = 1.0 / directions
+            t0 = (self._bbox.min_point.data - origins) * inv_d
+            t1 = (self._bbox.max_point.data - origins) * inv_d
+        # a ray lying in a face plane gives nan and is inside that slab for all t
+        near = np.minimum(t0, t1)
+        far = np.maximum(t0, t1)
+        tnear = np.where(np.isnan(near), -np.inf, near).max(axis=1)
+        tfar = np.where(np.isnan(far), np.inf, far).min(axis=1)
+        inside = tnear <= tfar
+        t = np.where(inside & (tmin <= tnear) & (tnear < tmax), tnear, np.inf)
+        return np.where(np.isinf(t) & inside & (tmin <= tfar) & (tfar < tmax), tfar, t)
+
+    def _object_normals(self, points: np.ndarray) -> np.ndarray:
+        """the face normal of the axis along which the point is farthest out"""
+        lo, hi = self._bbox.min_point.data, self._bbox.max_point.data
+        center = 0.5 * (lo + hi)
+        half = 0.5 * (hi - lo)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(half > 0.0, np.abs(points - center) / half, np.inf)
+        axis = np.argmax(ratio, axis=1)
+        rows = np.arange(points.shape[0])
+        normals = np.zeros_like(points)
+        normals[rows, axis] = np.where(points[rows, axis] < center[axis], -1.0, 1.0)
+        return normals
+
+    def _params(self) -> np.ndarray:
+        return np.concatenate((self._bbox.min_point.data, self._bbox.max_point.data))
+
+    @classmethod
+    def _from_params(cls, transformation: Transformer, params: np.ndarray) -> "Box":
+        return cls(transformation, Point3D(*params[:3]), Point3D(*params[3:]))
+
+    def surface_area(self) -> float:
+        ex, ey, ez = self._bbox.max_point.data - self._bbox.min_point.data
+        return float(2.0 * (ex * ey + ey * ez + ez * ex))
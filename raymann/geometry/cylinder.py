@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox
+from raymann.common import validation
+from raymann.geometry.primitive import AnalyticPrimitive
+from raymann.math_tools.point3d import Point3D
+from raymann.transformation.transformer import Transformer
+
+
+class Cylinder(AnalyticPrimitive):
+    """Finite cylinder around the object space z axis between z_min and z_max.
+
+    With capped the end disks close it, otherwise it is an open tube.
+    """
+
+    def __init__(
+        self,
+        transf: Transformer = Transformer(),
+        radius: int | float = 1.0,
+        z_min: int | float = -1.0,
+        z_max: int | float = 1.0,
+        capped: bool = True,
+    ):
+        if validation.CHECKED and not all(isinstance(x, (int, float)) for x in (radius, z_min, z_max)):
+            raise TypeError("invalid input for cylinder, should be (int|float, int|float, int|float)")
+        if validation.CHECKED and not isinstance(capped, bool):
+            raise TypeError("capped must be a bool")
+        if radius <= 0.0 or z_min >= z_max:
+            raise ValueError("radius must be positive and z_min must be below z_max")
+        super().__init__(transf)
+        self._radius = radius
+        self._z_min = z_min
+        self._z_max = z_max
+        self._capped = capped
+        self._bbox = BoundingBox(Point3D(-radius, -radius, z_min), Point3D(radius, radius, z_max))
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @property
+    def z_min(self) -> float:
+        return self._z_min
+
+    @property
+    def z_max(self) -> float:
+        return self._z_max
+
+    @property
+    def capped(self) -> bool:
+        return self._capped
+
+    def _hit_params(
+        self, origins: np.ndarray, directions: np.ndarray, tmin: np.ndarray, tmax: np.ndarray
+    ) -> np.ndarray:
+        ox, oy, oz = origins.T
+        dx, dy, dz = directions.T
+        a = dx * dx + dy * dy
+        half_b = ox * dx + oy * dy
+        c = ox * ox + oy * oy - self._radius**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            disc = half_b * half_b - a * c
+            q = -(half_b + np.copysign(np.sqrt(np.maximum(disc, 0.0)), half_b))
+            candidates = [q / a, c / q]
+            if self._capped:
+                candidates += [(self._z_min - oz) / dz, (self._z_max - oz) / dz]
+            t = np.array(candidates)
+            z = oz + t * dz
+            valid = (tmin <= t) & (t < tmax)
+            # the wall roots must lie between the caps, the cap roots inside the radius
+            valid[:2] &= (disc >= 0.0) & (self._z_min <= z[:2]) & (z[:2] <= self._z_max)
+            if self._capped:
+                x, y = ox + t[2:] * dx, oy + t[2:] * dy
+                valid[2:] &= x * x + y * y <= self._radius**2
+        return np.where(valid, t, np.inf).min(axis=0)
+
+    def _object_normals(self, points: np.ndarray) -> np.ndarray:
+        """the wall normal, or the cap normal for points closer to a cap plane than to the wall"""
+        normals = points.copy()
+        normals[:, 2] = 0.0
+        if self._capped:
+            wall = np.abs(np.hypot(points[:, 0], points[:, 1]) - self._radius)
+            below = np.abs(points[:, 2] - self._z_min)
+            above = np.abs(points[:, 2] - self._z_max)
+            cap = np.minimum(below, above) < wall
+            normals[cap] = 0.0
+            normals[cap, 2] = np.where(below[cap] < above[cap], -1.0, 1.0)
+        return normals
+
+    def _params(self) -> np.ndarray:
+        return np.array([self._radius, self._z_min, self._z_max, float(self._capped)])
+
+    @classmethod
+    def _from_params(cls, transformation: Transformer, params: np.ndarray) -> "Cylinder":
+        radius, z_min, z_max, capped = (float(x) for x in params)
+        return cls(transformation, radius, z_min, z_max, capped != 0.0)
+
+    def surface_area(self) -> float:
+        area = 2.0 * np.pi * self._radius * (self._z_max - self._z_min)
+        if self._capped:
+            area += 2.0 * np.pi * self._radius**2
+        return area
@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox
+from raymann.common import validation
+from raymann.geometry.primitive import AnalyticPrimitive
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.transformation.transformer import Transformer
+
+
+class Plane(AnalyticPrimitive):
+    """Infinite plane through point with the given normal, in object space.
+
+    The plane is unbounded, its bounding boxes span all of space and a Scene
+    tests it after the BVH traversal instead of putting it into the BVH.
+    """
+
+    def __init__(
+        self,
+        transf: Transformer = Transformer(),
+        point: Point3D = Point3D(),
+        normal: Normal3D = Normal3D(0.0, 0.0, 1.0),
+    ):
+        if validation.CHECKED and not (isinstance(point, Point3D) and isinstance(normal, Normal3D)):
+            raise TypeError("invalid input for plane, should be (Point3D, Normal3D)")
+        super().__init__(transf)
+        length = np.linalg.norm(normal.data)
+        if length == 0.0:
+            raise ValueError("the plane normal must not be zero")
+        self._point = point
+        self._normal = Normal3D._from_array(normal.data / length)
+        self._bbox = BoundingBox(Point3D(-np.inf, -np.inf, -np.inf), Point3D(np.inf, np.inf, np.inf))
+
+    @property
+    def point(self) -> Point3D:
+        return self._point
+
+    @property
+    def normal(self) -> Normal3D:
+        return self._normal
+
+    def world_bounding_box(self) -> BoundingBox:
+        return self._bbox
+
+    def _hit_params(
+        self, origins: np.ndarray, directions: np.ndarray, tmin: np.ndarray, tmax: np.ndarray
+    ) -> np.ndarray:
+        n = self._normal.data
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = ((self._point.data - origins) @ n) / (directions @ n)
+        return np.where((tmin <= t) & (t < tmax), t, np.inf)
+
+    def _object_normals(self, points: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(self._normal.data, points.shape)
+
+    def _params(self) -> np.ndarray:
+        return np.concatenate((self._point.data, self._normal.data))
+
+    @classmethod
+    def _from_params(cls, transformation: Transformer, params: np.ndarray) -> "Plane":
+        return cls(transformation, Point3D(*params[:3]), Normal3D(*params[3:]))
+
+    def surface_area(self) -> float:
+        return np.inf
@@ -6,12 +6,15 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 
-from raymann.acceleration.bounding_box import BoundingBox
+from raymann.acceleration.bounding_box import BoundingBox, BoxArray
+from raymann.common import validation
 from raymann.common.intersection import Intersection
+from raymann.common.intersection_batch import IntersectionBatch
 from raymann.math_tools.math_utils import dot
 from raymann.math_tools.vector3d import Vector3D
 from raymann.transformation.transformer import Transformer
 from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
 
 
 def get_min_hit_param(tmin: float, tmax: float, *args) -> float:
@@ -23,25 +26,93 @@ def get_min_hit_param(tmin: float, tmax: float, *args) -> float:
     return thit
 
 
+def nearest_quadratic_root(
+    a: np.ndarray, half_b: np.ndarray, c: np.ndarray, tmin: np.ndarray, tmax: np.ndarray
+) -> np.ndarray:
+    """Nearest root of a t^2 + 2 half_b t + c = 0 in [tmin, tmax), inf if none.
+
+    The roots are q / a and c / q with q = -(half_b + sign(half_b) sqrt(disc)),
+    which avoids the cancellation of the textbook formula when |half_b| is
+    close to sqrt(disc).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = half_b * half_b - a * c
+        q = -(half_b + np.copysign(np.sqrt(np.maximum(disc, 0.0)), half_b))
+        t0 = q / a
+        t1 = c / q
+        tnear = np.minimum(t0, t1)
+        tfar = np.maximum(t0, t1)
+        thit = np.where((tmin <= tnear) & (tnear < tmax), tnear, np.inf)
+        thit = np.where(np.isinf(thit) & (tmin <= tfar) & (tfar < tmax), tfar, thit)
+    return np.where(disc >= 0.0, thit, np.inf)
+
+
 class Primitive(ABC):
     def __init__(self, transformation: Transformer):
-        if isinstance(transformation, Transformer):
+        if not validation.CHECKED or isinstance(transformation, Transformer):
             self._transformation = transformation
         else:
             raise TypeError("expects a Transformer object")
         self._bbox = BoundingBox()
+        self._world_bbox = None
+
+    @property
+    def transformation(self) -> Transformer:
+        """object to world Transformer, setting it moves the primitive"""
+        return self._transformation
+
+    @transformation.setter
+    def transformation(self, transformation: Transformer):
+        if validation.CHECKED and not isinstance(transformation, Transformer):
+            raise TypeError("expects a Transformer object")
+        self._transformation = transformation
+        self._world_bbox = None
 
     @abstractmethod
     def intersect(self, ray: Ray, record: Intersection) -> bool:
         """Tests if there's an intersection between ray and primitive"""
-        if not isinstance(ray, Ray) or not isinstance(record, Intersection):
+        if validation.CHECKED and (
+            not isinstance(ray, Ray) or not isinstance(record, Intersection)
+        ):
             raise TypeError("invalid parameters, should be (Ray, Intersection)")
         return False
 
+    def intersect_batch(self, rays: RayBatch) -> IntersectionBatch:
+        """Intersects N rays at once, primitives override it with a vectorized kernel"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        res = IntersectionBatch(len(rays))
+        for i in range(len(rays)):
+            record = Intersection()
+            if self.intersect(rays.ray(i), record):
+                res.hit[i] = True
+                res.prim_ids[i] = 0
+                res.t_hit[i] = record.t_hit
+                res.hit_points[i] = record.hit_point
+                res.normals[i] = record.normal
+                res.wo[i] = record.wo
+        return res
+
+    def occluded(self, ray: Ray) -> bool:
+        """True if the ray hits the primitive in [tmin, tmax), no hit record is filled.
+
+        Primitives override it with a test that stops at the first root and
+        skips the hit point and normal.
+        """
+        return self.intersect(ray, Intersection())
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        """occluded for N rays as a bool array"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        return np.array([self.occluded(rays.ray(i)) for i in range(len(rays))], dtype=bool)
+
     @abstractmethod
     def pdf(self, record: Intersection, wi: Vector3D) -> float:
         """probability density of sampling a point on the primitive"""
-        if not isinstance(record, Intersection) or not isinstance(wi, Vector3D):
+        if validation.CHECKED and (
+            not isinstance(record, Intersection) or not isinstance(wi, Vector3D)
+        ):
             raise TypeError("invalid parameters, should be (Intersection, Vector3D)")
         ray = Ray(record.hit_point, wi)
         inters = Intersection()
@@ -59,3 +130,96 @@ class Primitive(ABC):
     def bounding_box(self) -> BoundingBox:
         """Bounding box of the privimite in object space"""
         return self._bbox
+
+    def world_bounding_box(self) -> BoundingBox:
+        """Bounding box in world space, the object box corners transformed by the Transformer"""
+        if self._world_bbox is None:
+            self._world_bbox = self._bbox.transformed(self._transformation.matrix)
+        return self._world_bbox
+
+
+class AnalyticPrimitive(Primitive):
+    """Primitive with a closed form hit test in object space.
+
+    Subclasses give the nearest hit parameters of N object space rays and
+    the object space normals at their hit points, single ray, batched and
+    occlusion queries are built on these two array kernels. Their shape
+    parameters round trip through one float array, which is how bundles
+    store them.
+    """
+
+    @abstractmethod
+    def _hit_params(
+        self, origins: np.ndarray, directions: np.ndarray, tmin: np.ndarray, tmax: np.ndarray
+    ) -> np.ndarray:
+        """nearest hits of N object space rays in [tmin, tmax), inf if none"""
+
+    @abstractmethod
+    def _object_normals(self, points: np.ndarray) -> np.ndarray:
+        """unnormalized object space normals at (N, 3) surface points"""
+
+    @abstractmethod
+    def _params(self) -> np.ndarray:
+        """the shape parameters as a float64 array"""
+
+    @classmethod
+    @abstractmethod
+    def _from_params(cls, transformation: Transformer, params: np.ndarray) -> "AnalyticPrimitive":
+        """the primitive with the parameters given by _params"""
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        super().intersect(ray, record)
+        res = self.intersect_batch(RayBatch.from_rays([ray]))
+        if not res.hit[0]:
+            return False
+        hit = res.record(0)
+        record.t_hit = hit.t_hit
+        record.hit_point = hit.hit_point
+        record.normal = hit.normal
+        record.wo = hit.wo
+        return True
+
+    def intersect_batch(self, rays: RayBatch) -> IntersectionBatch:
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        thit = self._hit_params(obj_rays.origins, obj_rays.directions, rays.tmin, rays.tmax)
+
+        res = IntersectionBatch(len(rays))
+        hit = np.isfinite(thit)
+        res.hit[:] = hit
+        res.t_hit[:] = thit
+        res.prim_ids[hit] = 0
+        t = thit[hit, np.newaxis]
+        res.hit_points[hit] = rays.origins[hit] + t * rays.directions[hit]
+        res.wo[hit] = -rays.directions[hit]
+        obj_n = self._object_normals(obj_rays.origins[hit] + t * obj_rays.directions[hit])
+        n = self._transformation.obj_to_world_space_normals(obj_n)
+        res.normals[hit] = n / np.linalg.norm(n, axis=1)[:, np.newaxis]
+        return res
+
+    def occluded(self, ray: Ray) -> bool:
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        return bool(self.occluded_batch(RayBatch.from_rays([ray]))[0])
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        return np.isfinite(self._hit_params(obj_rays.origins, obj_rays.directions, rays.tmin, rays.tmax))
+
+    def pdf(self, record: Intersection, wi: Vector3D) -> float:
+        return super().pdf(record, wi)
+
+
+def primitive_bounds(primitives: "list[Primitive]") -> BoxArray:
+    """world space bounds of every primitive, centroids() gives their centers"""
+    n = len(primitives)
+    mins = np.empty((n, 3))
+    maxs = np.empty((n, 3))
+    for i, prim in enumerate(primitives):
+        box = prim.world_bounding_box()
+        mins[i] = box.min_point.data
+        maxs[i] = box.max_point.data
+    return BoxArray(mins, maxs)
@@ -3,14 +3,17 @@
 # See LICENSE file for details.
 import numpy as np
 
-from raymann.geometry.primitive import Primitive, get_min_hit_param
+from raymann.common import validation
+from raymann.geometry.primitive import Primitive, get_min_hit_param, nearest_quadratic_root
 from raymann.math_tools.math_utils import dot
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.vector3d import Vector3D
 from raymann.transformation.transformer import Transformer
 from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
 from raymann.common.intersection import Intersection
+from raymann.common.intersection_batch import IntersectionBatch
 
 
 class Sphere(Primitive):
@@ -20,7 +23,7 @@ class Sphere(Primitive):
         center: Point3D = Point3D(),
         radius: int | float = 1.0,
     ):
-        if (
+        if not validation.CHECKED or (
             isinstance(transf, Transformer)
             and isinstance(center, Point3D)
             and isinstance(radius, (int, float))
@@ -31,31 +34,88 @@ class Sphere(Primitive):
         else:
             raise TypeError("invalid input for sphere, should be (Point3D, int|float)")
 
-        self._bbox.min_point = Point3D(-1, -1, -1) + self._center
-        self._bbox.max_point = Point3D(1, 1, 1) + self._center
+        self._bbox.min_point = self._center - self._radius
+        self._bbox.max_point = self._center + self._radius
+
+    @property
+    def center(self) -> Point3D:
+        return self._center
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    def _hit_param(self, transf_ray: Ray) -> float:
+        """nearest hit of an object space ray in [tmin, tmax), inf if none"""
+        d = transf_ray.direction
+        co = transf_ray.origin - self._center
+        a = dot(d, d)
+        half_b = dot(d, co)
+        c = dot(co, co) - self._radius**2
+        discr = half_b * half_b - a * c
+        if discr < 0.0:
+            return np.inf
+        q = -(half_b + np.copysign(np.sqrt(discr), half_b))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return get_min_hit_param(transf_ray.tmin, transf_ray.tmax, q / a, c / q)
 
     def intersect(self, ray: Ray, record: Intersection) -> bool:
         super().intersect(ray, record)
         transf_ray = self._transformation.world_to_obj_space(ray)
-        o = transf_ray.origin
+        thit = self._hit_param(transf_ray)
+        if np.isinf(thit):
+            return False
         d = transf_ray.direction
-        co = o - self._center
-        a = dot(d, d)
-        b = 2.0 * dot(d, co)
-        c = dot(co, co) - self._radius**2
-        discr = b**2 - 4.0 * a * c
-        if discr >= 0.0:
-            t1 = (-b - np.sqrt(discr)) / (2.0 * a)
-            t2 = (-b + np.sqrt(discr)) / (2.0 * a)
-            record.t_hit = get_min_hit_param(transf_ray.tmin, transf_ray.tmax, t1, t2)
-            record.hit_point.coordinates = transf_ray.position(record.t_hit).coordinates
-            record.wo = -ray.direction # in world coords
-            record.normal = Normal3D((record.hit_point - self._center).normalized())
-            return True
-        return False
+        record.t_hit = thit
+        record.hit_point = Point3D.from_buffer(ray.position(thit).data)  # in world coords
+        record.wo = -ray.direction  # in world coords
+        obj_n = Normal3D._from_array((transf_ray.origin + thit * d).data - self._center.data)
+        record.normal = self._transformation.obj_to_world_space(obj_n).normalized()
+        return True
+
+    def intersect_batch(self, rays: RayBatch) -> IntersectionBatch:
+        """Intersects N rays with the sphere in one vectorized pass"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        d = obj_rays.directions
+        co = obj_rays.origins - self._center.data
+        a = np.einsum("ij,ij->i", d, d)
+        half_b = np.einsum("ij,ij->i", d, co)
+        c = np.einsum("ij,ij->i", co, co) - self._radius**2
+        thit = nearest_quadratic_root(a, half_b, c, rays.tmin, rays.tmax)
+
+        res = IntersectionBatch(len(rays))
+        hit = np.isfinite(thit)
+        res.hit[:] = hit
+        res.t_hit[:] = thit
+        res.prim_ids[hit] = 0
+        t = thit[hit, np.newaxis]
+        res.hit_points[hit] = rays.origins[hit] + t * rays.directions[hit]
+        res.wo[hit] = -rays.directions[hit]
+        obj_n = co[hit] + t * d[hit]
+        n = self._transformation.obj_to_world_space_normals(obj_n)
+        res.normals[hit] = n / np.linalg.norm(n, axis=1)[:, np.newaxis]
+        return res
+
+    def occluded(self, ray: Ray) -> bool:
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        return not np.isinf(self._hit_param(self._transformation.world_to_obj_space(ray)))
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        d = obj_rays.directions
+        co = obj_rays.origins - self._center.data
+        a = np.einsum("ij,ij->i", d, d)
+        half_b = np.einsum("ij,ij->i", d, co)
+        c = np.einsum("ij,ij->i", co, co) - self._radius**2
+        return np.isfinite(nearest_quadratic_root(a, half_b, c, rays.tmin, rays.tmax))
 
     def normal(self, point: Point3D) -> Normal3D:
-        if isinstance(point, Point3D):
+        if not validation.CHECKED or isinstance(point, Point3D):
             obj_p = self._transformation.world_to_obj_space(point)
             obj_n = Normal3D((obj_p - self._center).normalized())
             return self._transformation.obj_to_world_space(obj_n).normalized()
@@ -0,0 +1,291 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox, transform_bounds
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.common.intersection_batch import IntersectionBatch
+from raymann.geometry.primitive import Primitive, nearest_quadratic_root
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+# upper bound of ray/sphere pairs evaluated at once by the N x M kernel
+CHUNK_ELEMENTS = 1 << 18
+
+
+class SphereSet(Primitive):
+    """M spheres sharing one transformation, stored as arrays.
+
+    centers is a contiguous (M, 3) float64 array and radii an (M,) float64
+    array, so a sphere costs 32 bytes plus 8 for the cached squared radius.
+    Sphere i is reported through the prim_ids of the IntersectionBatch.
+    """
+
+    def __init__(
+        self,
+        centers: np.ndarray,
+        radii: "float | np.ndarray" = 1.0,
+        transf: Transformer = None,
+    ):
+        if transf is None:
+            transf = Transformer()
+        super().__init__(transf)
+        if validation.CHECKED and not isinstance(centers, (np.ndarray, list)):
+            raise TypeError("centers must be an (M, 3) array")
+        centers = np.ascontiguousarray(centers, dtype=np.float64)
+        if centers.ndim != 2 or centers.shape[1] != 3:
+            raise ValueError("centers must have shape (M, 3)")
+        if isinstance(radii, (int, float, np.floating)):
+            radii = np.full(centers.shape[0], radii, dtype=np.float64)
+        elif isinstance(radii, (np.ndarray, list)):
+            radii = np.ascontiguousarray(radii, dtype=np.float64)
+        else:
+            raise TypeError("radii must be a number or an (M,) array")
+        if radii.shape != (centers.shape[0],):
+            raise ValueError("radii must have shape (M,)")
+        if np.any(radii < 0.0):
+            raise ValueError("radii must be non negative")
+        self._centers = centers
+        self._radii = radii
+        # the constant term of the kernel, computed once
+        self._radii_sq = radii * radii
+        if len(self):
+            mins, maxs = self.prim_bounds()
+            self._bbox = BoundingBox(Point3D(*mins.min(axis=0)), Point3D(*maxs.max(axis=0)))
+
+    @property
+    def centers(self) -> np.ndarray:
+        return self._centers
+
+    @property
+    def radii(self) -> np.ndarray:
+        return self._radii
+
+    def __len__(self) -> int:
+        return self._centers.shape[0]
+
+    def prim_bounds(self) -> (np.ndarray, np.ndarray):
+        """(M, 3) min and max corners of every sphere in object space"""
+        r = self._radii[:, np.newaxis]
+        return self._centers - r, self._centers + r
+
+    def world_prim_bounds(self) -> (np.ndarray, np.ndarray):
+        """(M, 3) min and max corners of every sphere in world space"""
+        return transform_bounds(self._transformation.matrix, *self.prim_bounds())
+
+    def prim_centroids(self) -> np.ndarray:
+        """(M, 3) centroids of the spheres in object space"""
+        return self._centers
+
+    def intersect_prims(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        prim_ids: np.ndarray,
+    ) -> (float, int):
+        """Closest hit of one object space ray with the spheres prim_ids.
+
+        Returns (t, prim) and (inf, -1) on a miss. This is the leaf kernel
+        used by acceleration structures built over prim_bounds.
+        """
+        t, prim = self._closest(
+            np.reshape(origin, (1, 3)),
+            np.reshape(direction, (1, 3)),
+            np.array([tmin], dtype=np.float64),
+            np.array([tmax], dtype=np.float64),
+            np.asarray(prim_ids, dtype=np.int64),
+        )
+        return float(t[0]), int(prim[0])
+
+    def intersect_prims_batch(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> (np.ndarray, np.ndarray):
+        """closest (t, prim) arrays of N object space rays with the spheres prim_ids"""
+        return self._closest(
+            np.asarray(origins, dtype=np.float64),
+            np.asarray(directions, dtype=np.float64),
+            np.asarray(tmin, dtype=np.float64),
+            np.asarray(tmax, dtype=np.float64),
+            np.asarray(prim_ids, dtype=np.int64),
+        )
+
+    def _closest(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> (np.ndarray, np.ndarray):
+        """N x M kernel in object space, evaluated in chunks of spheres"""
+        n = origins.shape[0]
+        best_t = np.full(n, np.inf)
+        best_prim = np.full(n, -1, dtype=np.int64)
+        if n == 0 or prim_ids.size == 0:
+            return best_t, best_prim
+        rows = np.arange(n)
+        a = np.einsum("ij,ij->i", directions, directions)[:, np.newaxis]
+        tmin = tmin[:, np.newaxis]
+        tmax = tmax.copy()
+        step = max(1, CHUNK_ELEMENTS // n)
+        for start in range(0, prim_ids.size, step):
+            ids = prim_ids[start : start + step]
+            co = origins[:, np.newaxis, :] - self._centers[ids]
+            half_b = np.einsum("nkj,nj->nk", co, directions)
+            c = np.einsum("nkj,nkj->nk", co, co) - self._radii_sq[ids]
+            t = nearest_quadratic_root(a, half_b, c, tmin, tmax[:, np.newaxis])
+            k = np.argmin(t, axis=1)
+            tk = t[rows, k]
+            closer = tk < best_t
+            best_t[closer] = tk[closer]
+            best_prim[closer] = ids[k[closer]]
+            np.minimum(tmax, best_t, out=tmax)
+        return best_t, best_prim
+
+    def occluded_prims(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        prim_ids: np.ndarray,
+    ) -> bool:
+        """True if one object space ray hits any of the spheres prim_ids in [tmin, tmax)"""
+        return bool(
+            self._any(
+                np.reshape(origin, (1, 3)),
+                np.reshape(direction, (1, 3)),
+                np.array([tmin], dtype=np.float64),
+                np.array([tmax], dtype=np.float64),
+                np.asarray(prim_ids, dtype=np.int64),
+            )[0]
+        )
+
+    def occluded_prims_batch(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> np.ndarray:
+        """occlusion of N object space rays by the spheres prim_ids as a bool array"""
+        return self._any(
+            np.asarray(origins, dtype=np.float64),
+            np.asarray(directions, dtype=np.float64),
+            np.asarray(tmin, dtype=np.float64),
+            np.asarray(tmax, dtype=np.float64),
+            np.asarray(prim_ids, dtype=np.int64),
+        )
+
+    def _any(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> np.ndarray:
+        """N x M occlusion kernel in object space, rays drop out at their first hit chunk"""
+        n = origins.shape[0]
+        occluded = np.zeros(n, dtype=bool)
+        a = np.einsum("ij,ij->i", directions, directions)[:, np.newaxis]
+        rows = np.arange(n)
+        start = 0
+        while rows.size and start < prim_ids.size:
+            step = max(1, CHUNK_ELEMENTS // rows.size)
+            ids = prim_ids[start : start + step]
+            start += step
+            co = origins[rows, np.newaxis, :] - self._centers[ids]
+            half_b = np.einsum("nkj,nj->nk", co, directions[rows])
+            c = np.einsum("nkj,nkj->nk", co, co) - self._radii_sq[ids]
+            t = nearest_quadratic_root(
+                a[rows], half_b, c, tmin[rows, np.newaxis], tmax[rows, np.newaxis]
+            )
+            hit = np.isfinite(t).any(axis=1)
+            occluded[rows[hit]] = True
+            rows = rows[~hit]
+        return occluded
+
+    def intersect_batch(
+        self, rays: RayBatch, prim_ids: np.ndarray = None
+    ) -> IntersectionBatch:
+        """Intersects N rays with all spheres, or only with prim_ids if given"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        if prim_ids is None:
+            prim_ids = np.arange(len(self), dtype=np.int64)
+        else:
+            prim_ids = np.asarray(prim_ids, dtype=np.int64)
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        thit, prim = self._closest(obj_rays.origins, obj_rays.directions, rays.tmin, rays.tmax, prim_ids)
+        return self._records(rays, obj_rays, thit, prim)
+
+    def hit_records(self, rays: RayBatch, t: np.ndarray, prim_ids: np.ndarray) -> IntersectionBatch:
+        """hit records of rays known to hit the spheres prim_ids at t, -1 marks a miss"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        return self._records(rays, obj_rays, np.asarray(t, dtype=np.float64), np.asarray(prim_ids, dtype=np.int64))
+
+    def _records(
+        self, rays: RayBatch, obj_rays: RayBatch, thit: np.ndarray, prim: np.ndarray
+    ) -> IntersectionBatch:
+        res = IntersectionBatch(len(rays))
+        hit = prim >= 0
+        res.hit[:] = hit
+        res.t_hit[hit] = thit[hit]
+        res.prim_ids[:] = prim
+        t = thit[hit, np.newaxis]
+        res.hit_points[hit] = rays.origins[hit] + t * rays.directions[hit]
+        res.wo[hit] = -rays.directions[hit]
+        obj_n = obj_rays.origins[hit] + t * obj_rays.directions[hit] - self._centers[prim[hit]]
+        n = self._transformation.obj_to_world_space_normals(obj_n)
+        res.normals[hit] = n / np.linalg.norm(n, axis=1)[:, np.newaxis]
+        return res
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        super().intersect(ray, record)
+        res = self.intersect_batch(RayBatch.from_rays([ray]))
+        if not res.hit[0]:
+            return False
+        hit = res.record(0)
+        record.t_hit = hit.t_hit
+        record.hit_point = hit.hit_point
+        record.normal = hit.normal
+        record.wo = hit.wo
+        return True
+
+    def occluded(self, ray: Ray) -> bool:
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        return bool(self.occluded_batch(RayBatch.from_rays([ray]))[0])
+
+    def occluded_batch(self, rays: RayBatch, prim_ids: np.ndarray = None) -> np.ndarray:
+        """occlusion of N rays by all spheres, or only by prim_ids if given"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        if prim_ids is None:
+            prim_ids = np.arange(len(self), dtype=np.int64)
+        else:
+            prim_ids = np.asarray(prim_ids, dtype=np.int64)
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        return self._any(obj_rays.origins, obj_rays.directions, rays.tmin, rays.tmax, prim_ids)
+
+    def pdf(self, record: Intersection, wi: Vector3D) -> float:
+        return super().pdf(record, wi)
+
+    def surface_area(self) -> float:
+        return float(4.0 * np.pi * np.sum(self._radii**2))
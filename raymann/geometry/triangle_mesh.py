@@ -0,0 +1,385 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox, transform_bounds
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.common.intersection_batch import IntersectionBatch
+from raymann.geometry.primitive import Primitive
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+# upper bound of ray/triangle pairs evaluated at once by the N x M kernel
+CHUNK_ELEMENTS = 1 << 16
+# a |det| up to this fraction of |d| |e1| |e2| is a ray parallel to the triangle or a sliver
+DET_EPSILON = 1e-9
+
+
+def _buffer(data: np.ndarray, name: str, kind: str) -> np.ndarray:
+    """contiguous (K, 3) view of data, float32/float64 and integer types are kept"""
+    if validation.CHECKED and not isinstance(data, (np.ndarray, list)):
+        raise TypeError(f"{name} must be a (K, 3) array")
+    data = np.asarray(data)
+    if data.dtype.kind not in kind:
+        data = data.astype(np.float64 if kind == "f" else np.int64)
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError(f"{name} must have shape (K, 3)")
+    return np.ascontiguousarray(data)
+
+
+class TriangleMesh(Primitive):
+    """M triangles over V shared vertices, stored as flat buffers.
+
+    vertices and the optional per vertex normals are contiguous (V, 3)
+    arrays, indices is a contiguous (M, 3) array of vertex ids. The buffers
+    keep their dtype, a float32 mesh with int32 indices is not widened, and
+    no per triangle data is stored. Triangle i is reported through the
+    prim_ids of the IntersectionBatch together with the barycentrics of the
+    hit, normals are interpolated with them when given.
+    """
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        indices: np.ndarray,
+        normals: np.ndarray = None,
+        transf: Transformer = None,
+    ):
+        if transf is None:
+            transf = Transformer()
+        super().__init__(transf)
+        vertices = _buffer(vertices, "vertices", "f")
+        indices = _buffer(indices, "indices", "iu")
+        if indices.size and (indices.min() < 0 or indices.max() >= vertices.shape[0]):
+            raise ValueError("indices must refer to vertices")
+        if normals is not None:
+            normals = _buffer(normals, "normals", "f")
+            if normals.shape != vertices.shape:
+                raise ValueError("normals must have the shape of vertices")
+        self._vertices = vertices
+        self._indices = indices
+        self._normals = normals
+        if len(self):
+            mins, maxs = self.prim_bounds()
+            self._bbox = BoundingBox(Point3D(*mins.min(axis=0)), Point3D(*maxs.max(axis=0)))
+
+    @property
+    def vertices(self) -> np.ndarray:
+        return self._vertices
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def normals(self) -> "np.ndarray | None":
+        return self._normals
+
+    @property
+    def nbytes(self) -> int:
+        """size of the vertex, index and normal buffers"""
+        size = self._vertices.nbytes + self._indices.nbytes
+        return size if self._normals is None else size + self._normals.nbytes
+
+    def __len__(self) -> int:
+        return self._indices.shape[0]
+
+    def _corners(self, prim_ids: "np.ndarray | slice" = slice(None)) -> np.ndarray:
+        """(M, 3, 3) corner positions of the triangles prim_ids"""
+        return self._vertices[self._indices[prim_ids]]
+
+    def prim_bounds(self) -> (np.ndarray, np.ndarray):
+        """(M, 3) min and max corners of every triangle in object space"""
+        mins = np.empty((len(self), 3))
+        maxs = np.empty((len(self), 3))
+        # chunked to keep the (M, 3, 3) corner copy small
+        for start in range(0, len(self), CHUNK_ELEMENTS):
+            corners = self._corners(slice(start, start + CHUNK_ELEMENTS))
+            mins[start : start + CHUNK_ELEMENTS] = corners.min(axis=1)
+            maxs[start : start + CHUNK_ELEMENTS] = corners.max(axis=1)
+        return mins, maxs
+
+    def world_prim_bounds(self) -> (np.ndarray, np.ndarray):
+        """(M, 3) min and max corners of every triangle in world space"""
+        return transform_bounds(self._transformation.matrix, *self.prim_bounds())
+
+    def prim_centroids(self) -> np.ndarray:
+        """(M, 3) centroids of the triangles in object space"""
+        centroids = self._vertices[self._indices[:, 0]].astype(np.float64)
+        centroids += self._vertices[self._indices[:, 1]]
+        centroids += self._vertices[self._indices[:, 2]]
+        return centroids / 3.0
+
+    def intersect_prims(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        prim_ids: np.ndarray,
+    ) -> (float, int):
+        """Closest hit of one object space ray with the triangles prim_ids.
+
+        Returns (t, prim) and (inf, -1) on a miss. This is the leaf kernel
+        used by acceleration structures built over prim_bounds.
+        """
+        t, prim, _ = self.intersect_triangles(
+            np.reshape(origin, (1, 3)),
+            np.reshape(direction, (1, 3)),
+            np.array([tmin], dtype=np.float64),
+            np.array([tmax], dtype=np.float64),
+            prim_ids,
+        )
+        return float(t[0]), int(prim[0])
+
+    def occluded_prims(
+        self,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        tmin: float,
+        tmax: float,
+        prim_ids: np.ndarray,
+    ) -> bool:
+        """True if one object space ray hits any of the triangles prim_ids in [tmin, tmax)"""
+        return bool(
+            self._kernel(
+                np.reshape(np.asarray(origin, dtype=np.float64), (1, 3)),
+                np.reshape(np.asarray(direction, dtype=np.float64), (1, 3)),
+                np.array([tmin], dtype=np.float64),
+                np.array([tmax], dtype=np.float64),
+                np.asarray(prim_ids, dtype=np.int64),
+                True,
+            )[1][0]
+            >= 0
+        )
+
+    def intersect_prims_batch(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> (np.ndarray, np.ndarray):
+        """closest (t, prim) arrays of N object space rays with the triangles prim_ids"""
+        t, prim, _ = self.intersect_triangles(origins, directions, tmin, tmax, prim_ids)
+        return t, prim
+
+    def occluded_prims_batch(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> np.ndarray:
+        """occlusion of N object space rays by the triangles prim_ids as a bool array"""
+        _, prim, _ = self._kernel(
+            np.asarray(origins, dtype=np.float64),
+            np.asarray(directions, dtype=np.float64),
+            np.asarray(tmin, dtype=np.float64),
+            np.asarray(tmax, dtype=np.float64),
+            np.asarray(prim_ids, dtype=np.int64),
+            True,
+        )
+        return prim >= 0
+
+    def intersect_triangles(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+    ) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Closest hits of N object space rays with the triangles prim_ids.
+
+        Returns the (N,) t, (N,) triangle ids and (N, 2) barycentrics of the
+        second and third vertex, (inf, -1, 0) for misses.
+        """
+        return self._kernel(
+            np.asarray(origins, dtype=np.float64),
+            np.asarray(directions, dtype=np.float64),
+            np.asarray(tmin, dtype=np.float64),
+            np.asarray(tmax, dtype=np.float64),
+            np.asarray(prim_ids, dtype=np.int64),
+            False,
+        )
+
+    def _kernel(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        prim_ids: np.ndarray,
+        any_hit: bool,
+    ) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Möller-Trumbore N x M kernel in object space, evaluated in chunks of triangles.
+
+        With any_hit the rays drop out at their first hit chunk, their t and
+        barycentrics are then not the closest ones.
+        """
+        n = origins.shape[0]
+        best_t = np.full(n, np.inf)
+        best_prim = np.full(n, -1, dtype=np.int64)
+        best_uv = np.zeros((n, 2))
+        rows = np.arange(n)
+        tmax = tmax.copy()
+        start = 0
+        while rows.size and start < prim_ids.size:
+            step = max(1, CHUNK_ELEMENTS // rows.size)
+            ids = prim_ids[start : start + step]
+            start += step
+            corners = self._corners(ids)
+            v0 = corners[:, 0]
+            e1 = corners[:, 1] - v0
+            e2 = corners[:, 2] - v0
+            d = directions[rows, np.newaxis, :]
+            pvec = np.cross(d, e2)
+            det = np.einsum("kj,nkj->nk", e1, pvec)
+            scale = np.linalg.norm(directions[rows], axis=1)[:, np.newaxis] * (
+                np.linalg.norm(e1, axis=1) * np.linalg.norm(e2, axis=1)
+            )
+            tvec = origins[rows, np.newaxis, :] - v0
+            qvec = np.cross(tvec, e1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                inv_det = 1.0 / det
+                u = np.einsum("nkj,nkj->nk", tvec, pvec) * inv_det
+                v = np.einsum("nkj,nkj->nk", d, qvec) * inv_det
+                t = np.einsum("kj,nkj->nk", e2, qvec) * inv_det
+                valid = (
+                    (np.abs(det) > DET_EPSILON * scale)
+                    & (u >= 0.0)
+                    & (v >= 0.0)
+                    & (u + v <= 1.0)
+                    & (t >= tmin[rows, np.newaxis])
+                    & (t < tmax[rows, np.newaxis])
+                )
+            t = np.where(valid, t, np.inf)
+            k = np.argmin(t, axis=1)
+            local = np.arange(rows.size)
+            tk = t[local, k]
+            closer = tk < best_t[rows]
+            hit_rows = rows[closer]
+            best_t[hit_rows] = tk[closer]
+            best_prim[hit_rows] = ids[k[closer]]
+            best_uv[hit_rows, 0] = u[local, k][closer]
+            best_uv[hit_rows, 1] = v[local, k][closer]
+            if any_hit:
+                rows = rows[~closer]
+            else:
+                tmax[hit_rows] = tk[closer]
+        return best_t, best_prim, best_uv
+
+    def _object_normals(self, prim: np.ndarray, uv: np.ndarray) -> np.ndarray:
+        """interpolated vertex normals, or the face normals without them"""
+        tri = self._indices[prim]
+        if self._normals is not None:
+            w = np.column_stack((1.0 - uv[:, 0] - uv[:, 1], uv))
+            return np.einsum("nk,nkj->nj", w, self._normals[tri])
+        v = self._vertices[tri]
+        return np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0])
+
+    def intersect_batch(
+        self, rays: RayBatch, prim_ids: np.ndarray = None
+    ) -> IntersectionBatch:
+        """Intersects N rays with all triangles, or only with prim_ids if given"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        if prim_ids is None:
+            prim_ids = np.arange(len(self), dtype=np.int64)
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        thit, prim, uv = self.intersect_triangles(
+            obj_rays.origins, obj_rays.directions, rays.tmin, rays.tmax, prim_ids
+        )
+        return self._records(rays, thit, prim, uv)
+
+    def hit_records(self, rays: RayBatch, t: np.ndarray, prim_ids: np.ndarray) -> IntersectionBatch:
+        """Hit records of rays known to hit the triangles prim_ids at t, -1 marks a miss.
+
+        The barycentrics are recomputed for every ray with its own triangle.
+        """
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        t = np.asarray(t, dtype=np.float64)
+        prim = np.asarray(prim_ids, dtype=np.int64)
+        hit = prim >= 0
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        corners = self._corners(prim[hit])
+        e1 = corners[:, 1] - corners[:, 0]
+        e2 = corners[:, 2] - corners[:, 0]
+        d = obj_rays.directions[hit]
+        tvec = obj_rays.origins[hit] - corners[:, 0]
+        pvec = np.cross(d, e2)
+        qvec = np.cross(tvec, e1)
+        det = np.einsum("ij,ij->i", e1, pvec)
+        scale = np.linalg.norm(d, axis=1) * np.linalg.norm(e1, axis=1) * np.linalg.norm(e2, axis=1)
+        # barycentrics of parallel rays or slivers, which the kernel never reports, stay 0
+        solvable = np.abs(det) > DET_EPSILON * scale
+        uv = np.zeros((len(rays), 2))
+        uv[hit, 0] = np.divide(np.einsum("ij,ij->i", tvec, pvec), det, out=np.zeros_like(det), where=solvable)
+        uv[hit, 1] = np.divide(np.einsum("ij,ij->i", d, qvec), det, out=np.zeros_like(det), where=solvable)
+        return self._records(rays, t, prim, uv)
+
+    def _records(
+        self, rays: RayBatch, thit: np.ndarray, prim: np.ndarray, uv: np.ndarray
+    ) -> IntersectionBatch:
+        res = IntersectionBatch(len(rays))
+        hit = prim >= 0
+        res.hit[:] = hit
+        res.t_hit[hit] = thit[hit]
+        res.prim_ids[:] = prim
+        res.barycentrics[hit] = uv[hit]
+        t = thit[hit, np.newaxis]
+        res.hit_points[hit] = rays.origins[hit] + t * rays.directions[hit]
+        res.wo[hit] = -rays.directions[hit]
+        n = self._transformation.obj_to_world_space_normals(self._object_normals(prim[hit], uv[hit]))
+        res.normals[hit] = n / np.linalg.norm(n, axis=1)[:, np.newaxis]
+        return res
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        super().intersect(ray, record)
+        res = self.intersect_batch(RayBatch.from_rays([ray]))
+        if not res.hit[0]:
+            return False
+        hit = res.record(0)
+        record.t_hit = hit.t_hit
+        record.hit_point = hit.hit_point
+        record.normal = hit.normal
+        record.wo = hit.wo
+        return True
+
+    def occluded(self, ray: Ray) -> bool:
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        return bool(self.occluded_batch(RayBatch.from_rays([ray]))[0])
+
+    def occluded_batch(self, rays: RayBatch, prim_ids: np.ndarray = None) -> np.ndarray:
+        """occlusion of N rays by all triangles, or only by prim_ids if given"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        if prim_ids is None:
+            prim_ids = np.arange(len(self), dtype=np.int64)
+        obj_rays = self._transformation.world_to_obj_space_batch(rays)
+        _, prim, _ = self._kernel(
+            obj_rays.origins,
+            obj_rays.directions,
+            rays.tmin,
+            rays.tmax,
+            np.asarray(prim_ids, dtype=np.int64),
+            True,
+        )
+        return prim >= 0
+
+    def pdf(self, record: Intersection, wi: Vector3D) -> float:
+        return super().pdf(record, wi)
+
+    def surface_area(self) -> float:
+        v = self._corners()
+        return float(0.5 * np.sum(np.linalg.norm(np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0]), axis=1)))
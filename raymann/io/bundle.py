@@ -0,0 +1,226 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+"""Baked scene bundles.
+
+A bundle is one file holding the compiled form of a BVHAggregate: the
+object to world matrices and their inverses, the primitive arrays and the
+BVH node arrays. The file starts with a magic, the format version and a
+JSON header naming every array with its dtype, shape and offset; the arrays
+follow, 64 byte aligned. Loading maps the file copy-on-write, so nothing is
+rebuilt, processes share the pages through the OS cache and a refit only
+copies the pages it touches.
+
+Bundles are keyed by a hash of the source primitives, load_or_bake finds
+the bundle of a scene in a cache directory and bakes it again once the
+scene changes.
+"""
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+from raymann.acceleration.bvh import BVH, BVHAggregate
+from raymann.geometry.box import Box
+from raymann.geometry.cylinder import Cylinder
+from raymann.geometry.plane import Plane
+from raymann.geometry.primitive import AnalyticPrimitive, Primitive
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.math_tools.matrix4d import Matrix4D
+from raymann.math_tools.point3d import Point3D
+from raymann.transformation.transformer import Transformer
+
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".rmb"
+_MAGIC = b"RAYMANN\0"
+# magic, version, header length
+_PREFIX = struct.Struct("<8sIQ")
+_ALIGN = 64
+# analytic primitives are stored as their parameter array under these kinds
+_ANALYTIC = {"plane": Plane, "box": Box, "cylinder": Cylinder}
+_BVH_ARRAYS = ("node_min", "node_max", "node_offset", "node_count", "node_axis", "prim_indices")
+
+
+def _aligned(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+
+def write_bundle(path: "str | os.PathLike", arrays: "dict[str, np.ndarray]", meta: dict, key: str):
+    """Writes named arrays and JSON meta data to path.
+
+    The file is written next to path and renamed, so readers never see a
+    partial bundle.
+    """
+    table = {}
+    offset = 0
+    for name, arr in arrays.items():
+        arr = np.asarray(arr)
+        table[name] = [arr.dtype.str, list(arr.shape), offset]
+        offset = _aligned(offset + arr.nbytes)
+    header = json.dumps({"key": key, "meta": meta, "arrays": table}).encode()
+    data_start = _aligned(_PREFIX.size + len(header))
+    tmp = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_PREFIX.pack(_MAGIC, BUNDLE_VERSION, len(header)))
+            f.write(header)
+            for name, arr in arrays.items():
+                f.seek(data_start + table[name][2])
+                f.write(np.ascontiguousarray(arr).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def read_bundle(path: "str | os.PathLike") -> ("dict[str, np.ndarray]", dict, str):
+    """Maps a bundle, returns its arrays as views of the mapping, the meta data and the key"""
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError("not a scene bundle")
+        magic, version, header_len = _PREFIX.unpack(prefix)
+        if magic != _MAGIC:
+            raise ValueError("not a scene bundle")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"bundle version {version} is not supported, expected {BUNDLE_VERSION}")
+        header = json.loads(f.read(header_len))
+    data_start = _aligned(_PREFIX.size + header_len)
+    mapped = np.memmap(path, dtype=np.uint8, mode="c")
+    arrays = {}
+    for name, (dtype, shape, offset) in header["arrays"].items():
+        dtype = np.dtype(dtype)
+        start = data_start + offset
+        count = int(np.prod(shape, dtype=np.int64))
+        arrays[name] = mapped[start : start + count * dtype.itemsize].view(dtype).reshape(shape)
+    return arrays, header["meta"], header["key"]
+
+
+def _source_arrays(primitives: "list[Primitive]") -> ("dict[str, np.ndarray]", dict):
+    """The matrices and primitive arrays of a scene and its meta data.
+
+    meta holds the kind of every primitive and the aliases of buffers
+    shared between primitives, which are stored once. Analytic primitives
+    of the kinds in _ANALYTIC are stored as their parameter arrays, other
+    primitive types cannot be baked.
+    """
+    arrays = {"matrices": np.array([p.transformation.matrix.data for p in primitives]).reshape(-1, 4, 4)}
+    kinds = []
+    aliases = {}
+    names = {}
+    spheres = []
+
+    def add(name: str, arr: np.ndarray):
+        if id(arr) in names:
+            aliases[name] = names[id(arr)]
+        else:
+            names[id(arr)] = name
+            arrays[name] = arr
+
+    for i, prim in enumerate(primitives):
+        if isinstance(prim, SphereSet):
+            kinds.append("sphere_set")
+            add(f"{i}/centers", prim.centers)
+            add(f"{i}/radii", prim.radii)
+        elif isinstance(prim, TriangleMesh):
+            kinds.append("triangle_mesh")
+            add(f"{i}/vertices", prim.vertices)
+            add(f"{i}/indices", prim.indices)
+            if prim.normals is not None:
+                add(f"{i}/normals", prim.normals)
+        elif type(prim) is Sphere:
+            kinds.append("sphere")
+            spheres.append(i)
+        elif isinstance(prim, AnalyticPrimitive) and _ANALYTIC.get(type(prim).__name__.lower()) is type(prim):
+            kinds.append(type(prim).__name__.lower())
+            arrays[f"{i}/params"] = prim._params()
+        else:
+            raise TypeError(f"{type(prim).__name__} cannot be baked")
+    arrays["sphere/prims"] = np.array(spheres, dtype=np.int64)
+    arrays["sphere/centers"] = np.array([primitives[i].center.data for i in spheres]).reshape(-1, 3)
+    arrays["sphere/radii"] = np.array([primitives[i].radius for i in spheres], dtype=np.float64)
+    return arrays, {"kinds": kinds, "aliases": aliases}
+
+
+def _hash(arrays: "dict[str, np.ndarray]", meta: dict) -> str:
+    digest = hashlib.sha256(json.dumps([BUNDLE_VERSION, meta], sort_keys=True).encode())
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        digest.update(f"{name}:{arr.dtype.str}:{arr.shape}".encode())
+        digest.update(arr.data)
+    return digest.hexdigest()
+
+
+def scene_key(primitives: "list[Primitive]", max_leaf_size: int = 4) -> str:
+    """content hash of the primitives and build settings, the key of their bundle"""
+    arrays, meta = _source_arrays(primitives)
+    meta["max_leaf_size"] = max_leaf_size
+    return _hash(arrays, meta)
+
+
+def bake(aggregate: BVHAggregate, path: "str | os.PathLike") -> str:
+    """writes the compiled aggregate to a bundle at path, returns its key"""
+    if not isinstance(aggregate, BVHAggregate):
+        raise TypeError("a BVHAggregate must be provided")
+    arrays, meta = _source_arrays(aggregate.primitives)
+    meta["max_leaf_size"] = aggregate.max_leaf_size
+    key = _hash(arrays, meta)
+    arrays["inverses"] = np.array(
+        [p.transformation.inverse_matrix.data for p in aggregate.primitives]
+    ).reshape(-1, 4, 4)
+    for name in _BVH_ARRAYS:
+        arrays[f"bvh/{name}"] = getattr(aggregate.bvh, name)
+    write_bundle(path, arrays, meta, key)
+    return key
+
+
+def load(path: "str | os.PathLike") -> BVHAggregate:
+    """the aggregate of a bundle, its arrays are views of the mapped file"""
+    arrays, meta, _ = read_bundle(path)
+    for name, target in meta["aliases"].items():
+        arrays[name] = arrays[target]
+    matrices = arrays["matrices"]
+    inverses = arrays["inverses"]
+    sphere_at = {int(p): j for j, p in enumerate(arrays["sphere/prims"])}
+    primitives = []
+    for i, kind in enumerate(meta["kinds"]):
+        transf = Transformer(Matrix4D.with_inverse(matrices[i], inverses[i]))
+        if kind == "sphere":
+            j = sphere_at[i]
+            center = Point3D(*arrays["sphere/centers"][j])
+            primitives.append(Sphere(transf, center, float(arrays["sphere/radii"][j])))
+        elif kind == "sphere_set":
+            primitives.append(SphereSet(arrays[f"{i}/centers"], arrays[f"{i}/radii"], transf))
+        elif kind in _ANALYTIC:
+            primitives.append(_ANALYTIC[kind]._from_params(transf, arrays[f"{i}/params"]))
+        else:
+            primitives.append(
+                TriangleMesh(arrays[f"{i}/vertices"], arrays[f"{i}/indices"], arrays.get(f"{i}/normals"), transf)
+            )
+    bvh = BVH(*(arrays[f"bvh/{name}"] for name in _BVH_ARRAYS))
+    return BVHAggregate.from_bvh(primitives, bvh, meta["max_leaf_size"])
+
+
+def load_or_bake(
+    primitives: "list[Primitive]", cache_dir: "str | os.PathLike", max_leaf_size: int = 4
+) -> BVHAggregate:
+    """Loads the bundle of the primitives from cache_dir, baking it first if missing.
+
+    Bundles are named by scene_key, a changed scene gets a new bundle and
+    bundles of an older format version are baked again.
+    """
+    key = scene_key(primitives, max_leaf_size)
+    path = os.path.join(cache_dir, key + BUNDLE_SUFFIX)
+    if os.path.exists(path):
+        try:
+            return load(path)
+        except ValueError:
+            pass
+    os.makedirs(cache_dir, exist_ok=True)
+    bake(BVHAggregate(primitives, max_leaf_size), path)
+    return load(path)
@@ -0,0 +1,325 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+"""Streaming OBJ and memory-mapped binary PLY loading.
+
+OBJ files are read in chunks of whole lines. Vertex and face lines of a
+chunk are parsed with one numpy conversion each and appended to growing
+buffers, so the file is never held as Python lists. Polygons are fan
+triangulated. Binary PLY vertex and face blocks are memory-mapped, a vertex
+block holding only x, y and z is used as it is and faces are copied once
+into a contiguous index buffer. The buffers feed TriangleMesh, which keeps
+their dtypes.
+"""
+import os
+import re
+import time
+
+import numpy as np
+
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.transformation.transformer import Transformer
+
+# bytes read from an OBJ file at once, the chunk is cut at its last newline
+CHUNK_BYTES = 1 << 24
+
+_PLY_TYPES = {
+    b"char": "i1", b"int8": "i1",
+    b"uchar": "u1", b"uint8": "u1",
+    b"short": "i2", b"int16": "i2",
+    b"ushort": "u2", b"uint16": "u2",
+    b"int": "i4", b"int32": "i4",
+    b"uint": "u4", b"uint32": "u4",
+    b"float": "f4", b"float32": "f4",
+    b"double": "f8", b"float64": "f8",
+}
+_OBJ_REFS = re.compile(rb"/\S*")
+
+
+class MeshData:
+    """Vertex, index and optional normal buffers of a loaded mesh and the load statistics"""
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        indices: np.ndarray,
+        normals: "np.ndarray | None",
+        bytes_read: int,
+        seconds: float,
+    ):
+        self._vertices = vertices
+        self._indices = indices
+        self._normals = normals
+        self._bytes_read = bytes_read
+        self._seconds = seconds
+
+    @property
+    def vertices(self) -> np.ndarray:
+        return self._vertices
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def normals(self) -> "np.ndarray | None":
+        return self._normals
+
+    @property
+    def bytes_read(self) -> int:
+        return self._bytes_read
+
+    @property
+    def seconds(self) -> float:
+        return self._seconds
+
+    @property
+    def throughput(self) -> float:
+        """parse throughput in MB/s"""
+        return self._bytes_read / 1e6 / max(self._seconds, 1e-9)
+
+    def to_mesh(self, transf: Transformer = None) -> TriangleMesh:
+        """TriangleMesh over the loaded buffers, contiguous buffers are not copied"""
+        return TriangleMesh(self._vertices, self._indices, self._normals, transf)
+
+
+class _GrowingBuffer:
+    """(capacity, width) array filled from the front, doubled when full"""
+
+    def __init__(self, capacity: int, width: int, dtype: np.dtype):
+        self._data = np.empty((max(capacity, 1), width), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, rows: np.ndarray):
+        end = self._size + rows.shape[0]
+        if end > self._data.shape[0]:
+            grown = np.empty((max(end, 2 * self._data.shape[0]), self._data.shape[1]), dtype=self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+        self._data[self._size : end] = rows
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        """the filled rows, a contiguous view without a copy"""
+        return self._data[: self._size]
+
+
+def _fan_triangulate(flat: np.ndarray, counts: np.ndarray, dtype: np.dtype = None) -> np.ndarray:
+    """(T, 3) triangles (v0, vi, vi+1) of polygons stored one after another in flat"""
+    if np.any(counts < 3):
+        raise ValueError("faces need at least 3 vertices")
+    starts = np.cumsum(counts) - counts
+    n_tri = counts - 2
+    owner = np.repeat(np.arange(counts.shape[0]), n_tri)
+    local = np.arange(owner.shape[0]) - np.repeat(np.cumsum(n_tri) - n_tri, n_tri)
+    first = starts[owner]
+    tri = np.empty((owner.shape[0], 3), dtype=flat.dtype if dtype is None else dtype)
+    tri[:, 0] = flat[first]
+    tri[:, 1] = flat[first + 1 + local]
+    tri[:, 2] = flat[first + 2 + local]
+    return tri
+
+
+def _parse_obj_chunk(lines: "list[bytes]", n_vertices: int) -> (np.ndarray, np.ndarray):
+    """vertices and 0-based triangles of a chunk, n_vertices precede the chunk"""
+    v_lines = []
+    f_lines = []
+    # vertices before every face line resolve negative indices
+    f_base = []
+    for line in lines:
+        if line[:2] == b"v ":
+            v_lines.append(line[2:])
+        elif line[:2] == b"f ":
+            f_lines.append(_OBJ_REFS.sub(b"", line[2:]))
+            f_base.append(n_vertices + len(v_lines))
+    vertices = np.empty((0, 3))
+    if v_lines:
+        values = np.array(b" ".join(v_lines).split(), dtype=np.float64)
+        # an optional w or colors may follow x, y and z on any line
+        widths = np.array([len(line.split()) for line in v_lines])
+        if np.any(widths < 3):
+            raise ValueError("vertices need x, y and z")
+        starts = np.cumsum(widths) - widths
+        vertices = values[starts[:, np.newaxis] + np.arange(3)]
+    triangles = np.empty((0, 3), dtype=np.int64)
+    if f_lines:
+        counts = np.array([len(line.split()) for line in f_lines])
+        flat = np.array(b" ".join(f_lines).split(), dtype=np.int64)
+        base = np.repeat(np.array(f_base, dtype=np.int64), counts)
+        flat = np.where(flat < 0, flat + base, flat - 1)
+        triangles = _fan_triangulate(flat, counts)
+    return vertices, triangles
+
+
+def load_obj(
+    path: "str | os.PathLike",
+    dtype: np.dtype = np.float32,
+    index_dtype: np.dtype = np.int32,
+    chunk_bytes: int = None,
+) -> MeshData:
+    """Loads the vertices and faces of an OBJ file in chunks.
+
+    Texture coordinates, normals and groups are skipped, OBJ normals are
+    indexed per corner and do not fit the per vertex normal buffer.
+    """
+    chunk_bytes = CHUNK_BYTES if chunk_bytes is None else chunk_bytes
+    if not isinstance(chunk_bytes, int) or chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be a positive int")
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    # about 30 bytes per vertex line and twice as many faces as vertices
+    vertices = _GrowingBuffer(size // 90, 3, dtype)
+    triangles = _GrowingBuffer(size // 45, 3, index_dtype)
+    with open(path, "rb") as f:
+        rest = b""
+        while True:
+            data = f.read(chunk_bytes)
+            block = rest + data
+            if data:
+                cut = block.rfind(b"\n") + 1
+                block, rest = block[:cut], block[cut:]
+            if block:
+                v, t = _parse_obj_chunk(block.splitlines(), len(vertices))
+                vertices.extend(v)
+                triangles.extend(t)
+            if not data:
+                break
+    tri = triangles.view()
+    if tri.size and (tri.min() < 0 or tri.max() >= len(vertices)):
+        raise ValueError("face index out of range")
+    if len(vertices) > np.iinfo(index_dtype).max:
+        raise ValueError("index_dtype cannot address all vertices")
+    return MeshData(vertices.view(), tri, None, size, time.perf_counter() - start)
+
+
+def _read_ply_header(f) -> (str, list, int):
+    """format, [(name, count, properties)] and the size of the header"""
+    if f.readline().strip() != b"ply":
+        raise ValueError("not a PLY file")
+    fmt = None
+    elements = []
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("PLY header has no end_header")
+        words = line.split()
+        if not words or words[0] in (b"comment", b"obj_info"):
+            continue
+        if words[0] == b"end_header":
+            return fmt, elements, f.tell()
+        if words[0] == b"format":
+            fmt = words[1].decode()
+        elif words[0] == b"element":
+            elements.append((words[1].decode(), int(words[2]), []))
+        elif words[0] == b"property":
+            if words[1] == b"list":
+                prop = (words[4].decode(), _PLY_TYPES[words[2]], _PLY_TYPES[words[3]])
+            else:
+                prop = (words[2].decode(), _PLY_TYPES[words[1]], None)
+            elements[-1][2].append(prop)
+
+
+def _face_block(
+    path, offset: int, count: int, props: list, order: str, index_dtype: np.dtype
+) -> (np.ndarray, int):
+    """contiguous (F, 3) triangles of a face element and its size in bytes
+
+    Faces are decoded in runs of equal polygon size, each run is a slice of
+    records mapped at once. A run ends at the first face whose count
+    differs, the next one starts there with that face's record layout.
+    """
+    lists = [i for i, p in enumerate(props) if p[2] is not None]
+    if len(lists) != 1:
+        raise ValueError("faces need a single vertex index list")
+    name, count_type, index_type = props[lists[0]]
+    pre = [(p[0], order + p[1]) for p in props[: lists[0]]]
+    post = [(p[0], order + p[1]) for p in props[lists[0] + 1 :]]
+    if count == 0:
+        return np.zeros((0, 3), dtype=index_dtype), 0
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=offset)
+    head = np.dtype(pre + [("n", order + count_type)])
+    polygons, sizes = [], []
+    pos = done = 0
+    run = 64
+    while done < count:
+        if pos + head.itemsize > data.shape[0]:
+            raise ValueError("PLY face block is truncated")
+        k = int(np.ndarray((1,), dtype=head, buffer=data, offset=pos)["n"][0])
+        record = np.dtype(pre + [("n", order + count_type), (name, order + index_type, (k,))] + post)
+        m = min(run, count - done, (data.shape[0] - pos) // record.itemsize)
+        if m == 0:
+            raise ValueError("PLY face block is truncated")
+        faces = np.ndarray((m,), dtype=record, buffer=data, offset=pos)
+        same = faces["n"] == k
+        # every record after the first differing count is misaligned
+        m = m if same.all() else int(np.argmin(same))
+        polygons.append(faces[name][:m])
+        sizes.append(np.full(m, k))
+        pos += m * record.itemsize
+        done += m
+        run = 2 * run if m == faces.shape[0] else 64
+    if len(sizes) == 1 and k == 3:
+        return np.array(polygons[0], dtype=index_dtype), pos
+    flat = np.concatenate([p.ravel() for p in polygons])
+    return _fan_triangulate(flat, np.concatenate(sizes), index_dtype), pos
+
+
+def load_ply(path: "str | os.PathLike", index_dtype: np.dtype = np.int32) -> MeshData:
+    """Maps the vertex and face blocks of a binary PLY file.
+
+    Vertex positions are a memory-mapped (V, 3) array when x, y and z are
+    the only vertex properties, otherwise they are gathered from the mapped
+    records. nx, ny and nz become the normals. Faces are read from the
+    mapped block into one contiguous (T, 3) index_dtype array, polygons are
+    fan triangulated.
+    """
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        fmt, elements, offset = _read_ply_header(f)
+    if fmt == "binary_little_endian":
+        order = "<"
+    elif fmt == "binary_big_endian":
+        order = ">"
+    else:
+        raise ValueError(f"only binary PLY files are supported, got {fmt}")
+
+    vertices = normals = indices = None
+    for name, count, props in elements:
+        if name == "face":
+            indices, block = _face_block(path, offset, count, props, order, np.dtype(index_dtype))
+            offset += block
+            continue
+        if any(p[2] is not None for p in props):
+            if vertices is not None and indices is not None:
+                break
+            raise ValueError(f"list properties of element {name} are not supported")
+        record = np.dtype([(p[0], order + p[1]) for p in props])
+        if name == "vertex":
+            names = [p[0] for p in props]
+            if names == ["x", "y", "z"] and len({p[1] for p in props}) == 1:
+                vertices = np.memmap(path, dtype=order + props[0][1], mode="r", offset=offset, shape=(count, 3))
+            else:
+                block = np.memmap(path, dtype=record, mode="r", offset=offset, shape=(count,))
+                vertices = np.column_stack((block["x"], block["y"], block["z"]))
+                if {"nx", "ny", "nz"} <= set(names):
+                    normals = np.column_stack((block["nx"], block["ny"], block["nz"]))
+        offset += count * record.itemsize
+    if vertices is None or indices is None:
+        raise ValueError("PLY file needs vertex and face elements")
+    if vertices.shape[0] > np.iinfo(index_dtype).max:
+        raise ValueError("index_dtype cannot address all vertices")
+    return MeshData(vertices, indices, normals, size, time.perf_counter() - start)
+
+
+def load_mesh(path: "str | os.PathLike", **kwargs) -> MeshData:
+    """loads an .obj or .ply file, kwargs go to load_obj, index_dtype also to load_ply"""
+    ext = os.path.splitext(os.fspath(path))[1].lower()
+    if ext == ".obj":
+        return load_obj(path, **kwargs)
+    if ext == ".ply":
+        return load_ply(path, kwargs.get("index_dtype", np.int32))
+    raise ValueError(f"unsupported mesh format {ext}")
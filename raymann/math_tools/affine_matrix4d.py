@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.math_tools.matrix4d import Matrix4D
+
+
+class AffineMatrix4D(Matrix4D):
+    """A 4x4 matrix whose homogeneous row is fixed to (0, 0, 0, 1).
+
+    rigid marks matrices built only from rotations and translations, their
+    inverse is the transposed rotation with a rotated translation.
+    """
+
+    def __init__(self, mat4: "Matrix4D | np.ndarray | None" = None, rigid: bool = False):
+        super().__init__(mat4)
+        if not isinstance(rigid, bool):
+            raise TypeError("rigid must be bool")
+        if not self.is_affine:
+            raise ValueError("the homogeneous row of an affine matrix must be (0, 0, 0, 1)")
+        self._rigid = rigid
+
+    @property
+    def rigid(self) -> bool:
+        return self._rigid
+
+    @property
+    def linear(self) -> np.ndarray:
+        """the upper left 3x3 block"""
+        return self._data[:3, :3]
+
+    @property
+    def translation(self) -> np.ndarray:
+        """the translation column"""
+        return self._data[:3, 3]
+
+    def _compute_inverse(self) -> "AffineMatrix4D":
+        if self._rigid:
+            inv = np.identity(4, float)
+            inv[:3, :3] = self.linear.T
+            inv[:3, 3] = -inv[:3, :3] @ self.translation
+        else:
+            inv = self._affine_inverse(self.linear, self.translation)
+        return AffineMatrix4D(inv, rigid=self._rigid)
+
+    def _mul(self, other):
+        if isinstance(other, AffineMatrix4D):
+            res = np.identity(4, float)
+            res[:3, :3] = self.linear @ other.linear
+            res[:3, 3] = self.linear @ other.translation + self.translation
+            return AffineMatrix4D(res, rigid=self._rigid and other._rigid)
+        return super()._mul(other)
+
+    def __setitem__(self, key: (int, int), value: int | float):
+        if isinstance(key, tuple) and key[0] == 3:
+            raise ValueError("the homogeneous row of an affine matrix is fixed")
+        super().__setitem__(key, value)
+        self._rigid = False
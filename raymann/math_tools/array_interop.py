@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+_BINARY = {
+    np.add: ("__add__", "__radd__"),
+    np.subtract: ("__sub__", "__rsub__"),
+    np.multiply: ("__mul__", "__rmul__"),
+}
+_UNARY = {np.negative: "__neg__", np.absolute: "__abs__"}
+
+
+def _unwrap(x):
+    if isinstance(x, np.ndarray) or not hasattr(x, "__array__"):
+        return x
+    return np.asarray(x)
+
+
+def array_ufunc(obj, ufunc, method: str, inputs: tuple, kwargs: dict):
+    """__array_ufunc__ shared by the 3D vector types.
+
+    Plain calls that mirror an operator (np.abs(v), 2.0 * v with a numpy
+    scalar, ...) go through the type's own operator and keep its result
+    type. Anything else, e.g. mixing with arrays, runs on the buffers and
+    returns plain ndarrays.
+    """
+    if method == "__call__" and not kwargs:
+        if len(inputs) == 1 and ufunc in _UNARY:
+            return getattr(obj, _UNARY[ufunc])()
+        if len(inputs) == 2 and ufunc in _BINARY:
+            a, b = inputs
+            if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray):
+                forward, reflected = _BINARY[ufunc]
+                if a is obj:
+                    return getattr(obj, forward)(b)
+                return getattr(obj, reflected)(a)
+    inputs = tuple(_unwrap(x) for x in inputs)
+    if "out" in kwargs:
+        kwargs["out"] = tuple(_unwrap(x) for x in kwargs["out"])
+    return getattr(ufunc, method)(*inputs, **kwargs)
@@ -0,0 +1,341 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import math
+
+import numpy as np
+
+from raymann.common import validation
+from raymann.math_tools.array_interop import array_ufunc
+
+_NUMBER = (int, float, np.float64)
+
+
+class _Compact3D:
+    """Shared storage of the compact 3D types: three floats in __slots__.
+
+    The coordinates are not held in a buffer, so unlike the ndarray backed
+    types there is no data, from_buffer or __buffer__ and every array made
+    from a compact object is a copy.
+    """
+
+    __slots__ = ("_x", "_y", "_z")
+
+    def _set(self, args: tuple, kind: str):
+        if len(args) == 3:
+            if not validation.CHECKED or all(isinstance(val, (int, float, str, np.float64)) for val in args):
+                self._x = float(args[0])
+                self._y = float(args[1])
+                self._z = float(args[2])
+            else:
+                raise TypeError("float,int or str must be provided for x,y,z")
+        elif len(args) == 0:
+            self._x = self._y = self._z = 0.0
+        else:
+            raise TypeError(f"Unknown type for {kind} initialization")
+
+    @classmethod
+    def _new(cls, x: float, y: float, z: float):
+        obj = object.__new__(cls)
+        obj._x = x
+        obj._y = y
+        obj._z = z
+        return obj
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, val: int | float):
+        if validation.CHECKED and not isinstance(val, (int, float)):
+            raise TypeError("float or int must be provided")
+        self._x = float(val)
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, val: int | float):
+        if validation.CHECKED and not isinstance(val, (int, float)):
+            raise TypeError("float or int must be provided")
+        self._y = float(val)
+
+    @property
+    def z(self) -> float:
+        return self._z
+
+    @z.setter
+    def z(self, val: int | float):
+        if validation.CHECKED and not isinstance(val, (int, float)):
+            raise TypeError("float or int must be provided")
+        self._z = float(val)
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """returns the coordinates as a new numpy array"""
+        return np.array([self._x, self._y, self._z])
+
+    @coordinates.setter
+    def coordinates(self, data: np.ndarray):
+        if not (isinstance(data, (np.ndarray, list)) and len(data) == 3):
+            raise TypeError("A numpy array must be provided")
+        self._x = float(data[0])
+        self._y = float(data[1])
+        self._z = float(data[2])
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy is False:
+            raise ValueError("a compact object has no buffer, an array of it is always a copy")
+        return np.array([self._x, self._y, self._z], dtype=dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return array_ufunc(self, ufunc, method, inputs, kwargs)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__.removeprefix('Compact')}({self._x}, {self._y}, {self._z})"
+
+    def __iadd__(self, other):
+        return self._store(self._add(other), self)
+
+    def __isub__(self, other):
+        return self._store(self._sub(other), self)
+
+    def __imul__(self, other):
+        return self._store(self._mul(other), self)
+
+    def add(self, other: "int | float | _Compact3D", out: "_Compact3D | None" = None) -> "_Compact3D":
+        """self + other, written into out when it is given"""
+        return self._store(self._add(other), out)
+
+    def sub(self, other: "int | float | _Compact3D", out: "_Compact3D | None" = None) -> "_Compact3D":
+        """self - other, written into out when it is given"""
+        return self._store(self._sub(other), out)
+
+    def mul(self, other: "int | float | _Compact3D", out: "_Compact3D | None" = None) -> "_Compact3D":
+        """self * other, written into out when it is given"""
+        return self._store(self._mul(other), out)
+
+    @staticmethod
+    def _store(res: "_Compact3D", out: "_Compact3D | None") -> "_Compact3D":
+        """copies res into out, which must have the result type like the ndarray backed out= methods"""
+        if out is None:
+            return res
+        if type(out) is not type(res):
+            raise TypeError(f"the result is {type(res).__name__.removeprefix('Compact')}, out must have that type")
+        out._x, out._y, out._z = res._x, res._y, res._z
+        return out
+
+
+class CompactVector3D(_Compact3D):
+    __slots__ = ()
+
+    def __init__(self, *args):
+        self._set(args, "Vector3D")
+
+    def __eq__(self, other):
+        return self._eq(other)
+
+    def _eq(self, other: "CompactVector3D") -> bool:
+        if isinstance(other, CompactVector3D):
+            return self._x == other._x and self._y == other._y and self._z == other._z
+        else:
+            raise TypeError("cannot compare Vector3D with another type")
+
+    def __add__(self, other):
+        return self._add(other)
+
+    def __radd__(self, other):
+        return self._add(other)
+
+    def _add(self, other: "int | float | CompactVector3D") -> "CompactVector3D":
+        if isinstance(other, CompactVector3D):
+            return CompactVector3D._new(self._x + other._x, self._y + other._y, self._z + other._z)
+        if isinstance(other, _NUMBER):
+            return CompactVector3D._new(self._x + other, self._y + other, self._z + other)
+        raise TypeError("cannot add Vector3D to another type")
+
+    def __sub__(self, other):
+        return self._sub(other)
+
+    def __rsub__(self, other):
+        return self._sub(other)
+
+    def _sub(self, other: "int | float | CompactVector3D") -> "CompactVector3D":
+        if isinstance(other, CompactVector3D):
+            return CompactVector3D._new(self._x - other._x, self._y - other._y, self._z - other._z)
+        if isinstance(other, _NUMBER):
+            return CompactVector3D._new(self._x - other, self._y - other, self._z - other)
+        raise TypeError("cannot do subtraction between Vector3D and another type")
+
+    def __mul__(self, other):
+        return self._mul(other)
+
+    def __rmul__(self, other):
+        return self._mul(other)
+
+    def _mul(self, other: "int | float | CompactVector3D") -> "CompactVector3D":
+        if isinstance(other, _NUMBER):
+            return CompactVector3D._new(self._x * other, self._y * other, self._z * other)
+        if isinstance(other, CompactVector3D):
+            return CompactVector3D._new(self._x * other._x, self._y * other._y, self._z * other._z)
+        raise TypeError("cannot do multiplication between Vector3D and another type")
+
+    def __neg__(self) -> "CompactVector3D":
+        return CompactVector3D._new(-self._x, -self._y, -self._z)
+
+    def __abs__(self) -> "CompactVector3D":
+        return CompactVector3D._new(abs(self._x), abs(self._y), abs(self._z))
+
+    def length(self) -> float:
+        """length of a 3D vector"""
+        return math.sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+
+    def normalized(self) -> "CompactVector3D":
+        """returns the normalized vector"""
+        length = self.length()
+        return CompactVector3D._new(self._x / length, self._y / length, self._z / length)
+
+
+class CompactPoint3D(_Compact3D):
+    __slots__ = ()
+
+    def __init__(self, *args):
+        self._set(args, "Point3D")
+
+    def __eq__(self, other):
+        return self._eq(other)
+
+    def _eq(self, other: "CompactPoint3D") -> bool:
+        if not isinstance(other, (CompactVector3D, CompactPoint3D)):
+            raise TypeError("cannot compare Point3D with another type")
+        return self._x == other._x and self._y == other._y and self._z == other._z
+
+    def __add__(self, other):
+        return self._add(other)
+
+    def __radd__(self, other):
+        return self._add(other)
+
+    def _add(self, other: "int | float | CompactVector3D | CompactPoint3D") -> "CompactPoint3D | CompactVector3D":
+        if isinstance(other, _NUMBER):
+            return CompactPoint3D._new(self._x + other, self._y + other, self._z + other)
+        elif isinstance(other, CompactVector3D):
+            return CompactVector3D._new(self._x + other._x, self._y + other._y, self._z + other._z)
+        elif isinstance(other, CompactPoint3D):
+            return CompactPoint3D._new(self._x + other._x, self._y + other._y, self._z + other._z)
+        else:
+            raise TypeError("Unknown type for Point3D addition")
+
+    def __sub__(self, other):
+        return self._sub(other)
+
+    def __rsub__(self, other):
+        return self._sub(other)
+
+    def _sub(self, other: "int | float | CompactVector3D | CompactPoint3D") -> "CompactPoint3D | CompactVector3D":
+        if isinstance(other, _NUMBER):
+            return CompactPoint3D._new(self._x - other, self._y - other, self._z - other)
+        elif isinstance(other, CompactPoint3D):
+            return CompactVector3D._new(self._x - other._x, self._y - other._y, self._z - other._z)
+        elif isinstance(other, CompactVector3D):
+            return CompactPoint3D._new(self._x - other._x, self._y - other._y, self._z - other._z)
+        else:
+            raise TypeError("Unknown type for Point3D subtraction")
+
+    def __mul__(self, other):
+        return self._mul(other)
+
+    def __rmul__(self, other):
+        return self._mul(other)
+
+    def _mul(self, other: "int | float | CompactPoint3D") -> "CompactPoint3D":
+        if isinstance(other, _NUMBER):
+            return CompactPoint3D._new(self._x * other, self._y * other, self._z * other)
+        elif isinstance(other, CompactPoint3D):
+            return CompactPoint3D._new(self._x * other._x, self._y * other._y, self._z * other._z)
+        else:
+            raise TypeError("unknown type for Point3D multiplication")
+
+    def __neg__(self) -> "CompactPoint3D":
+        return CompactPoint3D._new(-self._x, -self._y, -self._z)
+
+    def __abs__(self) -> "CompactPoint3D":
+        return CompactPoint3D._new(abs(self._x), abs(self._y), abs(self._z))
+
+
+class CompactNormal3D(_Compact3D):
+    __slots__ = ()
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            if isinstance(args[0], (CompactPoint3D, CompactVector3D)):
+                self._x, self._y, self._z = args[0]._x, args[0]._y, args[0]._z
+            else:
+                raise TypeError("must be Point3D or Vector3D")
+        else:
+            self._set(args, "Normal3D")
+
+    def __eq__(self, other):
+        return self._eq(other)
+
+    def _eq(self, other: "CompactNormal3D") -> bool:
+        if isinstance(other, CompactNormal3D):
+            return self._x == other._x and self._y == other._y and self._z == other._z
+        else:
+            raise TypeError("cannot compare Normal3D with another type")
+
+    def __add__(self, other):
+        return self._add(other)
+
+    def __radd__(self, other):
+        return self._add(other)
+
+    def _add(self, other: "int | float | CompactNormal3D") -> "CompactNormal3D":
+        if isinstance(other, CompactNormal3D):
+            return CompactNormal3D._new(self._x + other._x, self._y + other._y, self._z + other._z)
+        if isinstance(other, _NUMBER):
+            return CompactNormal3D._new(self._x + other, self._y + other, self._z + other)
+        raise TypeError("cannot add Normal3D to another type")
+
+    def __sub__(self, other):
+        return self._sub(other)
+
+    def __rsub__(self, other):
+        return self._sub(other)
+
+    def _sub(self, other: "int | float | CompactNormal3D") -> "CompactNormal3D":
+        if isinstance(other, CompactNormal3D):
+            return CompactNormal3D._new(self._x - other._x, self._y - other._y, self._z - other._z)
+        if isinstance(other, _NUMBER):
+            return CompactNormal3D._new(self._x - other, self._y - other, self._z - other)
+        raise TypeError("cannot do subtraction between Normal3D and another type")
+
+    def __mul__(self, other):
+        return self._mul(other)
+
+    def __rmul__(self, other):
+        return self._mul(other)
+
+    def _mul(self, other: "int | float | CompactNormal3D") -> "CompactNormal3D":
+        if isinstance(other, _NUMBER):
+            return CompactNormal3D._new(self._x * other, self._y * other, self._z * other)
+        if isinstance(other, CompactNormal3D):
+            return CompactNormal3D._new(self._x * other._x, self._y * other._y, self._z * other._z)
+        raise TypeError("cannot do multiplication between Normal3D and another type")
+
+    def __neg__(self) -> "CompactNormal3D":
+        return CompactNormal3D._new(-self._x, -self._y, -self._z)
+
+    def __abs__(self) -> "CompactNormal3D":
+        return CompactNormal3D._new(abs(self._x), abs(self._y), abs(self._z))
+
+    def length(self) -> float:
+        """length of a 3D vector"""
+        return math.sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+
+    def normalized(self) -> "CompactNormal3D":
+        """returns the normalized vector"""
+        length = self.length()
+        return CompactNormal3D._new(self._x / length, self._y / length, self._z / length)
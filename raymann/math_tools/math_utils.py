@@ -3,6 +3,9 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.common import validation
+from raymann.math_tools.affine_matrix4d import AffineMatrix4D
+from raymann.math_tools.compact3d import CompactVector3D
 from raymann.math_tools.matrix4d import Matrix4D
 from raymann.math_tools.vector3d import Vector3D
 from raymann.math_tools.vector2d import Vector2D
@@ -17,41 +20,67 @@ def dot(elem1: Vector2D | Vector3D | Vector4D, elem2: Vector2D | Vector3D | Vect
         or (isinstance(elem1, Vector3D) and isinstance(elem2, Vector3D))
         or (isinstance(elem1, Vector4D) and isinstance(elem2, Vector4D))
     ):
-        return np.dot(elem1.coordinates, elem2.coordinates)
+        return np.dot(elem1._data, elem2._data)
+    elif isinstance(elem1, CompactVector3D) and isinstance(elem2, CompactVector3D):
+        return elem1._x * elem2._x + elem1._y * elem2._y + elem1._z * elem2._z
     else:
         raise TypeError("Cannot calculate the dot product of the given elements!")
 
 
-def cross(elem1: Vector2D | Vector3D | Vector4D, elem2: Vector2D | Vector3D | Vector4D):
-    """cross product of two math entities"""
+def cross(
+    elem1: Vector2D | Vector3D | Vector4D,
+    elem2: Vector2D | Vector3D | Vector4D,
+    out: Vector3D | None = None,
+):
+    """cross product of two math entities, written into out for Vector3D if given"""
+    if out is not None:
+        return cross_into(elem1, elem2, out)
     if isinstance(elem1, Vector2D) and isinstance(elem2, Vector2D):
         new_data = np.cross(elem1.coordinates, elem2.coordinates)
         ret = Vector2D()
         ret.coordinates = new_data
         return ret
     elif isinstance(elem1, Vector3D) and isinstance(elem2, Vector3D):
-        new_data = np.cross(elem1.coordinates, elem2.coordinates)
-        ret = Vector3D()
-        ret.coordinates = new_data
-        return ret
+        return Vector3D._from_array(np.cross(elem1._data, elem2._data))
     elif isinstance(elem1, Vector4D) and isinstance(elem2, Vector4D):
         new_data = np.cross(elem1.coordinates, elem2.coordinates)
         ret = Vector4D()
         ret.coordinates = new_data
         return ret
+    elif isinstance(elem1, CompactVector3D) and isinstance(elem2, CompactVector3D):
+        return CompactVector3D._new(
+            elem1._y * elem2._z - elem1._z * elem2._y,
+            elem1._z * elem2._x - elem1._x * elem2._z,
+            elem1._x * elem2._y - elem1._y * elem2._x,
+        )
     else:
         raise TypeError("Cannot calculate the cross product of the given elements!")
 
 
-def identity_matrix() -> Matrix4D:
-    return Matrix4D(np.identity(4))
+def cross_into(elem1: Vector3D, elem2: Vector3D, out: Vector3D) -> Vector3D:
+    """non-allocating cross product of two Vector3D, out may alias an operand"""
+    if validation.CHECKED and not (
+        isinstance(elem1, Vector3D)
+        and isinstance(elem2, Vector3D)
+        and isinstance(out, Vector3D)
+    ):
+        raise TypeError("Cannot calculate the cross product of the given elements!")
+    ax, ay, az = elem1._data
+    bx, by, bz = elem2._data
+    res = out._data
+    res[0], res[1], res[2] = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+    return out
+
+
+def identity_matrix() -> AffineMatrix4D:
+    return AffineMatrix4D(np.identity(4), rigid=True)
 
 
 def zero_matrix() -> Matrix4D:
     return Matrix4D(np.zeros((4, 4)))
 
 
-def translation_matrix(x: int | float, y: int | float, z: int | float) -> Matrix4D:
+def translation_matrix(x: int | float, y: int | float, z: int | float) -> AffineMatrix4D:
     if (
         isinstance(x, (int, float))
         and isinstance(y, (int, float))
@@ -61,12 +90,12 @@ def translation_matrix(x: int | float, y: int | float, z: int | float) -> Matrix
         m[0, 3] = x
         m[1, 3] = y
         m[2, 3] = z
-        return Matrix4D(m)
+        return AffineMatrix4D(m, rigid=True)
     else:
         raise TypeError("unknown input type for translation matrix")
 
 
-def scale_matrix(x: int | float, y: int | float, z: int | float) -> Matrix4D:
+def scale_matrix(x: int | float, y: int | float, z: int | float) -> AffineMatrix4D:
     if (
         isinstance(x, (int, float))
         and isinstance(y, (int, float))
@@ -76,48 +105,48 @@ def scale_matrix(x: int | float, y: int | float, z: int | float) -> Matrix4D:
         m[0, 0] = x
         m[1, 1] = y
         m[2, 2] = z
-        return Matrix4D(m)
+        return AffineMatrix4D(m, rigid=False)
     else:
         raise TypeError("unknown input type for scale matrix")
 
 
-def x_rot_matrix(rad: int | float) -> Matrix4D:
+def x_rot_matrix(rad: int | float) -> AffineMatrix4D:
     if isinstance(rad, (int, float)):
         m = np.identity(4)
         m[1, 1] = np.cos(rad)
         m[1, 2] = -np.sin(rad)
         m[2, 1] = np.sin(rad)
         m[2, 2] = np.cos(rad)
-        return Matrix4D(m)
+        return AffineMatrix4D(m, rigid=True)
     else:
         raise TypeError("unknown input type for rotation matrix")
 
 
-def y_rot_matrix(rad: int | float) -> Matrix4D:
+def y_rot_matrix(rad: int | float) -> AffineMatrix4D:
     if isinstance(rad, (int, float)):
         m = np.identity(4)
         m[0, 0] = np.cos(rad)
         m[0, 2] = np.sin(rad)
         m[2, 0] = -np.sin(rad)
         m[2, 2] = np.cos(rad)
-        return Matrix4D(m)
+        return AffineMatrix4D(m, rigid=True)
     else:
         raise TypeError("unknown input type for rotation matrix")
 
 
-def z_rot_matrix(rad: int | float) -> Matrix4D:
+def z_rot_matrix(rad: int | float) -> AffineMatrix4D:
     if isinstance(rad, (int, float)):
         m = np.identity(4)
         m[0, 0] = np.cos(rad)
         m[0, 1] = -np.sin(rad)
         m[1, 0] = np.sin(rad)
         m[1, 1] = np.cos(rad)
-        return Matrix4D(m)
+        return AffineMatrix4D(m, rigid=True)
     else:
         raise TypeError("unknown input type for rotation matrix")
 
 
-def view_transform(self, from_v: Vector3D, to_v: Vector3D, up_v: Vector3D) -> Matrix4D:
+def view_transform(self, from_v: Vector3D, to_v: Vector3D, up_v: Vector3D) -> AffineMatrix4D:
     if (
         not isinstance(from_v, Vector3D)
         or not isinstance(to_v, Vector3D)
@@ -138,7 +167,7 @@ def view_transform(self, from_v: Vector3D, to_v: Vector3D, up_v: Vector3D) -> Ma
         ]
     )
 
-    return Matrix4D(m) * translation_matrix(-from_v.x, -from_v.y, -from_v.z)
+    return AffineMatrix4D(m, rigid=True) * translation_matrix(-from_v.x, -from_v.y, -from_v.z)
 
 def cosine_sample_hemisphere(u:Vector2D) -> Vector3D:
     if not isinstance(u, Vector2D):
@@ -3,16 +3,30 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.math_tools.compact3d import CompactNormal3D, CompactPoint3D, CompactVector3D
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.vector4d import Vector4D
 from raymann.math_tools.vector3d import Vector3D
 from raymann.math_tools.point3d import Point3D
 
 
+def _inverse_3x3(m: np.ndarray) -> np.ndarray:
+    """closed form inverse of a 3x3 matrix through its cofactors"""
+    r0, r1, r2 = m[0], m[1], m[2]
+    c0 = np.cross(r1, r2)
+    det = np.dot(r0, c0)
+    if det == 0.0:
+        raise np.linalg.LinAlgError("Singular matrix")
+    return np.array([c0, np.cross(r2, r0), np.cross(r0, r1)]).T / det
+
+
 class Matrix4D:
     def __init__(self, mat4: "Matrix4D | np.ndarray | None" = None):
+        self._inverse_cache = None
+        self._inverse_transpose_cache = None
         if isinstance(mat4, Matrix4D):
-            self._data = mat4._data
+            # a copy, writes to either matrix must not reach the other or its cached inverse
+            self._data = mat4._data.copy()
         elif isinstance(mat4, np.ndarray):
             self._data = mat4
         elif mat4 is None:
@@ -20,22 +34,64 @@ class Matrix4D:
         else:
             raise TypeError("Unknown type for Matrix4D initialization")
 
+    @classmethod
+    def with_inverse(cls, mat4: np.ndarray, inverse: np.ndarray) -> "Matrix4D":
+        """a matrix whose inverse is known, e.g. both read from a baked scene"""
+        mat = cls(mat4)
+        mat._inverse_cache = cls(inverse)
+        mat._inverse_cache._data.flags.writeable = False
+        return mat
+
     @property
     def data(self) -> np.ndarray:
+        """the underlying (4, 4) array, writes through it bypass the inverse cache, use __setitem__"""
         return self._data
 
     @property
     def determinant(self) -> float:
         return np.linalg.det(self._data)
 
+    @property
+    def is_affine(self) -> bool:
+        """True if the homogeneous row is (0, 0, 0, 1)"""
+        d = self._data
+        return d[3, 0] == 0.0 and d[3, 1] == 0.0 and d[3, 2] == 0.0 and d[3, 3] == 1.0
+
     @property
     def inverse(self) -> "Matrix4D":
-        return Matrix4D(np.linalg.inv(self._data))
+        """the inverse, computed once and cached until the matrix is modified"""
+        if self._inverse_cache is None:
+            self._inverse_cache = self._compute_inverse()
+            self._inverse_cache._data.flags.writeable = False
+        return self._inverse_cache
+
+    @property
+    def inverse_transpose(self) -> "Matrix4D":
+        """the transposed inverse used for normals, cached like the inverse"""
+        if self._inverse_transpose_cache is None:
+            self._inverse_transpose_cache = self.inverse.transpose
+        return self._inverse_transpose_cache
 
     @property
     def transpose(self) -> "Matrix4D":
         return Matrix4D(np.transpose(self._data))
 
+    def _compute_inverse(self) -> "Matrix4D":
+        if self.is_affine:
+            return Matrix4D(self._affine_inverse(self._data[:3, :3], self._data[:3, 3]))
+        return Matrix4D(np.linalg.inv(self._data))
+
+    @staticmethod
+    def _affine_inverse(linear: np.ndarray, translation: np.ndarray) -> np.ndarray:
+        inv = np.identity(4, float)
+        inv[:3, :3] = _inverse_3x3(linear)
+        inv[:3, 3] = -inv[:3, :3] @ translation
+        return inv
+
+    def _invalidate(self):
+        self._inverse_cache = None
+        self._inverse_transpose_cache = None
+
     def __eq__(self, other):
         return self._eq(other)
 
@@ -87,23 +143,65 @@ class Matrix4D:
         if isinstance(other, Matrix4D):
             return Matrix4D(np.matmul(self._data, other._data))
         elif isinstance(other, Vector4D):
-            res = np.matmul(self._data, other.coordinates.reshape(4, 1))
-            return Vector4D(res[0, 0], res[1, 0], res[2, 0], res[3, 0])
+            return Vector4D._from_array(self._data @ other._data)
         elif isinstance(other, Vector3D):
-            v4 = Vector4D(other)
-            res = np.matmul(self._data, v4.coordinates.reshape(4, 1))
-            return Vector3D(res[0, 0], res[1, 0], res[2, 0])
+            return Vector3D._from_array(self._data[:3, :3] @ other._data)
         elif isinstance(other, Point3D):
-            v4 = Vector4D(other)
-            res = np.matmul(self._data, v4.coordinates.reshape(4, 1))
-            return Point3D(res[0, 0], res[1, 0], res[2, 0])
+            # the homogeneous row is never needed for the 3D result
+            return Point3D._from_array(self._data[:3, :3] @ other._data + self._data[:3, 3])
         elif isinstance(other, Normal3D):
-            v4 = Vector4D(other)
-            res = np.matmul(self._data, v4.coordinates.reshape(4, 1))
-            return Normal3D(res[0, 0], res[1, 0], res[2, 0])
+            return Normal3D._from_array(self._data[:3, :3] @ other._data)
+        elif isinstance(other, (CompactVector3D, CompactPoint3D, CompactNormal3D)):
+            r0, r1, r2 = self._data[:3].tolist()
+            x, y, z = other._x, other._y, other._z
+            rx = r0[0] * x + r0[1] * y + r0[2] * z
+            ry = r1[0] * x + r1[1] * y + r1[2] * z
+            rz = r2[0] * x + r2[1] * y + r2[2] * z
+            if isinstance(other, CompactPoint3D):
+                rx += r0[3]
+                ry += r1[3]
+                rz += r2[3]
+            return type(other)._new(rx, ry, rz)
         else:
             raise TypeError("Unknown type for matrix multiplication")
 
+    def transform_points(
+        self, points: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """transforms an (N, 3) array of points (w=1) in one matmul"""
+        points = self._check_array3(points, out)
+        out = np.matmul(points, self._data[:3, :3].T, out=out)
+        out += self._data[:3, 3]
+        return out
+
+    def transform_vectors(
+        self, vectors: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """transforms an (N, 3) array of vectors (w=0) in one matmul"""
+        vectors = self._check_array3(vectors, out)
+        return np.matmul(vectors, self._data[:3, :3].T, out=out)
+
+    def transform_normals(
+        self, normals: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """transforms an (N, 3) array of normals with the inverse transpose"""
+        normals = self._check_array3(normals, out)
+        # n @ inv[:3, :3] is the row vector form of inv^T * n
+        return np.matmul(normals, self.inverse._data[:3, :3], out=out)
+
+    @staticmethod
+    def _check_array3(arr: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+        if not isinstance(arr, np.ndarray):
+            raise TypeError("an (N, 3) numpy array must be provided")
+        if arr.ndim != 2 or arr.shape[1] != 3:
+            raise ValueError("array must have shape (N, 3)")
+        if out is not None:
+            if not isinstance(out, np.ndarray):
+                raise TypeError("out must be a numpy array")
+            if out.shape != arr.shape or out.dtype != np.float64:
+                raise ValueError("out must be a float64 array of the input's shape")
+        return arr
+
     def __neg__(self) -> "Matrix4D":
         return Matrix4D(-self._data)
 
@@ -128,6 +226,7 @@ class Matrix4D:
             row, col = key
             if row >= 0 and row <= 3 and col >= 0 and col <= 3:
                 self._data[row, col] = value
+                self._invalidate()
             else:
                 raise IndexError("index out of bound")
         else:
@@ -3,28 +3,52 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.common import validation
+from raymann.math_tools.array_interop import array_ufunc
 from raymann.math_tools.vector3d import Vector3D
 
 
 class Point3D:
     def __init__(self, *args):
         if len(args) == 3:
-            if all(isinstance(val, (int, float, str, np.float64)) for val in args):
+            if not validation.CHECKED or all(
+                isinstance(val, (int, float, str, np.float64)) for val in args
+            ):
                 self._data = np.array([args[0], args[1], args[2]], dtype=np.float64)
             else:
                 raise TypeError("float,int or str must be provided for x,y,z")
         elif len(args) == 0:
-            self._data = np.array([0, 0, 0])
+            self._data = np.zeros(3)
         else:
             raise TypeError("Unknown type for Point3D initialization")
 
+    @classmethod
+    def _from_array(cls, data: np.ndarray) -> "Point3D":
+        """trusted constructor, wraps a float64 array without validation"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    @classmethod
+    def from_buffer(cls, buffer: np.ndarray, index: int | None = None) -> "Point3D":
+        """wraps a (3,) float64 array or the row index of an (N, 3) one without copying"""
+        if not isinstance(buffer, np.ndarray) or buffer.dtype != np.float64:
+            raise TypeError("a float64 numpy array must be provided")
+        if index is not None:
+            if buffer.ndim != 2 or buffer.shape[1] != 3:
+                raise ValueError("buffer must have shape (N, 3) when an index is given")
+            buffer = buffer[index]
+        if buffer.shape != (3,):
+            raise ValueError("buffer must have shape (3,)")
+        return cls._from_array(buffer)
+
     @property
     def x(self) -> float:
         return self._data[0]
 
     @x.setter
     def x(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[0] = val
 
@@ -34,7 +58,7 @@ class Point3D:
 
     @y.setter
     def y(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[1] = val
 
@@ -44,7 +68,7 @@ class Point3D:
 
     @z.setter
     def z(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[2] = val
 
@@ -57,7 +81,23 @@ class Point3D:
     def coordinates(self, data: np.ndarray):
         if not (isinstance(data, (np.ndarray, list)) and len(data) == 3):
             raise TypeError()
-        self._data = np.array(data)
+        self._data = np.array(data, dtype=np.float64)
+
+    @property
+    def data(self) -> np.ndarray:
+        """the underlying float64 buffer, a view that is not copied"""
+        return self._data
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self._data, dtype=dtype)
+        return self._data if dtype is None else self._data.astype(dtype, copy=False)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._data)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return array_ufunc(self, ufunc, method, inputs, kwargs)
 
     def __eq__(self, other):
         return self._eq(other)
@@ -78,11 +118,11 @@ class Point3D:
 
     def _add(self, other: "int | float | Vector3D | Point3D") -> "Point3D | Vector3D":
         if isinstance(other, (float, int)):
-            return Point3D(*(self._data + other))
+            return Point3D._from_array(self._data + other)
         elif isinstance(other, Vector3D):
-            return Vector3D(*(self._data + other.coordinates))
+            return Vector3D._from_array(self._data + other._data)
         elif isinstance(other, Point3D):
-            return Point3D(*(self._data + other._data))
+            return Point3D._from_array(self._data + other._data)
         else:
             raise TypeError("Unknown type for Point3D addition")
 
@@ -94,11 +134,11 @@ class Point3D:
 
     def _sub(self, other: "int | float | Vector3D | Point3D") -> "Point3D | Vector3D":
         if isinstance(other, (float, int)):
-            return Point3D(*(self._data - other))
+            return Point3D._from_array(self._data - other)
         elif isinstance(other, Point3D):
-            return Vector3D(*np.subtract(self._data, other._data))
+            return Vector3D._from_array(np.subtract(self._data, other._data))
         elif isinstance(other, Vector3D):
-            return Point3D(*np.subtract(self._data, other._data))
+            return Point3D._from_array(np.subtract(self._data, other._data))
         else:
             raise TypeError("Unknown type for Point3D subtraction")
 
@@ -110,17 +150,98 @@ class Point3D:
 
     def _mul(self, other: "int | float | Point3D") -> "Point3D":
         if isinstance(other, (float, int)):
-            return Point3D(*(self._data * other))
+            return Point3D._from_array(self._data * other)
         elif isinstance(other, Point3D):
-            return Point3D(*(self._data * other._data))
+            return Point3D._from_array(self._data * other._data)
         else:
             raise TypeError("unknown type for Point3D multiplication")
 
+    def __iadd__(self, other):
+        if isinstance(other, Point3D):
+            np.add(self._data, other._data, out=self._data)
+        elif isinstance(other, Vector3D):
+            # point + vector is a Vector3D and cannot be stored in place
+            raise TypeError("Unknown type for in-place Point3D addition")
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.add(self._data, other, out=self._data)
+        else:
+            raise TypeError("Unknown type for Point3D addition")
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, Vector3D):
+            np.subtract(self._data, other._data, out=self._data)
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.subtract(self._data, other, out=self._data)
+        else:
+            # point - point is a Vector3D and cannot be stored in place
+            raise TypeError("Unknown type for in-place Point3D subtraction")
+        return self
+
+    def __imul__(self, other):
+        if isinstance(other, Point3D):
+            np.multiply(self._data, other._data, out=self._data)
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.multiply(self._data, other, out=self._data)
+        else:
+            raise TypeError("unknown type for Point3D multiplication")
+        return self
+
+    def add(
+        self, other: "int | float | Vector3D | Point3D", out: "Point3D | Vector3D | None" = None
+    ) -> "Point3D | Vector3D":
+        """self + other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._add(other)
+        if isinstance(other, Vector3D):
+            np.add(self._data, other._data, out=self._out_data(out, Vector3D))
+        elif isinstance(other, Point3D):
+            np.add(self._data, other._data, out=self._out_data(out, Point3D))
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.add(self._data, other, out=self._out_data(out, Point3D))
+        else:
+            raise TypeError("Unknown type for Point3D addition")
+        return out
+
+    def sub(
+        self, other: "int | float | Vector3D | Point3D", out: "Point3D | Vector3D | None" = None
+    ) -> "Point3D | Vector3D":
+        """self - other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._sub(other)
+        if isinstance(other, Point3D):
+            np.subtract(self._data, other._data, out=self._out_data(out, Vector3D))
+        elif isinstance(other, Vector3D):
+            np.subtract(self._data, other._data, out=self._out_data(out, Point3D))
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.subtract(self._data, other, out=self._out_data(out, Point3D))
+        else:
+            raise TypeError("Unknown type for Point3D subtraction")
+        return out
+
+    def mul(self, other: "int | float | Point3D", out: "Point3D | None" = None) -> "Point3D":
+        """self * other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._mul(other)
+        if isinstance(other, Point3D):
+            np.multiply(self._data, other._data, out=self._out_data(out, Point3D))
+        elif not validation.CHECKED or isinstance(other, (float, int)):
+            np.multiply(self._data, other, out=self._out_data(out, Point3D))
+        else:
+            raise TypeError("unknown type for Point3D multiplication")
+        return out
+
+    @staticmethod
+    def _out_data(out: "Point3D | Vector3D", expected: type) -> np.ndarray:
+        if validation.CHECKED and not isinstance(out, expected):
+            raise TypeError(f"out must be {expected.__name__}")
+        return out._data
+
     def __neg__(self) -> "Point3D":
-        return Point3D(*(-self._data))
+        return Point3D._from_array(-self._data)
 
     def __abs__(self) -> "Point3D":
-        return Point3D(*np.abs(self._data))
+        return Point3D._from_array(np.abs(self._data))
 
     def __str__(self) -> str:
         return f"Point3D({self.x}, {self.y}, {self.z})"
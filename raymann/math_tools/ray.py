@@ -2,6 +2,9 @@
 # Licensed under the GNU General Public License v3.
 # See LICENSE file for details.
 import numpy as np
+
+from raymann.common import validation
+from raymann.math_tools.compact3d import CompactPoint3D, CompactVector3D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.vector3d import Vector3D
 
@@ -22,7 +25,10 @@ class Ray:
         ):
             self._origin = Point3D(*origin)
             self._direction = Vector3D(*direction)
-        elif isinstance(origin, Point3D) and isinstance(direction, Vector3D):
+        elif not validation.CHECKED or (
+            isinstance(origin, (Point3D, CompactPoint3D))
+            and isinstance(direction, (Vector3D, CompactVector3D))
+        ):
             self._origin = origin
             self._direction = direction
         else:
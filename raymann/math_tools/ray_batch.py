@@ -0,0 +1,182 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.vector3d import Vector3D
+
+
+class RayBatch:
+    """A structure of arrays holding N rays.
+
+    origins and directions are contiguous (N, 3) float64 arrays, tmin and
+    tmax are (N,) float64 arrays. Scalars given for tmin/tmax are broadcast.
+    The inverse directions and their sign masks used by slab tests are
+    computed on first use and cached. origins and directions are read-only
+    views, so the rays returned by ray(i) cannot change a row behind the
+    cache. Writeable origin and direction arrays are copied, the caller
+    keeps writing to its own array; read-only arrays are used as they are.
+    """
+
+    def __init__(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: "float | np.ndarray" = 0.001,
+        tmax: "float | np.ndarray" = np.inf,
+    ):
+        if not isinstance(origins, (np.ndarray, list)) or not isinstance(
+            directions, (np.ndarray, list)
+        ):
+            raise TypeError("origins and directions must be (N, 3) arrays")
+        self._init(self._owned(origins), self._owned(directions), tmin, tmax)
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: "float | np.ndarray",
+        tmax: "float | np.ndarray",
+    ) -> "RayBatch":
+        """trusted constructor, takes fresh arrays nobody else writes to without a copy"""
+        batch = cls.__new__(cls)
+        batch._init(
+            np.ascontiguousarray(origins, dtype=np.float64),
+            np.ascontiguousarray(directions, dtype=np.float64),
+            tmin,
+            tmax,
+        )
+        return batch
+
+    @staticmethod
+    def _owned(arr: "np.ndarray | list") -> np.ndarray:
+        """contiguous float64 arr, copied if the caller could still write to it"""
+        res = np.ascontiguousarray(arr, dtype=np.float64)
+        if isinstance(arr, np.ndarray) and res.flags.writeable and np.shares_memory(res, arr):
+            res = res.copy()
+        return res
+
+    def _init(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: "float | np.ndarray",
+        tmax: "float | np.ndarray",
+    ):
+        if origins.ndim != 2 or origins.shape[1] != 3:
+            raise ValueError("origins must have shape (N, 3)")
+        if directions.shape != origins.shape:
+            raise ValueError("origins and directions must have the same shape")
+        n = origins.shape[0]
+        self._origins = origins.view()
+        self._origins.flags.writeable = False
+        self._directions = directions.view()
+        self._directions.flags.writeable = False
+        self._tmin = self._as_parameter_array(tmin, n)
+        self._tmax = self._as_parameter_array(tmax, n)
+        self._inv_directions = None
+        self._dir_is_negative = None
+
+    @staticmethod
+    def _as_parameter_array(val: "float | np.ndarray", n: int) -> np.ndarray:
+        if isinstance(val, (int, float, np.floating)):
+            return np.full(n, val, dtype=np.float64)
+        if isinstance(val, (np.ndarray, list)):
+            arr = np.ascontiguousarray(val, dtype=np.float64)
+            if arr.shape != (n,):
+                raise ValueError("tmin/tmax arrays must have shape (N,)")
+            return arr
+        raise TypeError("tmin/tmax must be a number or an (N,) array")
+
+    @classmethod
+    def from_rays(cls, rays: "list[Ray]") -> "RayBatch":
+        """packs a sequence of Ray objects into a batch"""
+        if not all(isinstance(r, Ray) for r in rays):
+            raise TypeError("a sequence of Ray must be provided")
+        n = len(rays)
+        origins = np.empty((n, 3), dtype=np.float64)
+        directions = np.empty((n, 3), dtype=np.float64)
+        tmin = np.empty(n, dtype=np.float64)
+        tmax = np.empty(n, dtype=np.float64)
+        for i, r in enumerate(rays):
+            origins[i] = r.origin
+            directions[i] = r.direction
+            tmin[i] = r.tmin
+            tmax[i] = r.tmax
+        return cls._from_arrays(origins, directions, tmin, tmax)
+
+    @property
+    def origins(self) -> np.ndarray:
+        return self._origins
+
+    @property
+    def directions(self) -> np.ndarray:
+        return self._directions
+
+    @property
+    def tmin(self) -> np.ndarray:
+        return self._tmin
+
+    @property
+    def tmax(self) -> np.ndarray:
+        return self._tmax
+
+    @property
+    def inv_directions(self) -> np.ndarray:
+        """(N, 3) component-wise 1 / direction, +-inf for zero components"""
+        if self._inv_directions is None:
+            with np.errstate(divide="ignore"):
+                self._inv_directions = 1.0 / self._directions
+        return self._inv_directions
+
+    @property
+    def dir_is_negative(self) -> np.ndarray:
+        """(N, 3) bool mask of the negative direction components"""
+        if self._dir_is_negative is None:
+            self._dir_is_negative = np.signbit(self._directions)
+        return self._dir_is_negative
+
+    def __len__(self) -> int:
+        return self._origins.shape[0]
+
+    def __getitem__(self, key: "int | slice | np.ndarray") -> "Ray | RayBatch":
+        if isinstance(key, (int, np.integer)):
+            return self.ray(int(key))
+        if isinstance(key, (slice, np.ndarray, list)):
+            return RayBatch._from_arrays(
+                self._origins[key],
+                self._directions[key],
+                self._tmin[key],
+                self._tmax[key],
+            )
+        raise TypeError("invalid index type for RayBatch")
+
+    def ray(self, i: int) -> Ray:
+        """returns the i-th ray of the batch, its origin and direction are read-only views"""
+        return Ray(
+            origin=Point3D.from_buffer(self._origins, i),
+            direction=Vector3D.from_buffer(self._directions, i),
+            tmin=float(self._tmin[i]),
+            tmax=float(self._tmax[i]),
+        )
+
+    def to_rays(self) -> "list[Ray]":
+        """unpacks the batch into a list of Ray objects"""
+        return [self.ray(i) for i in range(len(self))]
+
+    def position(self, t: "float | np.ndarray") -> np.ndarray:
+        """returns the (N, 3) points origins + t * directions"""
+        t = np.asarray(t, dtype=np.float64)
+        if t.ndim == 1:
+            t = t[:, np.newaxis]
+        return self._origins + t * self._directions
+
+    def compact(self, mask: np.ndarray) -> "RayBatch":
+        """returns a new batch that keeps only the rays where mask is True"""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError("mask must have shape (N,)")
+        return self[np.flatnonzero(mask)]
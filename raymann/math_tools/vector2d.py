@@ -3,28 +3,39 @@
 # See LICENSE file for details.
 import numpy as np
 
+from raymann.common import validation
+
 
 class Vector2D:
     def __init__(self, *args):
         if len(args) == 2:
-            if all(isinstance(val, (int, float, str, np.float64)) for val in args):
+            if not validation.CHECKED or all(
+                isinstance(val, (int, float, str, np.float64)) for val in args
+            ):
                 self._data = np.array([args[0], args[1]], dtype=np.float64)
             else:
                 raise TypeError(
                     "int, float or str must be provided for Vector2D initialization"
                 )
         elif len(args) == 0:
-            self._data = np.array([0, 0])
+            self._data = np.zeros(2)
         else:
             raise TypeError("Unknown type for Vector2D initialization")
 
+    @classmethod
+    def _from_array(cls, data: np.ndarray) -> "Vector2D":
+        """trusted constructor, wraps a float64 array without validation"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
     @property
     def x(self) -> float:
         return self._data[0]
 
     @x.setter
     def x(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("int or float must be provided")
         self._data[0] = val
 
@@ -34,7 +45,7 @@ class Vector2D:
 
     @y.setter
     def y(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("int or float must be provided")
         self._data[1] = val
 
@@ -47,7 +58,7 @@ class Vector2D:
     def coordinates(self, data: np.ndarray):
         if not (isinstance(data, (np.ndarray, list)) and len(data) == 2):
             raise TypeError("numpy array must be provided")
-        self._data = np.array(data)
+        self._data = np.array(data, dtype=np.float64)
 
     def __eq__(self, other):
         return self._eq(other)
@@ -68,9 +79,9 @@ class Vector2D:
 
     def _add(self, other: "Vector2D") -> "Vector2D":
         if isinstance(other, (float, int)):
-            return Vector2D(*(self._data + other))
+            return Vector2D._from_array(self._data + other)
         elif isinstance(other, Vector2D):
-            return Vector2D(*(self._data + other._data))
+            return Vector2D._from_array(self._data + other._data)
         else:
             raise TypeError("cannot add Vector2D to another type")
 
@@ -82,9 +93,9 @@ class Vector2D:
 
     def _sub(self, other: "Vector2D") -> "Vector2D":
         if isinstance(other, (float, int)):
-            return Vector2D(*(self._data - other))
+            return Vector2D._from_array(self._data - other)
         elif isinstance(other, Vector2D):
-            return Vector2D(*np.subtract(self._data, other._data))
+            return Vector2D._from_array(np.subtract(self._data, other._data))
         else:
             raise TypeError("cannot do subtraction between Vector2D and another type")
 
@@ -96,17 +107,63 @@ class Vector2D:
 
     def _mul(self, other: "Vector2D") -> "Vector2D":
         if isinstance(other, (float, int)):
-            return Vector2D(*(self._data * other))
+            return Vector2D._from_array(self._data * other)
         elif isinstance(other, Vector2D):
-            return Vector2D(*(self._data * other._data))
+            return Vector2D._from_array(self._data * other._data)
         else:
             raise TypeError("cannot multiply Vector2D with another type")
 
+    def __iadd__(self, other):
+        np.add(self._data, self._operand(other, "addition"), out=self._data)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._data)
+        return self
+
+    def __imul__(self, other):
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._data)
+        return self
+
+    def add(self, other: "int | float | Vector2D", out: "Vector2D | None" = None) -> "Vector2D":
+        """self + other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._add(other)
+        np.add(self._data, self._operand(other, "addition"), out=self._out_data(out))
+        return out
+
+    def sub(self, other: "int | float | Vector2D", out: "Vector2D | None" = None) -> "Vector2D":
+        """self - other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._sub(other)
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._out_data(out))
+        return out
+
+    def mul(self, other: "int | float | Vector2D", out: "Vector2D | None" = None) -> "Vector2D":
+        """self * other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._mul(other)
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._out_data(out))
+        return out
+
+    def _operand(self, other: "int | float | Vector2D", op: str) -> "np.ndarray | int | float":
+        if isinstance(other, Vector2D):
+            return other._data
+        if validation.CHECKED and not isinstance(other, (float, int)):
+            raise TypeError(f"cannot do {op} between Vector2D and another type")
+        return other
+
+    @staticmethod
+    def _out_data(out: "Vector2D") -> np.ndarray:
+        if validation.CHECKED and not isinstance(out, Vector2D):
+            raise TypeError("out must be Vector2D")
+        return out._data
+
     def __neg__(self) -> "Vector2D":
-        return Vector2D(*(-self._data))
+        return Vector2D._from_array(-self._data)
 
     def __abs__(self) -> "Vector2D":
-        return Vector2D(*np.abs(self._data))
+        return Vector2D._from_array(np.abs(self._data))
 
     def __str__(self) -> str:
         return f"Vector2D({self.x}, {self.y})"
@@ -117,5 +174,4 @@ class Vector2D:
 
     def normalized(self) -> "Vector2D":
         """returns the normalized vector"""
-        norm_data = self._data / self.length()
-        return Vector2D(norm_data[0], norm_data[1])
+        return Vector2D._from_array(self._data / self.length())
@@ -2,28 +2,52 @@
 # Licensed under the GNU General Public License v3.
 # See LICENSE file for details.
 import numpy as np
-from distlib.util import normalize_name
+
+from raymann.common import validation
+from raymann.math_tools.array_interop import array_ufunc
 
 
 class Vector3D:
     def __init__(self, *args):
         if len(args) == 3:
-            if all(isinstance(val, (int, float, str, np.float64)) for val in args):
+            if not validation.CHECKED or all(
+                isinstance(val, (int, float, str, np.float64)) for val in args
+            ):
                 self._data = np.array([args[0], args[1], args[2]], dtype=np.float64)
             else:
                 raise TypeError("float,int or str must be provided for x,y,z")
         elif len(args) == 0:
-            self._data = np.array([0, 0, 0])
+            self._data = np.zeros(3)
         else:
             raise TypeError("Unknown type for Vector3D initialization")
 
+    @classmethod
+    def _from_array(cls, data: np.ndarray) -> "Vector3D":
+        """trusted constructor, wraps a float64 array without validation"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    @classmethod
+    def from_buffer(cls, buffer: np.ndarray, index: int | None = None) -> "Vector3D":
+        """wraps a (3,) float64 array or the row index of an (N, 3) one without copying"""
+        if not isinstance(buffer, np.ndarray) or buffer.dtype != np.float64:
+            raise TypeError("a float64 numpy array must be provided")
+        if index is not None:
+            if buffer.ndim != 2 or buffer.shape[1] != 3:
+                raise ValueError("buffer must have shape (N, 3) when an index is given")
+            buffer = buffer[index]
+        if buffer.shape != (3,):
+            raise ValueError("buffer must have shape (3,)")
+        return cls._from_array(buffer)
+
     @property
     def x(self) -> float:
         return self._data[0]
 
     @x.setter
     def x(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[0] = val
 
@@ -33,7 +57,7 @@ class Vector3D:
 
     @y.setter
     def y(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[1] = val
 
@@ -43,7 +67,7 @@ class Vector3D:
 
     @z.setter
     def z(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[2] = val
 
@@ -56,7 +80,23 @@ class Vector3D:
     def coordinates(self, data: np.ndarray):
         if not (isinstance(data, (np.ndarray, list)) and len(data) == 3):
             raise TypeError("A numpy array must be provided")
-        self._data = np.array(data)
+        self._data = np.array(data, dtype=np.float64)
+
+    @property
+    def data(self) -> np.ndarray:
+        """the underlying float64 buffer, a view that is not copied"""
+        return self._data
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self._data, dtype=dtype)
+        return self._data if dtype is None else self._data.astype(dtype, copy=False)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._data)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return array_ufunc(self, ufunc, method, inputs, kwargs)
 
     def __eq__(self, other):
         return self._eq(other)
@@ -77,11 +117,11 @@ class Vector3D:
         return self._add(other)
 
     def _add(self, other: "int | float | Vector3D") -> "Vector3D":
-        if not isinstance(other, (Vector3D, float, int)):
+        if validation.CHECKED and not isinstance(other, (Vector3D, float, int)):
             raise TypeError("cannot add Vector3D to another type")
         if isinstance(other, (float, int)):
-            return Vector3D(*(self._data + other))
-        return Vector3D(*(self._data + other._data))
+            return Vector3D._from_array(self._data + other)
+        return Vector3D._from_array(self._data + other._data)
 
     def __sub__(self, other):
         return self._sub(other)
@@ -90,11 +130,11 @@ class Vector3D:
         return self._sub(other)
 
     def _sub(self, other: "int | float | Vector3D") -> "Vector3D":
-        if not isinstance(other, (Vector3D, float, int)):
+        if validation.CHECKED and not isinstance(other, (Vector3D, float, int)):
             raise TypeError("cannot do subtraction between Vector3D and another type")
         if isinstance(other, (float, int)):
-            return Vector3D(*(self._data, other))
-        return Vector3D(*np.subtract(self._data, other._data))
+            return Vector3D._from_array(self._data - other)
+        return Vector3D._from_array(np.subtract(self._data, other._data))
 
     def __mul__(self, other):
         return self._mul(other)
@@ -103,19 +143,65 @@ class Vector3D:
         return self._mul(other)
 
     def _mul(self, other: "int | float | Vector3D") -> "Vector3D":
-        if not isinstance(other, (Vector3D, float, int)):
+        if validation.CHECKED and not isinstance(other, (Vector3D, float, int)):
             raise TypeError(
                 "cannot do multiplication between Vector3D and another type"
             )
         if isinstance(other, (float, int)):
-            return Vector3D(*(self._data * other))
-        return Vector3D(*(self._data * other._data))
+            return Vector3D._from_array(self._data * other)
+        return Vector3D._from_array(self._data * other._data)
+
+    def __iadd__(self, other):
+        np.add(self._data, self._operand(other, "addition"), out=self._data)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._data)
+        return self
+
+    def __imul__(self, other):
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._data)
+        return self
+
+    def add(self, other: "int | float | Vector3D", out: "Vector3D | None" = None) -> "Vector3D":
+        """self + other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._add(other)
+        np.add(self._data, self._operand(other, "addition"), out=self._out_data(out))
+        return out
+
+    def sub(self, other: "int | float | Vector3D", out: "Vector3D | None" = None) -> "Vector3D":
+        """self - other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._sub(other)
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._out_data(out))
+        return out
+
+    def mul(self, other: "int | float | Vector3D", out: "Vector3D | None" = None) -> "Vector3D":
+        """self * other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._mul(other)
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._out_data(out))
+        return out
+
+    def _operand(self, other: "int | float | Vector3D", op: str) -> "np.ndarray | int | float":
+        if isinstance(other, Vector3D):
+            return other._data
+        if validation.CHECKED and not isinstance(other, (float, int)):
+            raise TypeError(f"cannot do {op} between Vector3D and another type")
+        return other
+
+    @staticmethod
+    def _out_data(out: "Vector3D") -> np.ndarray:
+        if validation.CHECKED and not isinstance(out, Vector3D):
+            raise TypeError("out must be Vector3D")
+        return out._data
 
     def __neg__(self) -> "Vector3D":
-        return Vector3D(*(-self._data))
+        return Vector3D._from_array(-self._data)
 
     def __abs__(self) -> "Vector3D":
-        return Vector3D(*np.abs(self._data))
+        return Vector3D._from_array(np.abs(self._data))
 
     def __str__(self) -> str:
         return f"Vector3D({self.x}, {self.y}, {self.z})"
@@ -126,5 +212,4 @@ class Vector3D:
 
     def normalized(self) -> "Vector3D":
         """returns the normalized vector"""
-        norm_data = self._data / self.length()
-        return Vector3D(norm_data[0], norm_data[1], norm_data[2])
+        return Vector3D._from_array(self._data / self.length())
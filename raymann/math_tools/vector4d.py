@@ -2,8 +2,8 @@
 # Licensed under the GNU General Public License v3.
 # See LICENSE file for details.
 import numpy as np
-from numpy.ma.core import nomask
 
+from raymann.common import validation
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.vector3d import Vector3D
 from raymann.math_tools.point3d import Point3D
@@ -19,24 +19,33 @@ class Vector4D:
             else:
                 raise TypeError("Vector3D, Point3D or Normal3D must be provided")
         elif len(args) == 4:
-            if all(isinstance(val, (int, float, str, np.float64)) for val in args):
+            if not validation.CHECKED or all(
+                isinstance(val, (int, float, str, np.float64)) for val in args
+            ):
                 self._data = np.array(
                     [args[0], args[1], args[2], args[3]], dtype=np.float64
                 )
             else:
                 raise TypeError("float,int or str must be provided for x,y,z,w")
         elif len(args) == 0:
-            self._data = np.array([0, 0, 0, 0])
+            self._data = np.zeros(4)
         else:
             raise TypeError("Unknown type was given")
 
+    @classmethod
+    def _from_array(cls, data: np.ndarray) -> "Vector4D":
+        """trusted constructor, wraps a float64 array without validation"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
     @property
     def x(self) -> float:
         return self._data[0]
 
     @x.setter
     def x(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[0] = val
 
@@ -46,7 +55,7 @@ class Vector4D:
 
     @y.setter
     def y(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[1] = val
 
@@ -56,7 +65,7 @@ class Vector4D:
 
     @z.setter
     def z(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[2] = val
 
@@ -66,7 +75,7 @@ class Vector4D:
 
     @w.setter
     def w(self, val: int | float):
-        if not isinstance(val, (int, float)):
+        if validation.CHECKED and not isinstance(val, (int, float)):
             raise TypeError("float or int must be provided")
         self._data[3] = val
 
@@ -79,7 +88,7 @@ class Vector4D:
     def coordinates(self, data: np.ndarray):
         if not (isinstance(data, (np.ndarray, list)) and len(data) == 4):
             raise TypeError("numpy array must be provided")
-        self._data = np.array(data)
+        self._data = np.array(data, dtype=np.float64)
 
     def __eq__(self, other):
         return self._eq(other)
@@ -97,9 +106,9 @@ class Vector4D:
 
     def _add(self, other: "Vector4D") -> "Vector4D":
         if isinstance(other, (float, int)):
-            return Vector4D(*(self._data + other))
+            return Vector4D._from_array(self._data + other)
         elif isinstance(other, Vector4D):
-            return Vector4D(*(self._data + other._data))
+            return Vector4D._from_array(self._data + other._data)
         else:
             raise TypeError("cannot add Vector4D to another type")
 
@@ -111,9 +120,9 @@ class Vector4D:
 
     def _sub(self, other: "Vector4D") -> "Vector4D":
         if isinstance(other, (float, int)):
-            return Vector4D(*(self._data - other))
+            return Vector4D._from_array(self._data - other)
         elif isinstance(other, Vector4D):
-            return Vector4D(*np.subtract(self._data, other._data))
+            return Vector4D._from_array(np.subtract(self._data, other._data))
         else:
             raise TypeError("cannot do subtraction between Vector4D and another type")
 
@@ -125,17 +134,63 @@ class Vector4D:
 
     def _mul(self, other: "int | float | Vector4D") -> "Vector4D":
         if isinstance(other, (float, int)):
-            return Vector4D(*(self._data * other))
+            return Vector4D._from_array(self._data * other)
         elif isinstance(other, Vector4D):
-            return Vector4D(*(self._data * other._data))
+            return Vector4D._from_array(self._data * other._data)
         else:
             raise TypeError()
 
+    def __iadd__(self, other):
+        np.add(self._data, self._operand(other, "addition"), out=self._data)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._data)
+        return self
+
+    def __imul__(self, other):
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._data)
+        return self
+
+    def add(self, other: "int | float | Vector4D", out: "Vector4D | None" = None) -> "Vector4D":
+        """self + other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._add(other)
+        np.add(self._data, self._operand(other, "addition"), out=self._out_data(out))
+        return out
+
+    def sub(self, other: "int | float | Vector4D", out: "Vector4D | None" = None) -> "Vector4D":
+        """self - other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._sub(other)
+        np.subtract(self._data, self._operand(other, "subtraction"), out=self._out_data(out))
+        return out
+
+    def mul(self, other: "int | float | Vector4D", out: "Vector4D | None" = None) -> "Vector4D":
+        """self * other, written into the buffer of out when it is given"""
+        if out is None:
+            return self._mul(other)
+        np.multiply(self._data, self._operand(other, "multiplication"), out=self._out_data(out))
+        return out
+
+    def _operand(self, other: "int | float | Vector4D", op: str) -> "np.ndarray | int | float":
+        if isinstance(other, Vector4D):
+            return other._data
+        if validation.CHECKED and not isinstance(other, (float, int)):
+            raise TypeError(f"cannot do {op} between Vector4D and another type")
+        return other
+
+    @staticmethod
+    def _out_data(out: "Vector4D") -> np.ndarray:
+        if validation.CHECKED and not isinstance(out, Vector4D):
+            raise TypeError("out must be Vector4D")
+        return out._data
+
     def __neg__(self) -> "Vector4D":
-        return Vector4D(*(-self._data))
+        return Vector4D._from_array(-self._data)
 
     def __abs__(self) -> "Vector4D":
-        return Vector4D(*np.abs(self._data))
+        return Vector4D._from_array(np.abs(self._data))
 
     def __str__(self) -> str:
         return f"Vector4D({self.x}, {self.y}, {self.z}, {self.w})"
@@ -146,5 +201,4 @@ class Vector4D:
 
     def normalized(self) -> "Vector4D":
         """returns the normalized vector"""
-        norm_data = self._data / self.length()
-        return Vector4D(norm_data[0], norm_data[1], norm_data[2], norm_data[3])
+        return Vector4D._from_array(self._data / self.length())
@@ -0,0 +1,287 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+from raymann.acceleration.lbvh import build_lbvh
+from raymann.camera.camera import Camera
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.common.intersection_batch import IntersectionBatch
+from raymann.geometry.primitive import Primitive
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+
+_BUILDERS = ("sah", "lbvh")
+
+
+def _similarity_scale(matrix: np.ndarray) -> float:
+    """the uniform scale of an affine similarity transform, 0 for other transforms"""
+    if not np.array_equal(matrix[3], [0.0, 0.0, 0.0, 1.0]):
+        return 0.0
+    gram = matrix[:3, :3].T @ matrix[:3, :3]
+    s2 = gram[0, 0]
+    if s2 <= 0.0 or not np.allclose(gram, s2 * np.identity(3), rtol=0.0, atol=1e-12 * s2):
+        return 0.0
+    return float(np.sqrt(s2))
+
+
+class Scene:
+    """Primitives, lights and cameras of a scene and its compiled acceleration structure.
+
+    commit() compiles the primitives: spheres with a similarity transform are
+    merged into one world space SphereSet, sphere sets and triangle meshes
+    contribute one BVH element per sphere or triangle and other primitives
+    one element each. The object to world matrices, their inverses and the
+    element bounds are computed once. Elements with unbounded extent are kept
+    out of the BVH and tested after it. Queries report the index of the hit
+    primitive in primitives through prim_ids.
+    """
+
+    def __init__(self):
+        self._primitives = []
+        self._lights = []
+        self._cameras = []
+        self._committed = False
+
+    @property
+    def primitives(self) -> "list[Primitive]":
+        return self._primitives
+
+    @property
+    def lights(self) -> list:
+        return self._lights
+
+    @property
+    def cameras(self) -> "list[Camera]":
+        return self._cameras
+
+    @property
+    def committed(self) -> bool:
+        """False after primitives were added or given a new transformation since the last commit"""
+        return self._committed and all(
+            p.transformation is t for p, t in zip(self._primitives, self._transformations)
+        )
+
+    @property
+    def bvh(self) -> BVH:
+        self._check_committed()
+        return self._bvh
+
+    def add(self, primitive: Primitive) -> int:
+        """adds a primitive, returns its index in primitives"""
+        if validation.CHECKED and not isinstance(primitive, Primitive):
+            raise TypeError("a Primitive must be provided")
+        self._primitives.append(primitive)
+        self._committed = False
+        return len(self._primitives) - 1
+
+    def add_light(self, light):
+        self._lights.append(light)
+
+    def add_camera(self, camera: Camera):
+        if validation.CHECKED and not isinstance(camera, Camera):
+            raise TypeError("a Camera must be provided")
+        self._cameras.append(camera)
+
+    def commit(self, max_leaf_size: int = 4, builder: str = "sah"):
+        """Compiles the primitives and builds the BVH over their elements.
+
+        builder is "sah" for the binned SAH builder or "lbvh" for the Morton
+        code builder, which is much faster for large scenes. Queries use the
+        transformations seen here, a primitive moved afterwards is only
+        picked up by calling commit() again, committed tells when it is due.
+        """
+        if builder not in _BUILDERS:
+            raise ValueError(f"builder must be one of {_BUILDERS}")
+        groups, sources = self._group()
+        sizes = np.array(
+            [len(g) if isinstance(g, (SphereSet, TriangleMesh)) else 1 for g in groups], dtype=np.int64
+        )
+        self._groups = groups
+        self._is_set = [isinstance(g, (SphereSet, TriangleMesh)) for g in groups]
+        self._group_start = np.cumsum(sizes) - sizes
+        self._elem_group = np.repeat(np.arange(len(groups)), sizes)
+        self._elem_prim = np.arange(int(sizes.sum())) - np.repeat(self._group_start, sizes)
+        self._elem_source = np.concatenate(sources).astype(np.int64) if sources else np.zeros(0, dtype=np.int64)
+        self._transformations = [p.transformation for p in self._primitives]
+        self._inverses = np.array([g.transformation.inverse_matrix.data for g in groups]).reshape(-1, 4, 4)
+
+        n = self._elem_group.shape[0]
+        mins = np.empty((n, 3))
+        maxs = np.empty((n, 3))
+        for g, group in enumerate(groups):
+            elems = slice(self._group_start[g], self._group_start[g] + sizes[g])
+            if self._is_set[g]:
+                mins[elems], maxs[elems] = group.world_prim_bounds()
+            else:
+                box = group.world_bounding_box()
+                mins[elems] = box.min_point.data
+                maxs[elems] = box.max_point.data
+        self._mins, self._maxs = mins, maxs
+        bounded = np.all(np.isfinite(mins) & np.isfinite(maxs), axis=1)
+        self._bounded = np.flatnonzero(bounded)
+        self._unbounded = np.flatnonzero(~bounded)
+        build = BVH.build if builder == "sah" else build_lbvh
+        tree = build(mins[bounded], maxs[bounded], max_leaf_size=max_leaf_size)
+        # leaves refer to elements, not to positions in the bounded subset
+        self._bvh = BVH(
+            tree.node_min,
+            tree.node_max,
+            tree.node_offset,
+            tree.node_count,
+            tree.node_axis,
+            self._bounded[tree.prim_indices],
+        )
+        self._committed = True
+
+    def _group(self) -> (list, list):
+        """batched sets and single primitives with the primitive index of every element"""
+        groups, sources = [], []
+        centers, radii, merged = [], [], []
+        for i, prim in enumerate(self._primitives):
+            if type(prim) is Sphere:
+                matrix = prim.transformation.matrix
+                scale = _similarity_scale(matrix.data)
+                if scale > 0.0:
+                    centers.append(matrix.transform_points(prim.center.data[np.newaxis])[0])
+                    radii.append(scale * prim.radius)
+                    merged.append(i)
+                    continue
+            groups.append(prim)
+            sources.append(np.full(len(prim) if isinstance(prim, (SphereSet, TriangleMesh)) else 1, i))
+        if merged:
+            groups.append(SphereSet(np.array(centers), np.array(radii)))
+            sources.append(np.array(merged))
+        return groups, sources
+
+    def _check_committed(self):
+        if not self._committed:
+            raise RuntimeError("the scene must be committed before it is queried")
+
+    def _group_hits(
+        self,
+        g: int,
+        elems: np.ndarray,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        tmin: np.ndarray,
+        tmax: np.ndarray,
+        any_hit: bool,
+    ) -> (np.ndarray, np.ndarray):
+        """(t, element) of N world space rays with the elements elems of group g"""
+        group = self._groups[g]
+        if self._is_set[g]:
+            inv = self._inverses[g]
+            obj_origins = origins @ inv[:3, :3].T + inv[:3, 3]
+            obj_directions = directions @ inv[:3, :3].T
+            prims = self._elem_prim[elems]
+            if any_hit:
+                hit = group.occluded_prims_batch(obj_origins, obj_directions, tmin, tmax, prims)
+                return np.where(hit, tmin, np.inf), np.where(hit, elems[0], -1)
+            t, prim = group.intersect_prims_batch(obj_origins, obj_directions, tmin, tmax, prims)
+            return t, np.where(prim >= 0, self._group_start[g] + prim, -1)
+        rays = RayBatch._from_arrays(origins, directions, tmin, tmax)
+        if any_hit:
+            hit = group.occluded_batch(rays)
+            return np.where(hit, tmin, np.inf), np.where(hit, elems[0], -1)
+        res = group.intersect_batch(rays)
+        return res.t_hit, np.where(res.hit, elems[0], -1)
+
+    def _leaf_fn(self, origins: np.ndarray, directions: np.ndarray, tmin: np.ndarray, any_hit: bool):
+        """packet leaf function over the elements of the scene"""
+
+        def leaf_fn(ids: np.ndarray, rays: np.ndarray, tmax: np.ndarray) -> (np.ndarray, np.ndarray):
+            t_best = tmax.copy()
+            elem_best = np.full(rays.shape[0], -1, dtype=np.int64)
+            groups = self._elem_group[ids]
+            for g in np.unique(groups):
+                pending = np.flatnonzero(elem_best < 0) if any_hit else np.arange(rays.shape[0])
+                if pending.shape[0] == 0:
+                    break
+                sub = rays[pending]
+                t, elem = self._group_hits(
+                    g, ids[groups == g], origins[sub], directions[sub], tmin[sub], t_best[pending], any_hit
+                )
+                closer = (elem >= 0) & (t < t_best[pending])
+                t_best[pending[closer]] = t[closer]
+                elem_best[pending[closer]] = elem[closer]
+            return np.where(elem_best >= 0, t_best, np.inf), elem_best
+
+        return leaf_fn
+
+    def _traverse(self, rays: RayBatch, any_hit: bool) -> (np.ndarray, np.ndarray):
+        """(t, element) of the closest or any hit of every ray"""
+        self._check_committed()
+        origins, directions, tmin = rays.origins, rays.directions, rays.tmin
+        leaf_fn = self._leaf_fn(origins, directions, tmin, any_hit)
+        n = len(rays)
+        if any_hit:
+            t, elem = self._bvh.any_hit_packet(origins, directions, tmin, rays.tmax, leaf_fn)
+        else:
+            t, elem = self._bvh.closest_hit_packet(origins, directions, tmin, rays.tmax, leaf_fn)
+        if self._unbounded.shape[0]:
+            pending = np.flatnonzero(elem < 0) if any_hit else np.arange(n)
+            tmax = np.minimum(rays.tmax[pending], t[pending])
+            t_u, elem_u = leaf_fn(self._unbounded, pending, tmax)
+            closer = elem_u >= 0
+            t[pending[closer]] = t_u[closer]
+            elem[pending[closer]] = elem_u[closer]
+        return t, elem
+
+    def intersect_batch(self, rays: RayBatch) -> IntersectionBatch:
+        """closest hits of N rays, prim_ids holds the index of the hit primitive"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        t, elem = self._traverse(rays, False)
+        res = IntersectionBatch(len(rays))
+        hit_groups = self._elem_group[elem[elem >= 0]]
+        for g in np.unique(hit_groups):
+            rows = np.flatnonzero(elem >= 0)[hit_groups == g]
+            sub = RayBatch._from_arrays(rays.origins[rows], rays.directions[rows], rays.tmin[rows], rays.tmax[rows])
+            group = self._groups[g]
+            if self._is_set[g]:
+                rec = group.hit_records(sub, t[rows], self._elem_prim[elem[rows]])
+            else:
+                # the nearest hit of a single primitive is the one found
+                rec = group.intersect_batch(sub)
+            res.hit[rows] = rec.hit
+            res.t_hit[rows] = rec.t_hit
+            res.hit_points[rows] = rec.hit_points
+            res.normals[rows] = rec.normals
+            res.wo[rows] = rec.wo
+            res.barycentrics[rows] = rec.barycentrics
+            res.prim_ids[rows] = self._elem_source[elem[rows]]
+        return res
+
+    def intersect(self, ray: Ray, record: Intersection) -> bool:
+        """closest hit of the ray, record is filled only on a hit"""
+        if validation.CHECKED and (
+            not isinstance(ray, Ray) or not isinstance(record, Intersection)
+        ):
+            raise TypeError("invalid parameters, should be (Ray, Intersection)")
+        res = self.intersect_batch(RayBatch.from_rays([ray]))
+        if not res.hit[0]:
+            return False
+        hit = res.record(0)
+        record.t_hit = hit.t_hit
+        record.hit_point = hit.hit_point
+        record.normal = hit.normal
+        record.wo = hit.wo
+        return True
+
+    def occluded_batch(self, rays: RayBatch) -> np.ndarray:
+        """occlusion of N rays in [tmin, tmax) as a bool array"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        return self._traverse(rays, True)[1] >= 0
+
+    def occluded(self, ray: Ray) -> bool:
+        """True if any primitive is hit in [tmin, tmax), traversal stops at the first hit"""
+        if validation.CHECKED and not isinstance(ray, Ray):
+            raise TypeError("ray needed as parameter")
+        return bool(self.occluded_batch(RayBatch.from_rays([ray]))[0])
@@ -1,20 +1,24 @@
 # Copyright (c) 2025 Andreas Nazlidis
 # Licensed under the GNU General Public License v3.
 # See LICENSE file for details.
+import numpy as np
+
+from raymann.common import validation
 from raymann.math_tools.matrix4d import Matrix4D
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
 from raymann.math_tools.vector3d import Vector3D
-from raymann.math_tools.vector4d import Vector4D
 
 
 class Transformer:
     def __init__(self, mat: Matrix4D = Matrix4D()):
-        if isinstance(mat, Matrix4D):
+        if not validation.CHECKED or isinstance(mat, Matrix4D):
             self._matrix = mat
             self._inverse = self._matrix.inverse
-            self._inverse_transpose = self._inverse.transpose
+            self._inverse_transpose = self._matrix.inverse_transpose
+            self._transpose = self._matrix.transpose
         else:
             raise TypeError()
 
@@ -30,12 +34,20 @@ class Transformer:
     def inverse_transpose_matrix(self) -> Matrix4D:
         return self._inverse_transpose
 
-    def world_to_obj_space(self, entity: (Ray, Point3D, Vector3D, Normal3D)) -> (Ray, Point3D, Vector3D, Normal3D):  # to be edited
+    def world_to_obj_space(self, entity: (Ray, Point3D, Vector3D, Normal3D)) -> (Ray, Point3D, Vector3D, Normal3D):
         if isinstance(entity, Ray):
             obj_space_origin = self._inverse * entity.origin
             obj_space_direction = self._inverse * entity.direction
-            return Ray(origin=obj_space_origin, direction=obj_space_direction)
-        elif isinstance(entity, (Point3D, Vector3D, Normal3D)):
+            return Ray(
+                origin=obj_space_origin,
+                direction=obj_space_direction,
+                tmin=entity.tmin,
+                tmax=entity.tmax,
+            )
+        elif isinstance(entity, Normal3D):
+            # the inverse transpose of the inverse matrix is the transpose
+            return self._transpose * entity
+        elif isinstance(entity, (Point3D, Vector3D)):
             return self._inverse * entity
         else:
             raise TypeError("unknown type for world to object space transformation")
@@ -44,8 +56,49 @@ class Transformer:
         if isinstance(entity, Ray):
             wrld_space_origin = self._matrix * entity.origin
             wrld_space_direction = self._matrix * entity.direction
-            return Ray(origin=wrld_space_origin, direction=wrld_space_direction)
-        elif isinstance(entity, (Point3D, Vector3D, Normal3D)):
+            return Ray(
+                origin=wrld_space_origin,
+                direction=wrld_space_direction,
+                tmin=entity.tmin,
+                tmax=entity.tmax,
+            )
+        elif isinstance(entity, Normal3D):
+            return self._inverse_transpose * entity
+        elif isinstance(entity, (Point3D, Vector3D)):
             return self._matrix * entity
         else:
             raise TypeError("unknown type for object to world space transformation")
+
+    def world_to_obj_space_batch(self, rays: RayBatch) -> RayBatch:
+        """transforms a whole ray batch to object space, keeping tmin/tmax"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        return RayBatch._from_arrays(
+            self._inverse.transform_points(rays.origins),
+            self._inverse.transform_vectors(rays.directions),
+            rays.tmin,
+            rays.tmax,
+        )
+
+    def obj_to_world_space_batch(self, rays: RayBatch) -> RayBatch:
+        """transforms a whole ray batch to world space, keeping tmin/tmax"""
+        if validation.CHECKED and not isinstance(rays, RayBatch):
+            raise TypeError("RayBatch must be provided")
+        return RayBatch._from_arrays(
+            self._matrix.transform_points(rays.origins),
+            self._matrix.transform_vectors(rays.directions),
+            rays.tmin,
+            rays.tmax,
+        )
+
+    def world_to_obj_space_normals(
+        self, normals: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """transforms an (N, 3) array of world space normals to object space"""
+        return self._transpose.transform_vectors(normals, out=out)
+
+    def obj_to_world_space_normals(
+        self, normals: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """transforms an (N, 3) array of object space normals to world space"""
+        return self._inverse_transpose.transform_vectors(normals, out=out)
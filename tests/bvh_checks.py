@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+
+
+def check_tree(bvh: BVH, node: int, seen: list):
+    """recursively checks that children are contained in their parent"""
+    if bvh.node_count[node] > 0:
+        off = bvh.node_offset[node]
+        seen.extend(bvh.prim_indices[off : off + bvh.node_count[node]])
+        return
+    for child in (node + 1, bvh.node_offset[node]):
+        assert np.all(bvh.node_min[node] <= bvh.node_min[child])
+        assert np.all(bvh.node_max[child] <= bvh.node_max[node])
+        check_tree(bvh, child, seen)
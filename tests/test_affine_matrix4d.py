@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.math_tools.affine_matrix4d import AffineMatrix4D
+from raymann.math_tools.math_utils import (
+    scale_matrix,
+    translation_matrix,
+    x_rot_matrix,
+    y_rot_matrix,
+)
+from raymann.math_tools.matrix4d import Matrix4D
+from raymann.math_tools.point3d import Point3D
+
+
+class TestAffineMatrix4D:
+
+    def test_init_with_invalid_data(self):
+        with pytest.raises(ValueError):
+            AffineMatrix4D(np.ones((4, 4)))
+        with pytest.raises(TypeError):
+            AffineMatrix4D(rigid=1)
+
+    def test_builders_are_affine(self):
+        assert translation_matrix(1, 2, 3).rigid
+        assert y_rot_matrix(0.3).rigid
+        assert not scale_matrix(1, 2, 3).rigid
+
+    def test_composition(self):
+        a = translation_matrix(1, 2, 3)
+        b = x_rot_matrix(np.pi / 3)
+        c = scale_matrix(2, 3, 4)
+        rigid = a * b
+        assert isinstance(rigid, AffineMatrix4D)
+        assert rigid.rigid
+        m = a * b * c
+        assert not m.rigid
+        assert np.allclose(a.data @ b.data @ c.data, m.data)
+
+    @pytest.mark.parametrize("m", [translation_matrix(1, -2, 3) * y_rot_matrix(0.7),
+                                   scale_matrix(2, 3, 0.5) * x_rot_matrix(1.2),
+                                   Matrix4D(translation_matrix(4, 5, 6).data.copy())])
+    def test_closed_form_inverse(self, m):
+        assert np.allclose(np.linalg.inv(m.data), m.inverse.data)
+        assert np.allclose(np.linalg.inv(m.data).T, m.inverse_transpose.data)
+
+    def test_inverse_is_cached(self):
+        m = scale_matrix(2, 2, 2)
+        inv = m.inverse
+        assert inv is m.inverse
+        assert m.inverse_transpose is m.inverse_transpose
+        with pytest.raises(ValueError):
+            inv.data[0, 0] = 1.0
+
+    def test_modification_invalidates_cache(self):
+        m = translation_matrix(1, 0, 0)
+        assert Point3D(-1, 0, 0) == m.inverse * Point3D()
+        m[0, 3] = 5.0
+        assert not m.rigid
+        assert Point3D(-5, 0, 0) == m.inverse * Point3D()
+        with pytest.raises(ValueError):
+            m[3, 0] = 1.0
+
+    def test_singular_matrix(self):
+        with pytest.raises(np.linalg.LinAlgError):
+            scale_matrix(1, 0, 1).inverse
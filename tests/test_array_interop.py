@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.math_tools.compact3d import CompactPoint3D
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+
+
+class TestArrayInterop:
+
+    @pytest.mark.parametrize("cls", [Vector3D, Point3D, Normal3D])
+    def test_from_buffer_wraps_rows(self, cls):
+        buf = np.arange(12, dtype=np.float64).reshape(4, 3)
+        elem = cls.from_buffer(buf, 2)
+        assert cls(6, 7, 8) == elem
+        elem.x = -1.0
+        assert -1.0 == buf[2, 0]
+        buf[2, 2] = 42.0
+        assert 42.0 == elem.z
+        assert np.shares_memory(buf, elem.data)
+        whole = cls.from_buffer(buf[3])
+        assert cls(9, 10, 11) == whole
+
+    def test_from_buffer_with_invalid_data(self):
+        with pytest.raises(TypeError):
+            Point3D.from_buffer(np.zeros((2, 3), dtype=np.float32), 0)
+        with pytest.raises(TypeError):
+            Point3D.from_buffer([1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            Point3D.from_buffer(np.zeros((2, 4)), 0)
+        with pytest.raises(ValueError):
+            Point3D.from_buffer(np.zeros(4))
+
+    def test_array_protocol(self):
+        v = Vector3D(1, 2, 3)
+        arr = np.asarray(v)
+        assert arr is v.data
+        assert not np.shares_memory(np.array(v), v.data)
+        assert np.float32 == np.asarray(v, dtype=np.float32).dtype
+        assert np.array_equal(np.array([1.0, 2.0, 3.0]), memoryview(v.data))
+        rows = np.array([Point3D(1, 2, 3), Point3D(4, 5, 6)])
+        assert (2, 3) == rows.shape
+        assert np.array_equal(np.array([1.0, 2.0, 3.0]), np.asarray(CompactPoint3D(1, 2, 3)))
+
+    def test_ufuncs_keep_operator_semantics(self):
+        a = Vector3D(-1, 2, -3)
+        assert Vector3D(1, 2, 3) == np.abs(a)
+        assert Vector3D(1, -2, 3) == np.negative(a)
+        scaled = np.float64(2.0) * a
+        assert isinstance(scaled, Vector3D)
+        assert Vector3D(-2, 4, -6) == scaled
+        assert isinstance(Point3D(1, 1, 1) + np.float64(1.0), Point3D)
+        mixed = np.ones(3) + a
+        assert isinstance(mixed, np.ndarray)
+        assert np.array_equal(np.array([0.0, 3.0, -2.0]), mixed)
+
+    def test_ray_batch_rays_are_views(self):
+        batch = RayBatch(np.zeros((2, 3)), np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]]))
+        ray = batch[1]
+        assert np.shares_memory(batch.origins, ray.origin.data)
+        assert Vector3D(1, 0, 0) == ray.direction
+        packed = RayBatch.from_rays([Ray(origin=Point3D(1, 2, 3), direction=Vector3D(0, 1, 0))])
+        assert np.array_equal(np.array([[1.0, 2.0, 3.0]]), packed.origins)
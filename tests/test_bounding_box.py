@@ -2,8 +2,14 @@
 # Licensed under the GNU General Public License v3.
 # See LICENSE file for details.
 import pytest
+import numpy as np
+
 from raymann.math_tools.point3d import Point3D
-from raymann.acceleration.bounding_box import BoundingBox
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.acceleration.bounding_box import BoundingBox, BoxArray
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, x_rot_matrix
 
 
 class TestBoundingBox:
@@ -46,3 +52,89 @@ class TestBoundingBox:
         assert not box1.contains_box(box2)
         box2 = BoundingBox(Point3D(6, -1, 1), Point3D(12, 5, 8))
         assert not box1.contains_box(box2)
+
+    @pytest.mark.parametrize("origin, direction, is_hit",
+                             [(Point3D(0, 0, -5), Vector3D(0, 0, 1), True),
+                              (Point3D(3, 0, -5), Vector3D(0, 0, 1), False),
+                              (Point3D(0, 0, 5), Vector3D(0, 0, 1), False),
+                              (Point3D(0, 0, 0), Vector3D(1, 1, 1), True),
+                              (Point3D(1, 0, -5), Vector3D(0, 0, 1), True),
+                              ])
+    def test_box_intersects_ray(self, origin, direction, is_hit):
+        box = BoundingBox(Point3D(-1, -1, -1), Point3D(1, 1, 1))
+        ray = Ray(origin=origin, direction=direction)
+        assert is_hit == box.intersects_ray(ray)
+        hit, _, _ = box.intersects_rays(RayBatch.from_rays([ray]))
+        assert is_hit == hit[0]
+
+    def test_box_intersects_rays_distances(self):
+        box = BoundingBox(Point3D(-1, -2, -3), Point3D(1, 2, 3))
+        rays = RayBatch(
+            np.array([[-5.0, 0.0, 0.0], [0.0, 5.0, 0.0], [0.0, 0.0, 0.0], [0.0, 9.0, 0.0]]),
+            np.array([[1.0, 0.0, 0.0], [0.0, -2.0, 0.0], [0.0, 0.0, 1.0], [1.0, 0.0, 0.0]]),
+            tmin=0.0,
+        )
+        hit, tnear, tfar = box.intersects_rays(rays)
+        assert np.array_equal(hit, [True, True, True, False])
+        assert np.array_equal(tnear[:3], [4.0, 1.5, 0.0])
+        assert np.array_equal(tfar[:3], [6.0, 3.5, 3.0])
+
+    def test_box_array_against_one_ray(self):
+        rng = np.random.default_rng(2)
+        mins = rng.uniform(-10.0, 10.0, (200, 3))
+        boxes = BoxArray(mins, mins + rng.uniform(0.1, 3.0, (200, 3)))
+        ray = Ray(origin=Point3D(-12.0, 0.5, 0.0), direction=Vector3D(1.0, 0.1, -0.05))
+        hit, tnear, tfar = boxes.intersects_ray(ray)
+        assert hit.any()
+        for i in range(len(boxes)):
+            assert hit[i] == boxes[i].intersects_ray(ray)
+        assert np.all(tnear[hit] <= tfar[hit])
+        pairs = BoxArray.from_boxes([boxes[0], boxes[1]])
+        assert np.array_equal(pairs.mins, mins[:2])
+        with pytest.raises(ValueError):
+            pairs.intersects_rays(RayBatch.from_rays([ray]))
+
+    def test_default_points_are_not_shared(self):
+        box1 = BoundingBox()
+        box1.add_point(Point3D(1, 2, 3))
+        box2 = BoundingBox()
+        assert box2.is_empty()
+        assert Point3D(np.inf, np.inf, np.inf) == box2.min_point
+
+    def test_add_empty_box(self):
+        box = BoundingBox(Point3D(-1, -1, -1), Point3D(1, 1, 1))
+        box.add_box(BoundingBox())
+        assert Point3D(-1, -1, -1) == box.min_point
+        assert Point3D(1, 1, 1) == box.max_point
+
+    def test_bulk_points(self):
+        points = np.random.default_rng(4).uniform(-3.0, 3.0, (500, 3))
+        box = BoundingBox.from_points(points)
+        one_by_one = BoundingBox()
+        for p in points:
+            one_by_one.add_point(Point3D(*p))
+        assert one_by_one.min_point == box.min_point
+        assert one_by_one.max_point == box.max_point
+        box.add_points(np.array([[10.0, 0.0, 0.0]]))
+        assert 10.0 == box.max_point.x
+        with pytest.raises(ValueError):
+            box.add_points(np.zeros((2, 2)))
+
+    def test_box_array_union_and_centroids(self):
+        boxes = BoxArray([[0, 0, 0], [-2, 1, 1]], [[1, 1, 1], [0, 4, 2]])
+        union = boxes.union()
+        assert Point3D(-2, 0, 0) == union.min_point
+        assert Point3D(1, 4, 2) == union.max_point
+        assert np.array_equal(boxes.centroids(), [[0.5, 0.5, 0.5], [-1.0, 2.5, 1.5]])
+        assert BoxArray(np.zeros((0, 3)), np.zeros((0, 3))).union().is_empty()
+
+    def test_transformed_matches_corners(self):
+        box = BoundingBox(Point3D(-1, -2, 0), Point3D(3, 1, 2))
+        matrix = translation_matrix(1, 2, 3) * x_rot_matrix(0.7) * scale_matrix(2, 1, 0.5)
+        corners = matrix.transform_points(box.corners())
+        world = box.transformed(matrix)
+        assert 8 == len(np.unique(box.corners(), axis=0))
+        assert np.allclose(world.min_point.coordinates, corners.min(axis=0))
+        assert np.allclose(world.max_point.coordinates, corners.max(axis=0))
+        assert BoundingBox().transformed(matrix).is_empty()
+        assert Point3D(1, -0.5, 1) == box.centroid()
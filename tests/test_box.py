@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.common.intersection import Intersection
+from raymann.geometry.box import Box
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, y_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+class TestBox:
+
+    @pytest.mark.parametrize("origin, direction, t, normal",
+                             [(Point3D(0.0, 0.0, -5.0), Vector3D(0.0, 0.0, 1.0), 4.0, (0.0, 0.0, -1.0)),
+                              (Point3D(5.0, 0.5, 0.5), Vector3D(-2.0, 0.0, 0.0), 2.0, (1.0, 0.0, 0.0)),
+                              (Point3D(0.0, 0.0, 0.0), Vector3D(0.0, 1.0, 0.0), 1.0, (0.0, 1.0, 0.0)),
+                              (Point3D(0.0, 2.0, -5.0), Vector3D(0.0, 0.0, 1.0), np.inf, None),
+                              # along the face x = 1, the normal at the edge is ambiguous
+                              (Point3D(1.0, 0.0, -5.0), Vector3D(0.0, 0.0, 1.0), 4.0, None),
+                              ])
+    def test_ray_box_intersection(self, origin, direction, t, normal):
+        box = Box()
+        ray = Ray(origin=origin, direction=direction)
+        record = Intersection()
+        assert np.isfinite(t) == box.intersect(ray, record) == box.occluded(ray)
+        if np.isfinite(t):
+            assert t == record.t_hit
+        if normal is not None:
+            assert Normal3D(*normal) == record.normal
+
+    def test_batch_matches_single_rays(self):
+        box = Box(Transformer(translation_matrix(1.0, 0.0, 2.0) * y_rot_matrix(0.7) * scale_matrix(1.0, 2.0, 0.5)),
+                  Point3D(-1.0, -0.5, -2.0), Point3D(2.0, 0.5, 1.0))
+        rng = np.random.default_rng(4)
+        origins = rng.uniform(-6.0, 6.0, (200, 3))
+        rays = RayBatch(origins, rng.uniform(-2.0, 2.0, (200, 3)) - 0.3 * origins)
+        res = box.intersect_batch(rays)
+        assert np.array_equal(res.hit, box.occluded_batch(rays))
+        assert 20 < np.count_nonzero(res.hit) < 200
+        for i in np.flatnonzero(res.hit):
+            # the hit point lies on the box surface
+            p = box.transformation.world_to_obj_space(Point3D(*res.hit_points[i])).data
+            lo, hi = box.min_point.data, box.max_point.data
+            assert np.all(p >= lo - 1e-9) and np.all(p <= hi + 1e-9)
+            assert np.isclose(np.min(np.abs(np.concatenate((p - lo, p - hi)))), 0.0, atol=1e-9)
+            assert np.dot(res.normals[i], rays.directions[i]) != 0.0
+        corners = box.world_bounding_box()
+        assert np.all(res.hit_points[res.hit] >= corners.min_point.data - 1e-9)
+
+    def test_bounds_and_area(self):
+        box = Box(min_point=Point3D(0.0, 0.0, 0.0), max_point=Point3D(1.0, 2.0, 3.0))
+        assert np.array_equal([1.0, 2.0, 3.0], box.bounding_box().max_point.data)
+        assert 22.0 == box.surface_area()
+        assert 24.0 == Box().surface_area()
+        with pytest.raises(ValueError):
+            Box(min_point=Point3D(1.0, 0.0, 0.0), max_point=Point3D(0.0, 1.0, 1.0))
+        with pytest.raises(TypeError):
+            Box(min_point=(0.0, 0.0, 0.0))
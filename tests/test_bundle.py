@@ -0,0 +1,161 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import os
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVHAggregate
+from raymann.common.intersection import Intersection
+from raymann.geometry.box import Box
+from raymann.geometry.cylinder import Cylinder
+from raymann.geometry.plane import Plane
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.io import bundle
+from raymann.io.bundle import bake, load, load_or_bake, read_bundle, scene_key, write_bundle
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, y_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+def _mapping(arr: np.ndarray) -> np.ndarray:
+    """the array at the root of the base chain of arr"""
+    while arr.base is not None and isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+class TestBundle:
+
+    def setup_method(self):
+        rng = np.random.default_rng(6)
+        self.primitives = [
+            Sphere(Transformer(translation_matrix(*c) * scale_matrix(1.0, 2.0, 1.0)), radius=float(r))
+            for c, r in zip(rng.uniform(-10.0, 10.0, (20, 3)), rng.uniform(0.5, 2.0, 20))
+        ]
+        self.primitives.append(SphereSet(rng.uniform(-3.0, 3.0, (50, 3)), 0.3, Transformer(y_rot_matrix(0.4))))
+        self.primitives.append(
+            TriangleMesh(
+                np.array([[-20.0, -20.0, -15.0], [20.0, -20.0, -15.0], [0.0, 20.0, -15.0]], dtype=np.float32),
+                np.array([[0, 1, 2]], dtype=np.int32),
+                np.array([[0.0, 0.0, 1.0]] * 3, dtype=np.float32),
+            )
+        )
+        origins = rng.uniform(-12.0, 12.0, (60, 3))
+        targets = rng.uniform(-12.0, 12.0, (60, 3)) - [0.0, 0.0, 10.0]
+        self.rays = [Ray(origin=Point3D(*o), direction=Vector3D(*(t - o))) for o, t in zip(origins, targets)]
+
+    def test_arrays_round_trip(self, tmp_path):
+        arrays = {"a": np.arange(7, dtype=np.int16), "b": np.ones((3, 4), dtype=">f8"), "c": np.zeros((0, 3))}
+        write_bundle(tmp_path / "x.rmb", arrays, {"name": "x"}, "key")
+        loaded, meta, key = read_bundle(tmp_path / "x.rmb")
+        assert {"name": "x"} == meta and "key" == key
+        for name, arr in arrays.items():
+            assert arr.dtype == loaded[name].dtype
+            assert np.array_equal(arr, loaded[name])
+            assert 0 == loaded[name].ctypes.data % 64 or 0 == arr.size
+        assert isinstance(_mapping(loaded["b"]), np.memmap)
+        assert [] == [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
+
+    def test_baked_aggregate_matches_source(self, tmp_path):
+        aggregate = BVHAggregate(self.primitives)
+        key = bake(aggregate, tmp_path / "scene.rmb")
+        assert scene_key(self.primitives) == key
+        baked = load(tmp_path / "scene.rmb")
+        assert np.array_equal(aggregate.bvh.node_min, baked.bvh.node_min)
+        mapping = _mapping(baked.bvh.node_min)
+        assert isinstance(mapping, np.memmap)
+        assert mapping is _mapping(baked.primitives[-1].vertices)
+        assert mapping is _mapping(baked.primitives[0].transformation.inverse_matrix.data)
+        assert np.float32 == baked.primitives[-1].vertices.dtype
+        hits = 0
+        for ray in self.rays:
+            expected, record = Intersection(), Intersection()
+            is_hit = aggregate.intersect(ray, expected)
+            assert is_hit == baked.intersect(ray, record)
+            assert aggregate.occluded(ray) == baked.occluded(ray)
+            if is_hit:
+                hits += 1
+                assert expected.t_hit == record.t_hit
+                assert np.allclose(expected.normal.coordinates, record.normal.coordinates)
+        assert hits > 0
+        # a refit writes the copy-on-write mapping, not the file
+        baked.primitives[0].transformation = Transformer(translation_matrix(30.0, 0.0, 0.0))
+        assert baked.refit() > 1.0
+        assert np.array_equal(aggregate.bvh.node_min, load(tmp_path / "scene.rmb").bvh.node_min)
+
+    def test_load_or_bake_follows_scene_changes(self, tmp_path, monkeypatch):
+        first = load_or_bake(self.primitives, tmp_path)
+        builds = []
+        monkeypatch.setattr(bundle, "bake", lambda *args: builds.append(args) or bake(*args))
+        again = load_or_bake(self.primitives, tmp_path)
+        assert [] == builds
+        assert np.array_equal(first.bvh.prim_indices, again.bvh.prim_indices)
+        self.primitives[0].transformation = Transformer(translation_matrix(50.0, 0.0, 0.0))
+        moved = load_or_bake(self.primitives, tmp_path)
+        assert 1 == len(builds)
+        assert 2 == len(os.listdir(tmp_path))
+        assert moved.bvh.bounds()[1][0] > 50.0
+
+    def test_shared_buffers_are_stored_once(self, tmp_path):
+        mesh = self.primitives[-1]
+        copies = [TriangleMesh(mesh.vertices, mesh.indices, transf=Transformer(translation_matrix(float(i), 0.0, 0.0))) for i in range(3)]
+        bake(BVHAggregate(copies), tmp_path / "copies.rmb")
+        arrays, meta, _ = read_bundle(tmp_path / "copies.rmb")
+        assert {"1/vertices": "0/vertices", "2/vertices": "0/vertices", "1/indices": "0/indices", "2/indices": "0/indices"} == meta["aliases"]
+        loaded = load(tmp_path / "copies.rmb")
+        assert np.shares_memory(loaded.primitives[2].vertices, loaded.primitives[0].vertices)
+
+    def test_analytic_primitives(self, tmp_path):
+        primitives = self.primitives[:5] + [
+            Box(Transformer(translation_matrix(4.0, 0.0, -2.0) * y_rot_matrix(0.3)), Point3D(-1.0, -2.0, -1.0), Point3D(2.0, 1.0, 1.0)),
+            Cylinder(Transformer(translation_matrix(-4.0, 1.0, -3.0)), 1.5, -2.0, 2.0),
+            Cylinder(Transformer(translation_matrix(0.0, -5.0, -6.0) * scale_matrix(2.0, 1.0, 1.0)), 1.0, 0.0, 3.0, False),
+        ]
+        aggregate = BVHAggregate(primitives)
+        bake(aggregate, tmp_path / "analytic.rmb")
+        baked = load(tmp_path / "analytic.rmb")
+        assert [type(p) for p in primitives] == [type(p) for p in baked.primitives]
+        assert not baked.primitives[-1].capped and 3.0 == baked.primitives[-1].z_max
+        assert np.array_equal(primitives[5].max_point.data, baked.primitives[5].max_point.data)
+        hits = 0
+        for ray in self.rays:
+            expected, record = Intersection(), Intersection()
+            is_hit = aggregate.intersect(ray, expected)
+            assert is_hit == baked.intersect(ray, record)
+            if is_hit:
+                hits += 1
+                assert expected.t_hit == record.t_hit
+        assert hits > 0
+        # planes cannot be put into an aggregate but are part of the scene key
+        plane = Plane(point=Point3D(0.0, 0.0, -1.0), normal=Normal3D(0.0, 1.0, 1.0))
+        tilted = Plane(point=Point3D(0.0, 0.0, -1.0), normal=Normal3D(0.0, 1.0, 2.0))
+        assert scene_key(primitives + [plane]) != scene_key(primitives + [tilted])
+        assert np.allclose(plane._params(), Plane._from_params(Transformer(), plane._params())._params())
+
+    def test_invalid_bundles(self, tmp_path):
+        path = tmp_path / "bad.rmb"
+        path.write_bytes(b"not a bundle at all")
+        with pytest.raises(ValueError):
+            read_bundle(path)
+        write_bundle(path, {}, {}, "key")
+        data = bytearray(path.read_bytes())
+        data[8] += 1
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            read_bundle(path)
+        with pytest.raises(TypeError):
+            bake(self.primitives, path)
+
+        class Ball(Sphere):
+            pass
+
+        with pytest.raises(TypeError):
+            scene_key([Ball()])
@@ -0,0 +1,299 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import warnings
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVH, BVHAggregate, interval_cull
+from raymann.camera.camera import Camera
+from raymann.common.intersection import Intersection
+from raymann.geometry.plane import Plane
+from raymann.geometry.primitive import primitive_bounds
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix
+from raymann.math_tools.matrix4d import Matrix4D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+from tests.bvh_checks import check_tree
+
+
+def _bounds(prims: list) -> (np.ndarray, np.ndarray):
+    bounds = primitive_bounds(prims)
+    return bounds.mins, bounds.maxs
+
+
+class TestBVH:
+
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.spheres = SphereSet(rng.uniform(-50.0, 50.0, (2000, 3)), rng.uniform(0.1, 0.5, 2000))
+        mins, maxs = self.spheres.prim_bounds()
+        self.bvh = BVH.build(mins, maxs, self.spheres.prim_centroids())
+        self.origins = rng.uniform(-60.0, 60.0, (100, 3))
+        self.directions = rng.uniform(-50.0, 50.0, (100, 3)) - self.origins
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            BVH.build(np.zeros((3, 2)), np.zeros((3, 2)))
+        with pytest.raises(ValueError):
+            BVH.build(np.zeros((3, 3)), np.zeros((3, 3)), max_leaf_size=0)
+
+    def test_tree_structure(self):
+        seen = []
+        check_tree(self.bvh, 0, seen)
+        assert sorted(seen) == list(range(2000))
+        assert len(self.bvh) <= 2 * 2000 - 1
+
+    def test_closest_hit_matches_brute_force(self):
+        calls = []
+
+        def leaf_fn(ids, tmax):
+            calls.append(len(ids))
+            return self.spheres.intersect_prims(o, d, 0.001, tmax, ids)
+
+        all_ids = np.arange(2000)
+        for o, d in zip(self.origins, self.directions):
+            expected = self.spheres.intersect_prims(o, d, 0.001, np.inf, all_ids)
+            assert expected == self.bvh.closest_hit(o, d, 0.001, np.inf, leaf_fn)
+        # far fewer primitives than the linear scan are tested
+        assert sum(calls) < 0.1 * 2000 * len(self.origins)
+
+    def test_any_hit(self):
+        all_ids = np.arange(2000)
+        for o, d in zip(self.origins, self.directions):
+            t, _ = self.spheres.intersect_prims(o, d, 0.001, np.inf, all_ids)
+            hit = self.bvh.any_hit(
+                o, d, 0.001, np.inf, lambda ids, tmax: self.spheres.intersect_prims(o, d, 0.001, tmax, ids)
+            )
+            assert hit == (t < np.inf)
+
+    def test_empty_and_single(self):
+        empty = BVH.build(np.zeros((0, 3)), np.zeros((0, 3)))
+        assert (np.inf, -1) == empty.closest_hit(np.zeros(3), np.ones(3), 0.0, np.inf, None)
+        single = BVH.build(np.array([[-1.0, -1.0, -1.0]]), np.array([[1.0, 1.0, 1.0]]))
+        assert 1 == len(single)
+        assert (2.0, 0) == single.closest_hit(
+            np.array([0.0, 0.0, -3.0]), np.array([0.0, 0.0, 1.0]), 0.0, np.inf, lambda ids, tmax: (2.0, int(ids[0]))
+        )
+
+    def _packet_leaf(self, origins, directions):
+        return lambda ids, rays, tmax: self.spheres.intersect_prims_batch(
+            origins[rays], directions[rays], np.full(len(rays), 0.001), tmax, ids
+        )
+
+    @pytest.mark.parametrize("min_active", [0.0, 0.25, 1.0])
+    def test_packet_matches_single_rays(self, min_active):
+        # the camera looks down -z into the sphere field from its edge
+        camera = Camera(24, 16, np.pi / 3, Matrix4D(translation_matrix(0.0, 0.0, -55.0)))
+        hits = 0
+        for _, _, batch in camera.generate_tiles(8):
+            o, d = batch.origins, batch.directions
+            t, prim = self.bvh.closest_hit_packet(o, d, 0.001, np.inf, self._packet_leaf(o, d), min_active)
+            for i in range(len(batch)):
+                expected = self.bvh.closest_hit(
+                    o[i], d[i], 0.001, np.inf,
+                    lambda ids, tmax: self.spheres.intersect_prims(o[i], d[i], 0.001, tmax, ids),
+                )
+                assert expected == (t[i], prim[i])
+            hits += np.count_nonzero(prim >= 0)
+        assert hits > 0
+
+    def test_packet_of_incoherent_rays(self):
+        o, d = self.origins, self.directions
+        t, prim = self.bvh.closest_hit_packet(o, d, 0.001, np.inf, self._packet_leaf(o, d))
+        for i in range(len(o)):
+            assert self.spheres.intersect_prims(o[i], d[i], 0.001, np.inf, np.arange(2000)) == (t[i], prim[i])
+        empty = BVH.build(np.zeros((0, 3)), np.zeros((0, 3)))
+        t, prim = empty.closest_hit_packet(o, d, 0.0, np.inf, None)
+        assert np.all(prim == -1) and np.all(t == np.inf)
+
+    @pytest.mark.parametrize("min_active", [0.0, 1.0])
+    def test_any_hit_packet(self, min_active):
+        o, d = self.origins, self.directions
+        t, prim = self.bvh.any_hit_packet(o, d, 0.001, np.inf, self._packet_leaf(o, d), min_active)
+        for i in range(len(o)):
+            expected = self.spheres.occluded_prims(o[i], d[i], 0.001, np.inf, np.arange(2000))
+            assert expected == (prim[i] >= 0) == np.isfinite(t[i])
+
+    def test_interval_cull(self):
+        box_min, box_max = np.zeros(3), np.ones(3)
+        o_lo, o_hi = np.array([-0.2, -0.2, -5.0]), np.array([0.2, 0.2, -5.0])
+        inv = np.array([np.inf, np.inf, 1.0])
+        negative = np.zeros(3, dtype=bool)
+        assert not interval_cull(box_min, box_max, o_lo, o_hi, inv, inv, negative, 0.0, np.inf)
+        assert interval_cull(box_min, box_max, o_lo, o_hi, inv, inv, negative, 0.0, 4.0)
+        assert interval_cull(box_min, box_max, o_lo - 2.0, o_hi - 2.0, inv, inv, negative, 0.0, np.inf)
+
+    def test_refit_matches_rebuilt_bounds(self):
+        mins, maxs = self.spheres.prim_bounds()
+        bvh = BVH.build(mins, maxs)
+        assert 1.0 == bvh.refit(mins, maxs)
+        shift = np.random.default_rng(3).uniform(-1.0, 1.0, (2000, 3))
+        growth = bvh.refit(mins + shift, maxs + shift)
+        assert growth > 1.0
+        seen = []
+        check_tree(bvh, 0, seen)
+        leaf = bvh.node_count > 0
+        for node in np.flatnonzero(leaf)[:50]:
+            ids = bvh.prim_indices[bvh.node_offset[node] : bvh.node_offset[node] + bvh.node_count[node]]
+            assert np.array_equal(bvh.node_min[node], (mins + shift)[ids].min(axis=0))
+        assert np.allclose(bvh.bounds()[0], (mins + shift).min(axis=0))
+        assert abs(bvh.refit(mins, maxs) - 1.0) < 1e-12
+        with pytest.raises(ValueError):
+            bvh.refit(mins[:5], maxs[:5])
+
+    def test_stitch(self):
+        rng = np.random.default_rng(8)
+        spheres = SphereSet(rng.uniform(-10.0, 10.0, (300, 3)), 0.5)
+        mins, maxs = spheres.prim_bounds()
+        groups = np.array_split(np.argsort(spheres.centers[:, 0]), 5)
+        subtrees = []
+        for ids in groups:
+            sub = BVH.build(mins[ids], maxs[ids])
+            subtrees.append(
+                BVH(sub.node_min, sub.node_max, sub.node_offset, sub.node_count, sub.node_axis, ids[sub.prim_indices])
+            )
+        root_min = np.array([s.node_min[0] for s in subtrees])
+        root_max = np.array([s.node_max[0] for s in subtrees])
+        # a top holding all subtrees in one leaf exercises the chained expansion
+        tops = [
+            BVH.build(root_min, root_max, max_leaf_size=1),
+            BVH.build(root_min[:1].repeat(5, axis=0), root_max[:1].repeat(5, axis=0)),
+        ]
+        for top in tops:
+            bvh = BVH.stitch(top, subtrees)
+            seen = []
+            check_tree(bvh, 0, seen)
+            assert sorted(seen) == list(range(300))
+            for o in rng.uniform(-12.0, 12.0, (20, 3)):
+                d = -o
+                expected = spheres.intersect_prims(o, d, 0.001, np.inf, np.arange(300))
+                found = bvh.closest_hit(
+                    o, d, 0.001, np.inf, lambda ids, tmax: spheres.intersect_prims(o, d, 0.001, tmax, ids)
+                )
+                assert expected == found
+
+
+class TestBVHAggregate:
+
+    def test_matches_linear_scan(self):
+        rng = np.random.default_rng(5)
+        prims = [
+            Sphere(Transformer(translation_matrix(*c) * scale_matrix(1.0, 2.0, 1.0)), radius=float(r))
+            for c, r in zip(rng.uniform(-20.0, 20.0, (60, 3)), rng.uniform(0.5, 3.0, 60))
+        ]
+        aggregate = BVHAggregate(prims)
+        for o in rng.uniform(-25.0, 25.0, (50, 3)):
+            ray = Ray(origin=Point3D(*o), direction=Vector3D(*(rng.uniform(-20.0, 20.0, 3) - o)))
+            best = Intersection()
+            for prim in prims:
+                rec = Intersection()
+                if prim.intersect(ray, rec) and rec.t_hit < best.t_hit:
+                    best = rec
+            record = Intersection()
+            assert aggregate.intersect(ray, record) == (best.t_hit < np.inf)
+            assert aggregate.any_hit(ray) == (best.t_hit < np.inf)
+            assert best.t_hit == record.t_hit
+
+    def test_invalid_input(self):
+        with pytest.raises(TypeError):
+            BVHAggregate([Point3D()])
+
+    def test_occluded_stops_at_first_hit(self):
+        calls = []
+
+        class Counted(Sphere):
+            def occluded(self, ray):
+                calls.append(self)
+                return super().occluded(ray)
+
+            def intersect(self, ray, record):
+                raise AssertionError("occlusion must not fill hit records")
+
+        prims = [Counted(Transformer(translation_matrix(0.0, 0.0, float(z)))) for z in range(0, 40, 3)]
+        aggregate = BVHAggregate(prims, max_leaf_size=1)
+        ray = Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, 1.0))
+        assert aggregate.occluded(ray)
+        assert len(calls) < len(prims)
+        short = Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, 1.0), tmax=3.0)
+        away = Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, -1.0))
+        batch = RayBatch.from_rays([ray, short, away])
+        assert [True, False, False] == aggregate.occluded_batch(batch).tolist()
+
+    def test_record_of_the_accepted_hit(self):
+
+        class Unclipped(Sphere):
+            # reports hits beyond tmax, which the traversal must reject
+            def intersect(self, ray, record):
+                return super().intersect(Ray(origin=ray.origin, direction=ray.direction, tmin=ray.tmin), record)
+
+        # both boxes are entered at t = 4, the shifted sphere is hit behind that
+        for xs in ((0.0, 0.9), (0.9, 0.0)):
+            prims = [Unclipped(Transformer(translation_matrix(x, 0.0, 0.0))) for x in xs]
+            aggregate = BVHAggregate(prims, max_leaf_size=1)
+            record = Intersection()
+            assert aggregate.intersect(Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, 1.0)), record)
+            assert 4.0 == pytest.approx(record.t_hit)
+            assert -1.0 == pytest.approx(record.hit_point.z)
+
+    def test_occluded_batch_matches_single_rays(self):
+        rng = np.random.default_rng(21)
+        prims = [
+            Sphere(Transformer(translation_matrix(*c) * scale_matrix(1.0, 0.5, 1.0)), radius=float(r))
+            for c, r in zip(rng.uniform(-20.0, 20.0, (80, 3)), rng.uniform(0.5, 2.5, 80))
+        ]
+        aggregate = BVHAggregate(prims, max_leaf_size=2)
+        origins = rng.uniform(-25.0, 25.0, (300, 3))
+        rays = RayBatch(origins, rng.uniform(-20.0, 20.0, (300, 3)) - origins, tmax=rng.uniform(0.2, 1.5, 300))
+        expected = [aggregate.occluded(rays.ray(i)) for i in range(len(rays))]
+        occluded = aggregate.occluded_batch(rays)
+        assert expected == occluded.tolist()
+        assert 0 < np.count_nonzero(occluded) < len(rays)
+
+    def test_primitive_bounds(self):
+        prims = [Sphere(Transformer(translation_matrix(i, 0.0, 0.0)), radius=2.0) for i in range(3)]
+        bounds = primitive_bounds(prims)
+        assert np.array_equal(bounds.mins[2], [0.0, -2.0, -2.0])
+        assert np.array_equal(bounds.centroids()[:, 0], [0.0, 1.0, 2.0])
+
+    def test_unbounded_primitives(self):
+        prims = [Sphere(), Plane(Transformer(translation_matrix(0.0, 0.0, -2.0)))]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            bounds = primitive_bounds(prims)
+            centroids = bounds.centroids()
+        assert np.all(np.isinf(bounds.maxs[1]))
+        assert np.array_equal([0.0, 0.0, 0.0], centroids[0]) and np.all(np.isnan(centroids[1]))
+        with pytest.raises(ValueError):
+            BVHAggregate(prims)
+        aggregate = BVHAggregate(prims[:1])
+        aggregate.primitives.append(prims[1])
+        with pytest.raises(ValueError):
+            aggregate.refit()
+
+    def test_refit_and_rebuild(self):
+        rng = np.random.default_rng(9)
+        centers = rng.uniform(-20.0, 20.0, (40, 3))
+        prims = [Sphere(Transformer(translation_matrix(*c))) for c in centers]
+        aggregate = BVHAggregate(prims)
+        assert 1.0 == aggregate.refit()
+        # scatter the spheres, the old topology no longer fits them
+        for prim, c in zip(prims, rng.uniform(-20.0, 20.0, (40, 3))):
+            prim.transformation = Transformer(translation_matrix(*c))
+        growth = aggregate.refit(max_cost_growth=1e9)
+        assert growth > 1.0
+        center = prims[7].world_bounding_box().centroid()
+        ray = Ray(origin=center - 10.0, direction=Vector3D(1.0, 1.0, 1.0))
+        record = Intersection()
+        assert aggregate.intersect(ray, record)
+        before = aggregate.bvh
+        assert growth == aggregate.refit(max_cost_growth=1.0)
+        assert aggregate.bvh is not before
+        assert abs(aggregate.bvh.refit(*_bounds(prims)) - 1.0) < 1e-12
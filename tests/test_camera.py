@@ -52,3 +52,47 @@ class TestCamera:
         assert abs(np.sqrt(2) / 2 - ray.direction.x) < self.eps
         assert abs(0 - ray.direction.y) < self.eps
         assert abs(-np.sqrt(2) / 2 - ray.direction.z) < self.eps
+
+    def test_generate_rays_matches_get_ray(self):
+        c = Camera(
+            21,
+            11,
+            np.pi / 2,
+            Matrix4D(y_rot_matrix(np.pi / 4) * translation_matrix(0, -2, 5)),
+        )
+        batch = c.generate_rays()
+        assert 21 * 11 == len(batch)
+        for i in (0, 7, 21 * 5 + 10, 21 * 11 - 1):
+            ray = c.get_ray(i % 21, i // 21)
+            assert np.allclose(ray.origin.coordinates, batch.origins[i])
+            assert np.allclose(ray.direction.coordinates, batch.directions[i])
+
+    def test_generate_rays_for_tile(self):
+        c = Camera(201, 101, np.pi / 2, Matrix4D())
+        batch = c.generate_rays(96, 48, 104, 56)
+        assert 64 == len(batch)
+        center = batch[2 * 8 + 4]
+        assert abs(0 - center.direction.x) < self.eps
+        assert abs(0 - center.direction.y) < self.eps
+        assert abs(-1 - center.direction.z) < self.eps
+        with pytest.raises(ValueError):
+            c.generate_rays(10, 10, 5, 20)
+
+    def test_generate_rays_with_jitter(self):
+        c = Camera(4, 2, np.pi / 2, Matrix4D())
+        centered = c.generate_rays(jitter=np.full((2, 4, 2), 0.5))
+        assert np.allclose(c.generate_rays().directions, centered.directions)
+        corner = c.generate_rays(jitter=np.zeros((8, 2)))
+        ray = c.get_ray(-0.5, -0.5)
+        assert np.allclose(ray.direction.coordinates, corner.directions[0])
+        with pytest.raises(ValueError):
+            c.generate_rays(jitter=np.zeros((3, 2)))
+
+    def test_generate_tiles(self):
+        c = Camera(20, 10, np.pi / 2, Matrix4D())
+        tiles = list(c.generate_tiles(8))
+        assert [(0, 0), (8, 0), (16, 0), (0, 8), (8, 8), (16, 8)] == [(x, y) for x, y, _ in tiles]
+        assert [64, 64, 32, 16, 16, 8] == [len(batch) for _, _, batch in tiles]
+        assert np.allclose(c.generate_rays(16, 8, 20, 10).directions, tiles[-1][2].directions)
+        with pytest.raises(ValueError):
+            next(c.generate_tiles(0))
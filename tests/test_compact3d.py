@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.common import validation
+from raymann.math_tools.compact3d import CompactNormal3D, CompactPoint3D, CompactVector3D
+from raymann.math_tools.math_utils import cross, dot, translation_matrix, y_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.vector3d import Vector3D
+
+
+class TestCompact3D:
+
+    def setup_method(self):
+        self.eps = 1E-12
+
+    def test_init_with_invalid_data(self):
+        with pytest.raises(TypeError):
+            CompactVector3D("[1, 2, 3]")
+        with pytest.raises(TypeError):
+            CompactPoint3D(np.array([0, 1, 2]))
+        with pytest.raises(TypeError):
+            CompactNormal3D(Vector3D())
+        with pytest.raises(TypeError):
+            CompactVector3D().x = "1"
+
+    def test_unchecked_mode(self):
+        v = CompactVector3D(1, 2, 3)
+        with validation.unchecked():
+            v.x = np.int64(4)
+            assert CompactPoint3D(np.int64(1), 2, 3) == CompactPoint3D(1, 2, 3)
+        assert CompactVector3D(4, 2, 3) == v
+        with pytest.raises(TypeError):
+            v.y = np.int64(4)
+
+    def test_arrays_are_copies(self):
+        v = CompactVector3D(1, 2, 3)
+        arr = np.asarray(v)
+        arr[0] = 5.0
+        assert 1.0 == v.x and np.float32 == np.asarray(v, dtype=np.float32).dtype
+        with pytest.raises(ValueError):
+            np.array(v, copy=False)
+
+    def test_slots(self):
+        v = CompactVector3D(1, 2, 3)
+        with pytest.raises(AttributeError):
+            v.w = 4.0
+        assert not hasattr(v, "__dict__")
+
+    @pytest.mark.parametrize("compact, reference", [(CompactVector3D, Vector3D),
+                                                    (CompactPoint3D, Point3D),
+                                                    (CompactNormal3D, Normal3D)])
+    def test_operators_match_ndarray_backend(self, compact, reference):
+        a, b, c = compact(1, 2, 3), compact(5, 6, 7), compact(-0.7, 4.5, -0.232)
+        ra, rb, rc = reference(1, 2, 3), reference(5, 6, 7), reference(-0.7, 4.5, -0.232)
+        res = -a + b - c * np.abs(a) + 2.5
+        ref = -ra + rb - rc * np.abs(ra) + 2.5
+        assert np.allclose(ref.coordinates, res.coordinates, atol=self.eps)
+        assert type(ref).__name__ == type(res).__name__.removeprefix("Compact")
+        assert str(ref) == str(res)
+
+    @pytest.mark.parametrize("compact, reference", [(CompactVector3D, Vector3D),
+                                                    (CompactPoint3D, Point3D),
+                                                    (CompactNormal3D, Normal3D)])
+    def test_in_place_and_out_match_ndarray_backend(self, compact, reference):
+        a, ra = compact(1, 2, 3), reference(1, 2, 3)
+        a += compact(0.5, -1, 2)
+        a -= 0.25
+        a *= compact(2, 3, 4)
+        ra += reference(0.5, -1, 2)
+        ra -= 0.25
+        ra *= reference(2, 3, 4)
+        assert isinstance(a, compact)
+        assert np.allclose(ra.coordinates, a.coordinates, atol=self.eps)
+        out, ref_out = compact(), reference()
+        assert out is a.add(compact(1, 1, 1), out=out)
+        a.mul(2.0, out=out).sub(0.5, out=out)
+        ra.add(reference(1, 1, 1), out=ref_out)
+        ra.mul(2.0, out=ref_out).sub(0.5, out=ref_out)
+        assert np.allclose(ref_out.coordinates, out.coordinates, atol=self.eps)
+        assert str(ra.add(1.0)) == str(a.add(1.0))
+
+    def test_in_place_point_vector_semantics(self):
+        for point, vector in ((CompactPoint3D, CompactVector3D), (Point3D, Vector3D)):
+            p = point(1, 2, 3)
+            p -= vector(1, 1, 1)
+            assert point(0, 1, 2) == p
+            with pytest.raises(TypeError):
+                p += vector(1, 0, 0)
+            with pytest.raises(TypeError):
+                p -= point()
+            out = vector()
+            assert out is p.sub(point(), out=out)
+            with pytest.raises(TypeError):
+                p.sub(point(), out=point())
+            with pytest.raises(TypeError):
+                v = vector(1, 2, 3)
+                v += p
+
+    def test_point_vector_semantics(self):
+        p = CompactPoint3D(1, 2, 3)
+        v = CompactVector3D(1, 0, 0)
+        assert isinstance(p - CompactPoint3D(), CompactVector3D)
+        assert isinstance(p - v, CompactPoint3D)
+        assert p == CompactVector3D(1, 2, 3)
+        with pytest.raises(TypeError):
+            v == p
+
+    def test_vector_functions(self):
+        a, b = CompactVector3D(4.5, -0.68, 7.3), CompactVector3D(0.0, -13.4, -0.44)
+        ra, rb = Vector3D(4.5, -0.68, 7.3), Vector3D(0.0, -13.4, -0.44)
+        assert abs(dot(ra, rb) - dot(a, b)) < self.eps
+        assert np.allclose(cross(ra, rb).coordinates, cross(a, b).coordinates)
+        assert abs(ra.length() - a.length()) < self.eps
+        assert np.allclose(ra.normalized().coordinates, a.normalized().coordinates)
+        with pytest.raises(TypeError):
+            dot(a, rb)
+
+    def test_matrix_multiplication(self):
+        m = translation_matrix(1, 2, 3) * y_rot_matrix(0.4)
+        for compact, reference in [(CompactVector3D, Vector3D),
+                                   (CompactPoint3D, Point3D),
+                                   (CompactNormal3D, Normal3D)]:
+            res = m * compact(0.5, -1, 2)
+            assert isinstance(res, compact)
+            assert np.allclose((m * reference(0.5, -1, 2)).coordinates, res.coordinates)
+
+    def test_ray(self):
+        ray = Ray(origin=CompactPoint3D(2, 3, 4), direction=CompactVector3D(1, 0, 0))
+        assert CompactPoint3D(4.5, 3, 4) == ray.position(2.5)
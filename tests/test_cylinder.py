@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.common.intersection import Intersection
+from raymann.geometry.cylinder import Cylinder
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, x_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+class TestCylinder:
+
+    @pytest.mark.parametrize("capped, origin, direction, t, normal",
+                             [(True, Point3D(-5.0, 0.0, 0.0), Vector3D(1.0, 0.0, 0.0), 4.0, (-1.0, 0.0, 0.0)),
+                              (True, Point3D(0.0, 0.0, 5.0), Vector3D(0.0, 0.0, -1.0), 4.0, (0.0, 0.0, 1.0)),
+                              (False, Point3D(0.0, 0.0, 5.0), Vector3D(0.0, 0.0, -1.0), np.inf, None),
+                              (True, Point3D(-5.0, 0.0, 3.0), Vector3D(1.0, 0.0, 0.0), np.inf, None),
+                              (False, Point3D(0.0, 0.0, 0.0), Vector3D(0.0, 2.0, 0.0), 0.5, (0.0, 1.0, 0.0)),
+                              (False, Point3D(0.0, -5.0, 3.5), Vector3D(0.0, 1.0, -0.5), 6.0, (0.0, 1.0, 0.0)),
+                              ])
+    def test_ray_cylinder_intersection(self, capped, origin, direction, t, normal):
+        cylinder = Cylinder(capped=capped)
+        ray = Ray(origin=origin, direction=direction)
+        record = Intersection()
+        assert np.isfinite(t) == cylinder.intersect(ray, record) == cylinder.occluded(ray)
+        if np.isfinite(t):
+            assert t == pytest.approx(record.t_hit)
+            assert Normal3D(*normal) == record.normal
+
+    def test_batch_matches_single_rays(self):
+        cylinder = Cylinder(Transformer(translation_matrix(0.0, 1.0, 0.0) * x_rot_matrix(0.5) * scale_matrix(2.0, 1.0, 1.0)),
+                            0.8, -0.5, 2.0)
+        rng = np.random.default_rng(9)
+        origins = rng.uniform(-5.0, 5.0, (150, 3))
+        rays = RayBatch(origins, rng.uniform(-1.0, 1.0, (150, 3)) - 0.4 * origins)
+        res = cylinder.intersect_batch(rays)
+        assert np.array_equal(res.hit, cylinder.occluded_batch(rays))
+        assert 10 < np.count_nonzero(res.hit) < 150
+        for i in range(len(rays)):
+            record = Intersection()
+            assert res.hit[i] == cylinder.intersect(rays.ray(i), record)
+            if res.hit[i]:
+                assert res.t_hit[i] == record.t_hit
+                p = cylinder.transformation.world_to_obj_space(record.hit_point).data
+                assert np.hypot(p[0], p[1]) <= 0.8 + 1e-9 and -0.5 - 1e-9 <= p[2] <= 2.0 + 1e-9
+
+    def test_bounds_and_area(self):
+        cylinder = Cylinder(radius=2.0, z_min=0.0, z_max=3.0)
+        assert np.array_equal([-2.0, -2.0, 0.0], cylinder.bounding_box().min_point.data)
+        assert 12.0 * np.pi + 8.0 * np.pi == pytest.approx(cylinder.surface_area())
+        assert 12.0 * np.pi == pytest.approx(Cylinder(radius=2.0, z_min=0.0, z_max=3.0, capped=False).surface_area())
+        with pytest.raises(ValueError):
+            Cylinder(radius=0.0)
+        with pytest.raises(TypeError):
+            Cylinder(radius="1")
+        with pytest.raises(ValueError):
+            Cylinder(z_min=1.0, z_max=1.0)
+        with pytest.raises(TypeError):
+            Cylinder(capped=1)
@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVHAggregate
+from raymann.acceleration.instancing import Instance, TwoLevelBVH
+from raymann.common.intersection import Intersection
+from raymann.geometry.sphere import Sphere
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, y_rot_matrix
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+class TestInstancing:
+
+    def setup_method(self):
+        rng = np.random.default_rng(17)
+        # a "tree": a trunk and a crown, instanced all over a field
+        self.parts = [
+            (translation_matrix(0.0, 1.0, 0.0) * scale_matrix(0.3, 1.0, 0.3), 1.0),
+            (translation_matrix(0.0, 2.5, 0.0), 1.2),
+        ]
+        self.tree = BVHAggregate([Sphere(Transformer(m), radius=r) for m, r in self.parts])
+        self.placements = [
+            translation_matrix(x, 0.0, z) * y_rot_matrix(a) * scale_matrix(s, s, s)
+            for x, z, a, s in zip(
+                rng.uniform(-40.0, 40.0, 150),
+                rng.uniform(-40.0, 40.0, 150),
+                rng.uniform(0.0, 6.0, 150),
+                rng.uniform(0.5, 1.5, 150),
+            )
+        ]
+        self.forest = TwoLevelBVH([Instance(self.tree, Transformer(m)) for m in self.placements])
+        origins = rng.uniform(-50.0, 50.0, (80, 3))
+        targets = rng.uniform(-40.0, 40.0, (80, 3)) * [1.0, 0.05, 1.0]
+        self.rays = [Ray(origin=Point3D(*o), direction=Vector3D(*(t - o))) for o, t in zip(origins, targets)]
+
+    def test_geometry_is_shared(self):
+        assert all(instance.geometry is self.tree for instance in self.forest.instances)
+        with pytest.raises(TypeError):
+            Instance([Sphere()])
+        with pytest.raises(TypeError):
+            TwoLevelBVH([self.tree])
+
+    def test_matches_flattened_scene(self):
+        flat = [Sphere(Transformer(p * m), radius=r) for p in self.placements for m, r in self.parts]
+        hits = 0
+        for ray in self.rays:
+            best = Intersection()
+            for prim in flat:
+                rec = Intersection()
+                if prim.intersect(ray, rec) and rec.t_hit < best.t_hit:
+                    best = rec
+            record = Intersection()
+            is_hit = best.t_hit < np.inf
+            assert is_hit == self.forest.intersect(ray, record)
+            assert is_hit == self.forest.any_hit(ray)
+            assert is_hit == self.forest.occluded(ray)
+            if is_hit:
+                hits += 1
+                assert abs(best.t_hit - record.t_hit) < 1e-9
+                assert np.allclose(best.hit_point.coordinates, record.hit_point.coordinates)
+                assert np.allclose(best.normal.coordinates, record.normal.coordinates)
+        assert hits > 0
+        expected = [self.forest.occluded(ray) for ray in self.rays]
+        assert expected == self.forest.occluded_batch(RayBatch.from_rays(self.rays)).tolist()
+
+    def test_occluded_batch_matches_single_rays(self):
+        rng = np.random.default_rng(23)
+        origins = rng.uniform(-50.0, 50.0, (300, 3))
+        targets = rng.uniform(-40.0, 40.0, (300, 3)) * [1.0, 0.05, 1.0]
+        rays = RayBatch(origins, targets - origins, tmax=rng.uniform(0.3, 1.2, 300))
+        expected = [self.forest.occluded(rays.ray(i)) for i in range(len(rays))]
+        occluded = self.forest.occluded_batch(rays)
+        assert expected == occluded.tolist()
+        assert 0 < np.count_nonzero(occluded) < len(rays)
+
+    def test_moving_an_instance(self):
+        ray = Ray(origin=Point3D(100.0, 2.5, -20.0), direction=Vector3D(0.0, 0.0, 1.0))
+        assert not self.forest.any_hit(ray)
+        self.forest.instances[0].transformation = Transformer(translation_matrix(100.0, 0.0, 0.0))
+        assert self.forest.refit() > 0.0
+        record = Intersection()
+        assert self.forest.intersect(ray, record)
+        assert abs(record.t_hit - 18.8) < 1e-9
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.lbvh import build_lbvh, morton_codes, radix_sort
+from raymann.geometry.sphere_set import SphereSet
+from tests.bvh_checks import check_tree
+
+
+class TestLBVH:
+
+    def setup_method(self):
+        rng = np.random.default_rng(21)
+        self.spheres = SphereSet(rng.uniform(-50.0, 50.0, (3000, 3)), rng.uniform(0.1, 0.5, 3000))
+        self.mins, self.maxs = self.spheres.prim_bounds()
+        self.origins = rng.uniform(-60.0, 60.0, (60, 3))
+        self.directions = rng.uniform(-50.0, 50.0, (60, 3)) - self.origins
+
+    def test_morton_codes(self):
+        points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=float)
+        assert np.array_equal(morton_codes(points, 30), [0, 0x9249249, 0x9249249 << 1, 0x9249249 << 2, (1 << 30) - 1])
+        assert morton_codes(points, 63)[4] == (1 << 63) - 1
+        assert morton_codes(np.ones((4, 3)), 30).tolist() == [0, 0, 0, 0]
+        with pytest.raises(ValueError):
+            morton_codes(points, 32)
+
+    def test_radix_sort(self):
+        codes = np.random.default_rng(1).integers(0, 1 << 62, 5000, dtype=np.uint64)
+        codes[:100] = codes[100:200]
+        order = radix_sort(codes)
+        assert np.array_equal(order, np.argsort(codes, kind="stable"))
+
+    @pytest.mark.parametrize("kwargs", [{}, {"bits": 63}, {"optimize_treelets": True}, {"max_leaf_size": 1}])
+    def test_closest_hit_matches_brute_force(self, kwargs):
+        bvh = build_lbvh(self.mins, self.maxs, self.spheres.prim_centroids(), **kwargs)
+        seen = []
+        check_tree(bvh, 0, seen)
+        assert sorted(seen) == list(range(3000))
+        assert bvh.node_count.max() <= kwargs.get("max_leaf_size", 4)
+        all_ids = np.arange(3000)
+        hits = 0
+        for o, d in zip(self.origins, self.directions):
+            expected = self.spheres.intersect_prims(o, d, 0.001, np.inf, all_ids)
+            found = bvh.closest_hit(o, d, 0.001, np.inf, lambda ids, tmax: self.spheres.intersect_prims(o, d, 0.001, tmax, ids))
+            assert expected == found
+            hits += expected[1] >= 0
+        assert hits > 0
+
+    def test_duplicate_centroids(self):
+        mins = np.zeros((50, 3))
+        bvh = build_lbvh(mins, mins + 1.0, max_leaf_size=2)
+        seen = []
+        check_tree(bvh, 0, seen)
+        assert sorted(seen) == list(range(50))
+        assert bvh.node_count.max() <= 2
+
+    def test_empty_and_invalid(self):
+        empty = build_lbvh(np.zeros((0, 3)), np.zeros((0, 3)))
+        assert 0 == empty.prim_indices.shape[0]
+        with pytest.raises(ValueError):
+            build_lbvh(np.zeros((3, 2)), np.zeros((3, 2)))
+        with pytest.raises(ValueError):
+            build_lbvh(self.mins, self.maxs, treelet_bits=40)
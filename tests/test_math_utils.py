@@ -90,3 +90,15 @@ class TestMathUtils:
         m = c * b * a
         res = m * p
         assert Point3D(15, 0, 7) == res
+
+    def test_cross_product_into(self):
+        a = Vector3D(4.5, -0.68, 7.3)
+        b = Vector3D(0.0, -13.4, -0.44)
+        expected = cross(a, b)
+        out = Vector3D()
+        assert out is cross(a, b, out=out)
+        assert np.allclose(expected.coordinates, out.coordinates)
+        cross_into(a, b, a)
+        assert np.allclose(expected.coordinates, a.coordinates)
+        with pytest.raises(TypeError):
+            cross_into(a, b, Point3D())
@@ -5,6 +5,10 @@ import numpy as np
 import pytest
 
 from raymann.math_tools.matrix4d import Matrix4D
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, x_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.vector3d import Vector3D
 from raymann.math_tools.vector4d import Vector4D
 
 
@@ -40,3 +44,37 @@ class TestMatrix4D:
         v = Vector4D(-0.8, 3.14, -5, 44.0)
         res = m * v
         assert v == res
+
+    def test_bulk_transforms(self):
+        m = translation_matrix(1, 2, 3) * x_rot_matrix(np.pi / 3) * scale_matrix(2, 1, 0.5)
+        arr = np.array([[1.0, 0.0, 0.0], [0.5, -2.0, 4.0], [0.0, 0.0, 0.0]])
+        points = m.transform_points(arr)
+        vectors = m.transform_vectors(arr)
+        normals = m.transform_normals(arr)
+        for i, row in enumerate(arr):
+            assert np.allclose((m * Point3D(*row)).coordinates, points[i])
+            assert np.allclose((m * Vector3D(*row)).coordinates, vectors[i])
+            n = m.inverse.transpose * Normal3D(*row)
+            assert np.allclose(n.coordinates, normals[i])
+
+        out = np.empty((3, 3))
+        res = m.transform_points(arr, out=out)
+        assert res is out
+        assert np.array_equal(points, out)
+        m.transform_vectors(arr, out=out)
+        assert np.array_equal(vectors, out)
+
+        with pytest.raises(TypeError):
+            m.transform_points([[1.0, 2.0, 3.0]])
+        with pytest.raises(ValueError):
+            m.transform_points(np.ones((2, 4)))
+        with pytest.raises(ValueError):
+            m.transform_points(arr, out=np.empty((2, 3)))
+
+    def test_copy_does_not_share_data_or_inverse(self):
+        m = Matrix4D(np.diag([2.0, 2.0, 2.0, 1.0]))
+        assert 0.5 == m.inverse[0, 0]
+        c = Matrix4D(m)
+        c[0, 0] = 4.0
+        assert 2.0 == m[0, 0] and 0.5 == m.inverse[0, 0]
+        assert 0.25 == c.inverse[0, 0]
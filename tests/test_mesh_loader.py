@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+from raymann.io.mesh_loader import load_mesh, load_obj, load_ply
+
+OBJ = b"""# a unit square and a triangle
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0 0
+vn 0 0 1
+g square
+f 1/1/1 2/1/1 3/1/1 4/1/1
+v 2 0 0 1.0
+v 3 0 0 1.0
+v 2 1 0 1.0
+f -3 -2 -1
+"""
+
+
+def _write_ply(path, vertices, faces, order="<", vertex_props=("x", "y", "z"), extra=None):
+    """binary PLY with float vertex properties and uchar/int face lists"""
+    fmt = "binary_little_endian" if order == "<" else "binary_big_endian"
+    header = [f"ply\nformat {fmt} 1.0\ncomment test\nelement vertex {len(vertices)}\n"]
+    header += [f"property float {p}\n" for p in vertex_props]
+    header.append(f"element face {len(faces)}\nproperty list uchar int vertex_indices\n")
+    if extra is not None:
+        header.append("property uchar flags\n")
+    header.append("end_header\n")
+    with open(path, "wb") as f:
+        f.write("".join(header).encode())
+        f.write(np.asarray(vertices, dtype=order + "f4").tobytes())
+        for face in faces:
+            f.write(np.uint8(len(face)).tobytes())
+            f.write(np.asarray(face, dtype=order + "i4").tobytes())
+            if extra is not None:
+                f.write(np.uint8(extra).tobytes())
+
+
+class TestMeshLoader:
+
+    def setup_method(self):
+        self.vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [3, 0, 0], [2, 1, 0]], dtype=float)
+        self.triangles = [[0, 1, 2], [0, 2, 3], [4, 5, 6]]
+
+    @pytest.mark.parametrize("chunk_bytes", [None, 1, 17])
+    def test_obj(self, tmp_path, chunk_bytes):
+        path = tmp_path / "mesh.obj"
+        path.write_bytes(OBJ)
+        data = load_obj(path, chunk_bytes=chunk_bytes)
+        assert np.array_equal(self.vertices, data.vertices)
+        assert self.triangles == data.indices.tolist()
+        assert np.float32 == data.vertices.dtype and np.int32 == data.indices.dtype
+        assert data.vertices.flags.c_contiguous and data.indices.flags.c_contiguous
+        assert data.normals is None
+        assert len(OBJ) == data.bytes_read and data.throughput > 0.0
+        mesh = data.to_mesh()
+        assert np.shares_memory(mesh.vertices, data.vertices)
+        assert np.shares_memory(mesh.indices, data.indices)
+
+    @pytest.mark.parametrize("chunk_bytes", [None, 7])
+    def test_obj_mixed_vertex_widths(self, tmp_path, chunk_bytes):
+        path = tmp_path / "mixed.obj"
+        path.write_bytes(b"v 0 0 0\nv 1 0 0\nv 0 1 0 0.5 0.5 0.5\nv 1 1 0 1.0\nf 1 2 3\nf 2 4 3\n")
+        data = load_obj(path, chunk_bytes=chunk_bytes)
+        assert [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]] == data.vertices.tolist()
+        assert [[0, 1, 2], [1, 3, 2]] == data.indices.tolist()
+
+    def test_obj_errors(self, tmp_path):
+        path = tmp_path / "bad.obj"
+        path.write_bytes(b"v 0 0 0\nv 1 0 0\nf 1 2 3\n")
+        with pytest.raises(ValueError):
+            load_obj(path)
+        path.write_bytes(b"v 0 0 0\nv 1 0 0\nf 1 2\n")
+        with pytest.raises(ValueError):
+            load_obj(path)
+        path.write_bytes(b"v 0 0 0\nv 1 0\nv 1 1 0 1\n")
+        with pytest.raises(ValueError):
+            load_obj(path)
+        with pytest.raises(ValueError):
+            load_mesh(tmp_path / "mesh.stl")
+
+    @pytest.mark.parametrize("order", ["<", ">"])
+    def test_ply_is_mapped(self, tmp_path, order):
+        path = tmp_path / "mesh.ply"
+        _write_ply(path, self.vertices, self.triangles, order)
+        data = load_mesh(path)
+        assert isinstance(data.vertices, np.memmap)
+        assert np.array_equal(self.vertices, data.vertices)
+        assert self.triangles == data.indices.tolist()
+        assert np.int32 == data.indices.dtype and data.indices.flags.c_contiguous
+        mesh = data.to_mesh()
+        # the mapped vertex block and the index buffer are used without a copy
+        assert np.shares_memory(mesh.vertices, data.vertices)
+        assert np.shares_memory(mesh.indices, data.indices)
+        bvh = BVH.build(*mesh.prim_bounds(), mesh.prim_centroids())
+        assert np.array_equal(bvh.bounds()[1], [3.0, 1.0, 0.0])
+
+    def test_ply_normals_and_polygons(self, tmp_path):
+        path = tmp_path / "quads.ply"
+        normals = np.tile([0.0, 0.0, 1.0], (7, 1))
+        _write_ply(path, np.hstack((self.vertices, normals)), [[0, 1, 2, 3], [4, 5, 6, 4]], vertex_props=("x", "y", "z", "nx", "ny", "nz"), extra=7)
+        data = load_ply(path)
+        assert np.array_equal(self.vertices, data.vertices)
+        assert np.array_equal(normals, data.normals)
+        assert [[0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 4]] == data.indices.tolist()
+        # mixed polygon sizes
+        _write_ply(path, self.vertices, [[0, 1, 2, 3], [4, 5, 6]])
+        data = load_ply(path)
+        assert self.triangles == data.indices.tolist()
+
+    def test_ply_mixed_polygon_runs(self, tmp_path):
+        rng = np.random.default_rng(5)
+        # runs of equal sizes longer and shorter than the mapped slices
+        sizes = np.repeat(rng.integers(3, 7, 40), rng.integers(1, 150, 40))
+        faces = [list(rng.integers(0, 7, k)) for k in sizes]
+        path = tmp_path / "polygons.ply"
+        _write_ply(path, self.vertices, faces, ">", extra=1)
+        data = load_mesh(path, index_dtype=np.int64)
+        expected = [[f[0], f[i], f[i + 1]] for f in faces for i in range(1, len(f) - 1)]
+        assert expected == data.indices.tolist()
+        assert np.int64 == data.indices.dtype and data.indices.flags.c_contiguous
+
+    def test_ply_errors(self, tmp_path):
+        path = tmp_path / "ascii.ply"
+        path.write_bytes(b"ply\nformat ascii 1.0\nelement vertex 0\nproperty float x\nend_header\n")
+        with pytest.raises(ValueError):
+            load_ply(path)
+        path.write_bytes(b"solid\n")
+        with pytest.raises(ValueError):
+            load_ply(path)
+        path = tmp_path / "truncated.ply"
+        _write_ply(path, self.vertices, [[0, 1, 2, 3], [4, 5, 6]])
+        path.write_bytes(path.read_bytes()[:-5])
+        with pytest.raises(ValueError):
+            load_ply(path)
@@ -0,0 +1,40 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+from raymann.acceleration.parallel_build import build_parallel
+
+_FIELDS = ("node_min", "node_max", "node_offset", "node_count", "node_axis", "prim_indices")
+
+
+class TestParallelBuild:
+
+    def setup_method(self):
+        rng = np.random.default_rng(13)
+        self.mins = rng.uniform(-20.0, 20.0, (600, 3))
+        self.maxs = self.mins + rng.uniform(0.1, 1.0, (600, 3))
+
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_matches_sequential_build(self, workers):
+        expected = BVH.build(self.mins, self.maxs)
+        bvh = build_parallel(self.mins, self.maxs, workers=workers, subtree_size=40)
+        for field in _FIELDS:
+            assert np.array_equal(getattr(expected, field), getattr(bvh, field))
+
+    def test_single_subtree_and_empty(self):
+        bvh = build_parallel(self.mins, self.maxs, workers=2)
+        assert np.array_equal(BVH.build(self.mins, self.maxs).node_offset, bvh.node_offset)
+        empty = build_parallel(np.zeros((0, 3)), np.zeros((0, 3)), workers=2)
+        assert 0 == empty.prim_indices.shape[0]
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            build_parallel(self.mins, self.maxs, workers=0)
+        with pytest.raises(ValueError):
+            build_parallel(self.mins, self.maxs, subtree_size=0)
+        with pytest.raises(ValueError):
+            build_parallel(np.zeros((3, 2)), np.zeros((3, 2)))
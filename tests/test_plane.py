@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.common.intersection import Intersection
+from raymann.geometry.plane import Plane
+from raymann.geometry.sphere import Sphere
+from raymann.math_tools.math_utils import translation_matrix, x_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.scene.scene import Scene
+from raymann.transformation.transformer import Transformer
+
+
+class TestPlane:
+
+    @pytest.mark.parametrize("origin, direction, t",
+                             [(Point3D(0.0, 0.0, 5.0), Vector3D(0.0, 0.0, -1.0), 5.0),
+                              (Point3D(3.0, 1.0, -2.0), Vector3D(0.0, 0.0, 2.0), 1.0),
+                              (Point3D(0.0, 0.0, 5.0), Vector3D(1.0, 0.0, 0.0), np.inf),
+                              (Point3D(0.0, 0.0, 5.0), Vector3D(0.0, 0.0, 1.0), np.inf),
+                              ])
+    def test_ray_plane_intersection(self, origin, direction, t):
+        plane = Plane()
+        ray = Ray(origin=origin, direction=direction)
+        record = Intersection()
+        assert np.isfinite(t) == plane.intersect(ray, record) == plane.occluded(ray)
+        if np.isfinite(t):
+            assert t == record.t_hit
+            assert Normal3D(0.0, 0.0, 1.0) == record.normal
+
+    def test_transformed_plane(self):
+        # the xy plane turned into the xz plane and lifted to y = 2
+        plane = Plane(Transformer(translation_matrix(0.0, 2.0, 0.0) * x_rot_matrix(np.pi / 2)))
+        ray = Ray(origin=Point3D(1.0, 5.0, 1.0), direction=Vector3D(0.0, -1.0, 0.0))
+        record = Intersection()
+        assert plane.intersect(ray, record)
+        assert 3.0 == pytest.approx(record.t_hit)
+        assert np.allclose([1.0, 2.0, 1.0], record.hit_point.coordinates)
+        assert np.allclose([0.0, 1.0, 0.0], np.abs(record.normal.coordinates))
+
+    def test_unbounded(self):
+        plane = Plane(point=Point3D(0.0, 0.0, -1.0), normal=Normal3D(0.0, 0.0, 2.0))
+        assert 1.0 == plane.normal.z
+        assert np.all(np.isinf(plane.world_bounding_box().max_point.data))
+        assert np.isinf(plane.surface_area())
+        with pytest.raises(ValueError):
+            Plane(normal=Normal3D(0.0, 0.0, 0.0))
+        # the scene keeps the plane out of its BVH and still finds it
+        scene = Scene()
+        scene.add(Sphere())
+        scene.add(plane)
+        scene.commit()
+        rays = RayBatch(np.array([[0.0, 0.0, 5.0], [3.0, 0.0, 5.0], [3.0, 0.0, 5.0]]),
+                        np.array([[0.0, 0.0, -1.0], [0.0, 0.0, -1.0], [0.0, 0.0, 1.0]]))
+        res = scene.intersect_batch(rays)
+        assert [0, 1, -1] == res.prim_ids.tolist()
+        assert np.allclose([4.0, 6.0], res.t_hit[:2])
+        assert [True, True, False] == scene.occluded_batch(rays).tolist()
@@ -6,6 +6,7 @@ import pytest
 import numpy as np
 
 from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.vector3d import Vector3D
 
 
 class TestPoint3D:
@@ -39,3 +40,33 @@ class TestPoint3D:
             v.y = "2"
         with pytest.raises(TypeError):
             v.z = "3"
+
+    def test_in_place_operators(self):
+        p = Point3D(1, 2, 3)
+        data = p._data
+        p += Point3D(1, 0, -1)
+        p -= Vector3D(0.5, 0.5, 0.5)
+        p *= 2
+        assert p._data is data
+        assert Point3D(3, 3, 3) == p
+        with pytest.raises(TypeError):
+            p -= Point3D()
+        # p += v must agree with p = p + v, which is a Vector3D
+        assert isinstance(p + Vector3D(1, 0, 0), Vector3D)
+        with pytest.raises(TypeError):
+            p += Vector3D(1, 0, 0)
+        assert Point3D(3, 3, 3) == p
+
+    def test_out_methods(self):
+        p = Point3D(1, 2, 3)
+        q = Point3D(0, -1, 4)
+        v = Vector3D()
+        assert v is p.sub(q, out=v)
+        assert Vector3D(1, 3, -1) == v
+        out = Point3D()
+        p.sub(v, out=out)
+        assert Point3D(0, -1, 4) == out
+        p.mul(q, out=out)
+        assert p * q == out
+        with pytest.raises(TypeError):
+            p.sub(q, out=Point3D())
@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+
+
+class TestRayBatch:
+
+    def setup_method(self):
+        self.origins = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [-1.0, 0.5, 2.0]])
+        self.directions = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, -1.0, 0.0]])
+
+    def test_init(self):
+        batch = RayBatch(self.origins, self.directions)
+        assert 3 == len(batch)
+        assert batch.origins.flags["C_CONTIGUOUS"]
+        assert np.array_equal(np.full(3, 0.001), batch.tmin)
+        assert np.all(np.isinf(batch.tmax))
+
+    def test_init_with_invalid_data(self):
+        with pytest.raises(TypeError):
+            RayBatch("origins", self.directions)
+        with pytest.raises(ValueError):
+            RayBatch(self.origins, self.directions[:2])
+        with pytest.raises(ValueError):
+            RayBatch(self.origins, self.directions, tmax=np.ones(2))
+
+    def test_position(self):
+        batch = RayBatch(self.origins, self.directions)
+        assert np.array_equal(
+            np.array([[0.0, 0.0, 2.0], [3.0, 2.0, 3.0], [-1.0, -1.5, 2.0]]),
+            batch.position(2.0),
+        )
+        assert np.array_equal(
+            np.array([[0.0, 0.0, 1.0], [3.0, 2.0, 3.0], [-1.0, -2.5, 2.0]]),
+            batch.position(np.array([1.0, 2.0, 3.0])),
+        )
+
+    def test_slicing_and_compaction(self):
+        batch = RayBatch(self.origins, self.directions, tmax=np.array([1.0, 2.0, 3.0]))
+        sub = batch[1:]
+        assert 2 == len(sub)
+        assert np.array_equal(np.array([2.0, 3.0]), sub.tmax)
+        compacted = batch.compact(np.array([True, False, True]))
+        assert np.array_equal(self.origins[[0, 2]], compacted.origins)
+        assert np.array_equal(np.array([1.0, 3.0]), compacted.tmax)
+
+    def test_ray_conversion(self):
+        rays = [
+            Ray(origin=Point3D(1, 2, 3), direction=Vector3D(0, 1, 0), tmax=5.0),
+            Ray(origin=Point3D(-1, 0, 4), direction=Vector3D(1, 0, 0)),
+        ]
+        batch = RayBatch.from_rays(rays)
+        assert np.array_equal(np.array([5.0, np.inf]), batch.tmax)
+        ray = batch[0]
+        assert Point3D(1, 2, 3) == ray.origin
+        assert Vector3D(0, 1, 0) == ray.direction
+        assert 5.0 == ray.tmax
+        back = batch.to_rays()
+        assert Point3D(-1, 0, 4) == back[1].origin
+        assert Point3D(1, 4, 3) == back[0].position(2)
+
+    def test_inverse_direction_caches(self):
+        batch = RayBatch(np.zeros((2, 3)), np.array([[2.0, -4.0, 0.0], [-0.5, 1.0, -0.0]]))
+        assert np.array_equal(batch.inv_directions, [[0.5, -0.25, np.inf], [-2.0, 1.0, -np.inf]])
+        assert np.array_equal(batch.dir_is_negative, [[False, True, False], [True, False, True]])
+        assert batch.inv_directions is batch.inv_directions
+
+    def test_row_views_cannot_outdate_the_caches(self):
+        batch = RayBatch(np.zeros((2, 3)), np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]]))
+        ray = batch.ray(0)
+        assert np.array_equal(batch.inv_directions[0], [np.inf, np.inf, 1.0])
+        with pytest.raises(ValueError):
+            ray.direction *= 2.0
+        with pytest.raises(ValueError):
+            batch.directions[0] = [0.0, 0.0, 2.0]
+        assert np.array_equal(batch.directions[0], [0.0, 0.0, 1.0])
+        assert np.array_equal(batch.inv_directions[0], [np.inf, np.inf, 1.0])
+
+    def test_writeable_input_is_copied(self):
+        directions = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]])
+        batch = RayBatch(np.zeros((2, 3)), directions)
+        assert np.array_equal(batch.inv_directions[0], [np.inf, np.inf, 1.0])
+        directions[0] = [0.0, 0.0, 2.0]
+        assert np.array_equal(batch.directions[0], [0.0, 0.0, 1.0])
+        assert np.array_equal(batch.inv_directions[0], [np.inf, np.inf, 1.0])
+        # read-only arrays cannot change behind the batch and are not copied
+        frozen = batch.directions
+        assert np.shares_memory(frozen, RayBatch(np.zeros((2, 3)), frozen).directions)
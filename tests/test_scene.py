@@ -0,0 +1,119 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.camera.camera import Camera
+from raymann.common.intersection import Intersection
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, y_rot_matrix
+from raymann.math_tools.matrix4d import Matrix4D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.scene.scene import Scene
+from raymann.transformation.transformer import Transformer
+
+
+class TestScene:
+
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.scene = Scene()
+        for c, r in zip(rng.uniform(-10.0, 10.0, (15, 3)), rng.uniform(0.5, 2.0, 15)):
+            transf = Transformer(translation_matrix(*c) * y_rot_matrix(float(r)) * scale_matrix(r, r, r))
+            self.scene.add(Sphere(transf, Point3D(0.1, 0.0, 0.0), 1.0))
+        self.scene.add(Sphere(Transformer(translation_matrix(0.0, 5.0, -3.0) * scale_matrix(1.0, 3.0, 1.0))))
+        self.scene.add(SphereSet(rng.uniform(-3.0, 3.0, (40, 3)), 0.3, Transformer(translation_matrix(0.0, 0.0, 4.0))))
+        self.scene.add(
+            TriangleMesh(
+                np.array([[-20.0, -20.0, -15.0], [20.0, -20.0, -15.0], [0.0, 20.0, -15.0]], dtype=np.float32),
+                np.array([[0, 1, 2]], dtype=np.int32),
+            )
+        )
+        origins = rng.uniform(-12.0, 12.0, (80, 3))
+        targets = rng.uniform(-12.0, 12.0, (80, 3)) - [0.0, 0.0, 10.0]
+        self.rays = [Ray(origin=Point3D(*o), direction=Vector3D(*(t - o))) for o, t in zip(origins, targets)]
+
+    def _brute_force(self, ray: Ray) -> (float, int):
+        best, prim = np.inf, -1
+        for i, p in enumerate(self.scene.primitives):
+            record = Intersection()
+            if p.intersect(ray, record) and record.t_hit < best:
+                best, prim = record.t_hit, i
+        return best, prim
+
+    @pytest.mark.parametrize("builder", ["sah", "lbvh"])
+    def test_batch_matches_brute_force(self, builder):
+        self.scene.commit(max_leaf_size=2, builder=builder)
+        res = self.scene.intersect_batch(RayBatch.from_rays(self.rays))
+        occluded = self.scene.occluded_batch(RayBatch.from_rays(self.rays))
+        for i, ray in enumerate(self.rays):
+            t, prim = self._brute_force(ray)
+            assert np.isfinite(t) == res.hit[i] == occluded[i]
+            if res.hit[i]:
+                assert prim == res.prim_ids[i]
+                assert t == pytest.approx(res.t_hit[i])
+                record = Intersection()
+                self.scene.primitives[prim].intersect(ray, record)
+                assert np.allclose(record.normal.coordinates, res.normals[i])
+            else:
+                assert -1 == res.prim_ids[i]
+        assert 10 < np.count_nonzero(res.hit) < len(self.rays)
+
+    def test_single_rays(self):
+        self.scene.commit()
+        for ray in self.rays[:20]:
+            t, _ = self._brute_force(ray)
+            record = Intersection()
+            assert np.isfinite(t) == self.scene.intersect(ray, record) == self.scene.occluded(ray)
+            if np.isfinite(t):
+                assert t == pytest.approx(record.t_hit)
+
+    def test_similar_spheres_are_merged(self):
+        self.scene.commit()
+        merged = [g for g in self.scene._groups if isinstance(g, SphereSet) and g is not self.scene.primitives[16]]
+        assert 1 == len(merged) and 15 == len(merged[0])
+        # the stretched sphere stays a single primitive
+        assert self.scene.primitives[15] in self.scene._groups
+        assert (len(self.scene._groups), 4, 4) == self.scene._inverses.shape
+        assert 15 + 1 + 40 + 1 == len(self.scene._elem_source)
+        assert 0 == len(self.scene._unbounded)
+
+    def test_container(self):
+        scene = Scene()
+        with pytest.raises(TypeError):
+            scene.add(Point3D())
+        with pytest.raises(TypeError):
+            scene.add_camera(Point3D())
+        scene.add_camera(Camera(20, 10, np.pi / 2, Matrix4D()))
+        scene.add_light("light")
+        assert 0 == scene.add(Sphere())
+        assert not scene.committed
+        with pytest.raises(RuntimeError):
+            scene.occluded(self.rays[0])
+        with pytest.raises(ValueError):
+            scene.commit(builder="kd")
+        scene.commit()
+        assert scene.committed and 1 == len(scene.cameras) and ["light"] == scene.lights
+        scene.add(Sphere())
+        assert not scene.committed
+
+    def test_moved_primitive_needs_commit(self):
+        scene = Scene()
+        sphere = Sphere()
+        scene.add(sphere)
+        scene.commit()
+        ray = Ray(origin=Point3D(10.0, 0.0, 5.0), direction=Vector3D(0.0, 0.0, -1.0))
+        assert not scene.occluded(ray)
+        sphere.transformation = Transformer(translation_matrix(10.0, 0.0, 0.0))
+        assert not scene.committed
+        # queries answer from the last commit until the scene is committed again
+        assert not scene.occluded(ray)
+        scene.commit()
+        assert scene.committed and scene.occluded(ray)
@@ -6,11 +6,13 @@ import pytest
 import numpy as np
 
 from raymann.common.intersection import Intersection
+from raymann.geometry.primitive import Primitive
 from raymann.geometry.sphere import Sphere
 from raymann.math_tools.math_utils import scale_matrix, translation_matrix
 from raymann.math_tools.normal3d import Normal3D
 from raymann.math_tools.point3d import Point3D
 from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
 from raymann.math_tools.vector3d import Vector3D
 from raymann.transformation.transformer import Transformer
 
@@ -46,4 +48,77 @@ class TestSphere:
         s = Sphere()
         n = s.normal(point)
         assert Normal3D(point) == n
-        assert n.length() == 1.0
\ No newline at end of file
+        assert n.length() == 1.0
+
+    def test_intersection_record_in_world_space(self):
+        sphere = Sphere(Transformer(translation_matrix(0.0, 0.0, 5.0) * scale_matrix(2.0, 2.0, 2.0)))
+        ray = Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, 1.0))
+        record = Intersection()
+        assert sphere.intersect(ray, record)
+        assert 8.0 == record.t_hit
+        assert Point3D(0.0, 0.0, 3.0) == record.hit_point
+        assert Normal3D(0.0, 0.0, -1.0) == record.normal
+        assert Vector3D(0.0, 0.0, -1.0) == record.wo
+
+    def test_miss_leaves_record_untouched(self):
+        sphere = Sphere()
+        ray = Ray(origin=Point3D(0.0, 0.0, -5.0), direction=Vector3D(0.0, 0.0, 1.0), tmax=3.0)
+        record = Intersection()
+        assert not sphere.intersect(ray, record)
+        assert np.isinf(record.t_hit)
+        assert Point3D() == record.hit_point
+
+    def test_batch_intersection_matches_single_rays(self):
+        rng = np.random.default_rng(7)
+        sphere = Sphere(Transformer(translation_matrix(0.5, -0.2, 0.0) * scale_matrix(1.5, 1.0, 2.0)))
+        origins = rng.uniform(-4.0, 4.0, (200, 3))
+        directions = rng.uniform(-1.0, 1.0, (200, 3))
+        tmax = rng.uniform(1.0, 10.0, 200)
+        rays = RayBatch(origins, directions, tmax=tmax)
+        res = sphere.intersect_batch(rays)
+        assert res.hit.any() and not res.hit.all()
+        for i in range(len(rays)):
+            record = Intersection()
+            assert sphere.intersect(rays[i], record) == res.hit[i]
+            if res.hit[i]:
+                assert abs(record.t_hit - res.t_hit[i]) < 1e-9
+                assert rays.tmin[i] <= res.t_hit[i] < rays.tmax[i]
+                assert np.allclose(record.hit_point.coordinates, res.hit_points[i])
+                assert np.allclose(record.normal.coordinates, res.normals[i])
+            else:
+                assert np.isinf(res.t_hit[i])
+
+    def test_batch_matches_generic_fallback(self):
+        sphere = Sphere()
+        rays = RayBatch(np.array([[0.0, 0.0, -5.0], [0.0, 2.0, -5.0]]), np.array([[0.0, 0.0, 1.0]] * 2))
+        res = sphere.intersect_batch(rays)
+        fallback = Primitive.intersect_batch(sphere, rays)
+        assert np.array_equal(fallback.hit, res.hit)
+        assert np.array_equal(fallback.t_hit, res.t_hit)
+        assert np.allclose(fallback.normals, res.normals)
+
+    def test_occluded_matches_intersect(self):
+        rng = np.random.default_rng(9)
+        sphere = Sphere(Transformer(translation_matrix(0.5, -0.2, 0.0) * scale_matrix(1.5, 1.0, 2.0)))
+        rays = RayBatch(rng.uniform(-4.0, 4.0, (200, 3)), rng.uniform(-1.0, 1.0, (200, 3)), tmax=rng.uniform(1.0, 10.0, 200))
+        hit = sphere.intersect_batch(rays).hit
+        assert np.array_equal(hit, sphere.occluded_batch(rays))
+        assert np.array_equal(hit, Primitive.occluded_batch(sphere, rays))
+        assert [sphere.occluded(rays[i]) for i in range(len(rays))] == hit.tolist()
+        with pytest.raises(TypeError):
+            sphere.occluded(None)
+
+    def test_stable_roots_for_distant_origin(self):
+        sphere = Sphere()
+        rays = RayBatch(np.array([[0.0, 0.0, -1e6]]), np.array([[0.0, 0.0, 1.0]]))
+        res = sphere.intersect_batch(rays)
+        assert abs(res.t_hit[0] - (1e6 - 1.0)) < 1e-9
+
+    def test_bounds_follow_radius_and_transformation(self):
+        sphere = Sphere(Transformer(translation_matrix(0.0, 0.0, 5.0) * scale_matrix(2.0, 1.0, 1.0)), Point3D(1.0, 0.0, 0.0), 3.0)
+        box = sphere.bounding_box()
+        assert Point3D(-2.0, -3.0, -3.0) == box.min_point
+        assert Point3D(4.0, 3.0, 3.0) == box.max_point
+        world = sphere.world_bounding_box()
+        assert Point3D(-4.0, -3.0, 2.0) == world.min_point
+        assert Point3D(8.0, 3.0, 8.0) == world.max_point
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import pytest
+import numpy as np
+
+from raymann.common.intersection import Intersection
+from raymann.geometry import sphere_set
+from raymann.geometry.sphere import Sphere
+from raymann.geometry.sphere_set import SphereSet
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+class TestSphereSet:
+
+    def setup_method(self):
+        rng = np.random.default_rng(3)
+        self.centers = rng.uniform(-5.0, 5.0, (40, 3))
+        self.radii = rng.uniform(0.2, 1.0, 40)
+        origins = rng.uniform(-8.0, 8.0, (300, 3))
+        targets = rng.uniform(-5.0, 5.0, (300, 3))
+        self.rays = RayBatch(origins, targets - origins, tmax=rng.uniform(0.5, 2.0, 300))
+
+    def test_invalid_input(self):
+        with pytest.raises(TypeError):
+            SphereSet("centers")
+        with pytest.raises(ValueError):
+            SphereSet(np.zeros((4, 2)))
+        with pytest.raises(ValueError):
+            SphereSet(np.zeros((4, 3)), np.ones(3))
+        with pytest.raises(ValueError):
+            SphereSet(np.zeros((1, 3)), -1.0)
+
+    def test_memory_per_sphere(self):
+        spheres = SphereSet(self.centers, self.radii)
+        assert 32 == (spheres.centers.nbytes + spheres.radii.nbytes) // len(spheres)
+
+    def test_matches_individual_spheres(self):
+        transf = Transformer(translation_matrix(0.5, 0.0, -1.0) * scale_matrix(1.0, 2.0, 1.0))
+        spheres = SphereSet(self.centers, self.radii, transf)
+        res = spheres.intersect_batch(self.rays)
+        assert res.hit.any() and not res.hit.all()
+        singles = [Sphere(transf, Point3D(*c), float(r)) for c, r in zip(self.centers, self.radii)]
+        for i in range(len(self.rays)):
+            t_best, best = np.inf, -1
+            normal = None
+            for j, sphere in enumerate(singles):
+                record = Intersection()
+                if sphere.intersect(self.rays[i], record) and record.t_hit < t_best:
+                    t_best, best, normal = record.t_hit, j, record.normal
+            assert best == res.prim_ids[i]
+            if best >= 0:
+                assert abs(t_best - res.t_hit[i]) < 1e-9
+                assert np.allclose(normal.coordinates, res.normals[i])
+
+    def test_chunked_kernel_matches_single_pass(self, monkeypatch):
+        spheres = SphereSet(self.centers, self.radii)
+        full = spheres.intersect_batch(self.rays)
+        monkeypatch.setattr(sphere_set, "CHUNK_ELEMENTS", 1)
+        chunked = spheres.intersect_batch(self.rays)
+        assert np.array_equal(full.prim_ids, chunked.prim_ids)
+        assert np.array_equal(full.t_hit, chunked.t_hit)
+
+    def test_occluded_matches_intersect(self, monkeypatch):
+        spheres = SphereSet(self.centers, self.radii, Transformer(translation_matrix(0.5, 0.0, 0.0)))
+        hit = spheres.intersect_batch(self.rays).hit
+        assert hit.any() and not hit.all()
+        assert np.array_equal(hit, spheres.occluded_batch(self.rays))
+        monkeypatch.setattr(sphere_set, "CHUNK_ELEMENTS", 1)
+        assert np.array_equal(hit, spheres.occluded_batch(self.rays))
+        assert spheres.occluded(self.rays[int(np.argmax(hit))])
+        ids = np.arange(0, 40, 3)
+        subset = spheres.intersect_batch(self.rays, ids).hit
+        assert np.array_equal(subset, spheres.occluded_batch(self.rays, ids))
+
+    def test_subset_and_leaf_kernel(self):
+        spheres = SphereSet(self.centers, self.radii)
+        ids = np.arange(0, 40, 3)
+        res = spheres.intersect_batch(self.rays, ids)
+        assert np.all(np.isin(res.prim_ids[res.hit], ids))
+        for i in range(len(self.rays)):
+            t, prim = spheres.intersect_prims(
+                self.rays.origins[i], self.rays.directions[i], self.rays.tmin[i], self.rays.tmax[i], ids
+            )
+            assert prim == res.prim_ids[i]
+            assert t == res.t_hit[i]
+
+    def test_single_ray_intersect(self):
+        spheres = SphereSet([[0.0, 0.0, 0.0], [0.0, 0.0, 5.0]], [1.0, 2.0])
+        record = Intersection()
+        ray = Ray(origin=Point3D(0.0, 0.0, 10.0), direction=Vector3D(0.0, 0.0, -1.0))
+        assert spheres.intersect(ray, record)
+        assert 3.0 == record.t_hit
+        assert Point3D(0.0, 0.0, 7.0) == record.hit_point
+
+    def test_bounds(self):
+        spheres = SphereSet([[0.0, 0.0, 0.0], [3.0, 0.0, 0.0]], [1.0, 0.5])
+        mins, maxs = spheres.prim_bounds()
+        assert np.array_equal(mins[1], [2.5, -0.5, -0.5])
+        assert np.array_equal(maxs[0], [1.0, 1.0, 1.0])
+        assert np.array_equal(spheres.prim_centroids(), spheres.centers)
+        box = spheres.bounding_box()
+        assert Point3D(-1.0, -1.0, -1.0) == box.min_point
+        assert Point3D(3.5, 1.0, 1.0) == box.max_point
+        assert abs(spheres.surface_area() - 4.0 * np.pi * 1.25) < 1e-12
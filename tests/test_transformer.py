@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix, z_rot_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+class TestTransformer:
+
+    def setup_method(self):
+        self.t = Transformer(
+            translation_matrix(1, -2, 3) * z_rot_matrix(np.pi / 5) * scale_matrix(1, 2, 3)
+        )
+
+    def test_ray_keeps_parameter_range(self):
+        ray = Ray(origin=Point3D(1, 2, 3), direction=Vector3D(0, 1, 0), tmin=0.5, tmax=7.0)
+        for transformed in (self.t.world_to_obj_space(ray), self.t.obj_to_world_space(ray)):
+            assert 0.5 == transformed.tmin
+            assert 7.0 == transformed.tmax
+
+    def test_normals_stay_perpendicular(self):
+        n = Normal3D(0, 0, 1)
+        tangent = Vector3D(1, 1, 0)
+        world_n = self.t.obj_to_world_space(n)
+        world_tangent = self.t.obj_to_world_space(tangent)
+        assert abs(np.dot(world_n.coordinates, world_tangent.coordinates)) < 1e-12
+        back = self.t.world_to_obj_space(world_n)
+        assert np.allclose(n.coordinates, back.coordinates)
+
+    def test_ray_batch_transforms(self):
+        origins = np.array([[1.0, 2.0, 3.0], [-4.0, 0.0, 0.5]])
+        directions = np.array([[0.0, 1.0, 0.0], [1.0, 1.0, -1.0]])
+        batch = RayBatch(origins, directions, tmin=np.array([0.1, 0.2]), tmax=np.array([5.0, np.inf]))
+        obj = self.t.world_to_obj_space_batch(batch)
+        world = self.t.obj_to_world_space_batch(batch)
+        assert np.array_equal(batch.tmin, obj.tmin)
+        assert np.array_equal(batch.tmax, world.tmax)
+        for i in range(len(batch)):
+            ray = batch[i]
+            obj_ray = self.t.world_to_obj_space(ray)
+            world_ray = self.t.obj_to_world_space(ray)
+            assert np.allclose(obj_ray.origin.coordinates, obj.origins[i])
+            assert np.allclose(obj_ray.direction.coordinates, obj.directions[i])
+            assert np.allclose(world_ray.origin.coordinates, world.origins[i])
+            assert np.allclose(world_ray.direction.coordinates, world.directions[i])
+        with pytest.raises(TypeError):
+            self.t.world_to_obj_space_batch(origins)
+
+    def test_normal_array_transforms(self):
+        normals = np.array([[0.0, 0.0, 1.0], [1.0, -1.0, 0.5]])
+        world = self.t.obj_to_world_space_normals(normals)
+        for i, row in enumerate(normals):
+            n = self.t.obj_to_world_space(Normal3D(*row))
+            assert np.allclose(n.coordinates, world[i])
+        assert np.allclose(normals, self.t.world_to_obj_space_normals(world))
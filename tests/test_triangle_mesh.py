@@ -0,0 +1,164 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+
+import warnings
+
+import pytest
+import numpy as np
+
+from raymann.acceleration.bvh import BVH
+from raymann.common.intersection import Intersection
+from raymann.geometry import triangle_mesh
+from raymann.geometry.triangle_mesh import TriangleMesh
+from raymann.math_tools.math_utils import scale_matrix, translation_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.ray_batch import RayBatch
+from raymann.math_tools.vector3d import Vector3D
+from raymann.transformation.transformer import Transformer
+
+
+def _grid(n: int, dtype=np.float64) -> (np.ndarray, np.ndarray):
+    """an n x n quad grid over [0, 1]^2 at z = 0, two triangles per quad"""
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, n + 1), np.linspace(0.0, 1.0, n + 1))
+    vertices = np.column_stack((x.ravel(), y.ravel(), np.zeros(x.size))).astype(dtype)
+    i, j = np.meshgrid(np.arange(n), np.arange(n))
+    a = (j * (n + 1) + i).ravel()
+    b, c, d = a + 1, a + n + 1, a + n + 2
+    indices = np.concatenate((np.column_stack((a, b, d)), np.column_stack((a, d, c))))
+    return vertices, indices
+
+
+class TestTriangleMesh:
+
+    def setup_method(self):
+        rng = np.random.default_rng(4)
+        self.vertices = rng.uniform(-5.0, 5.0, (90, 3))
+        self.indices = rng.integers(0, 90, (60, 3))
+        origins = rng.uniform(-8.0, 8.0, (300, 3))
+        targets = rng.uniform(-5.0, 5.0, (300, 3))
+        self.rays = RayBatch(origins, targets - origins)
+
+    def test_invalid_input(self):
+        with pytest.raises(TypeError):
+            TriangleMesh("vertices", [[0, 1, 2]])
+        with pytest.raises(ValueError):
+            TriangleMesh(np.zeros((3, 2)), [[0, 1, 2]])
+        with pytest.raises(ValueError):
+            TriangleMesh(np.zeros((3, 3)), [[0, 1, 3]])
+        with pytest.raises(ValueError):
+            TriangleMesh(np.zeros((3, 3)), [[0, 1, 2]], normals=np.zeros((2, 3)))
+
+    def test_buffers_keep_their_dtype(self):
+        vertices, indices = _grid(8, np.float32)
+        mesh = TriangleMesh(vertices, indices.astype(np.int32))
+        assert np.float32 == mesh.vertices.dtype and np.int32 == mesh.indices.dtype
+        assert mesh.vertices.flags.c_contiguous and mesh.indices.flags.c_contiguous
+        assert vertices.nbytes + indices.astype(np.int32).nbytes == mesh.nbytes
+        assert 128 == len(mesh)
+
+    def test_barycentrics(self):
+        mesh = TriangleMesh([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], [[0, 1, 2]])
+        t, prim, uv = mesh.intersect_triangles(
+            [[0.25, 0.5, 2.0], [0.8, 0.8, 2.0]], [[0.0, 0.0, -1.0]] * 2, [0.0, 0.0], [np.inf, np.inf], [0]
+        )
+        assert [2.0, np.inf] == t.tolist()
+        assert [0, -1] == prim.tolist()
+        assert np.allclose(uv[0], [0.25, 0.5])
+        # parallel rays never hit
+        assert (np.inf, -1) == mesh.intersect_prims([0.2, 0.2, 0.0], [1.0, 0.0, 0.0], 0.0, np.inf, [0])
+
+    def test_sliver_is_never_hit(self):
+        # collinear corners, their cross product is only rounding noise
+        corners = np.array([[0.0, 0.0, 0.0], [0.1, 0.2, 0.3], [0.3, 0.6, 0.9]])
+        mesh = TriangleMesh(np.vstack((corners, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])), [[0, 1, 2], [3, 4, 5]])
+        rng = np.random.default_rng(8)
+        points = rng.uniform(0.0, 1.0, (500, 1)) * corners[2]
+        across = np.cross(corners[2], rng.normal(size=(500, 3)))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            t, prim, _ = mesh.intersect_triangles(points + across, -across, np.zeros(500), np.full(500, np.inf), [0])
+            assert np.all(np.isinf(t)) and np.all(prim == -1)
+            rays = RayBatch([[0.25, 0.25, 1.0], [0.2, 0.4, 1.0]], [[0.0, 0.0, -1.0]] * 2)
+            res = mesh.hit_records(rays, [1.0, 1.0], [1, 0])
+        assert np.allclose([0.25, 0.25], res.barycentrics[0])
+        assert np.array_equal([0.0, 0.0], res.barycentrics[1])
+
+    def test_matches_individual_triangles(self):
+        transf = Transformer(translation_matrix(0.5, 0.0, -1.0) * scale_matrix(1.0, 2.0, 1.0))
+        mesh = TriangleMesh(self.vertices, self.indices, transf=transf)
+        res = mesh.intersect_batch(self.rays)
+        assert res.hit.any() and not res.hit.all()
+        for i in range(len(self.rays)):
+            ray = transf.world_to_obj_space(self.rays[i])
+            best = (np.inf, -1)
+            for j in range(len(mesh)):
+                t, prim = mesh.intersect_prims(ray.origin.data, ray.direction.data, ray.tmin, np.inf, [j])
+                best = min(best, (t, prim))
+            assert best[1] == res.prim_ids[i]
+            assert best[0] == res.t_hit[i]
+            if res.hit[i]:
+                v = self.vertices[self.indices[res.prim_ids[i]]]
+                b1, b2 = res.barycentrics[i]
+                point = (1.0 - b1 - b2) * v[0] + b1 * v[1] + b2 * v[2]
+                world = transf.obj_to_world_space(Point3D(*point))
+                assert np.allclose(world.coordinates, res.hit_points[i])
+
+    def test_chunked_kernel_matches_single_pass(self, monkeypatch):
+        mesh = TriangleMesh(self.vertices, self.indices)
+        full = mesh.intersect_batch(self.rays)
+        monkeypatch.setattr(triangle_mesh, "CHUNK_ELEMENTS", 1)
+        chunked = mesh.intersect_batch(self.rays)
+        assert np.array_equal(full.prim_ids, chunked.prim_ids)
+        assert np.array_equal(full.t_hit, chunked.t_hit)
+        assert np.array_equal(full.hit, mesh.occluded_batch(self.rays))
+
+    def test_float32_mesh(self):
+        mesh = TriangleMesh(self.vertices, self.indices)
+        single = TriangleMesh(self.vertices.astype(np.float32), self.indices.astype(np.int32))
+        res = mesh.intersect_batch(self.rays)
+        res32 = single.intersect_batch(self.rays)
+        same = res.prim_ids == res32.prim_ids
+        assert np.count_nonzero(same) > 0.95 * len(self.rays)
+        assert np.allclose(res.t_hit[same & res.hit], res32.t_hit[same & res.hit], rtol=1e-5)
+
+    def test_normals(self):
+        vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+        normals = [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0]]
+        ray = Ray(origin=Point3D(0.5, 0.0, 1.0), direction=Vector3D(0.0, 0.0, -1.0))
+        record = Intersection()
+        assert TriangleMesh(vertices, [[0, 1, 2]]).intersect(ray, record)
+        assert Normal3D(0.0, 0.0, 1.0) == record.normal
+        assert TriangleMesh(vertices, [[0, 1, 2]], normals).intersect(ray, record)
+        assert np.allclose(record.normal.coordinates, np.array([1.0, 0.0, 2.0]) / np.sqrt(5.0))
+        assert 1.0 == record.t_hit
+
+    def test_bvh_over_mesh(self):
+        vertices, indices = _grid(30)
+        rng = np.random.default_rng(2)
+        vertices[:, 2] = rng.uniform(-0.05, 0.05, vertices.shape[0])
+        mesh = TriangleMesh(vertices, indices)
+        bvh = BVH.build(*mesh.prim_bounds(), mesh.prim_centroids())
+        all_ids = np.arange(len(mesh))
+        for o in rng.uniform(0.0, 1.0, (40, 3)) + [0.0, 0.0, 1.0]:
+            d = np.array([0.1, -0.2, -1.0])
+            expected = mesh.intersect_prims(o, d, 0.0, np.inf, all_ids)
+            assert expected == bvh.closest_hit(
+                o, d, 0.0, np.inf, lambda ids, tmax: mesh.intersect_prims(o, d, 0.0, tmax, ids)
+            )
+            assert (expected[1] >= 0) == bvh.any_hit(
+                o, d, 0.0, np.inf, lambda ids, tmax: (0.0, 0) if mesh.occluded_prims(o, d, 0.0, tmax, ids) else (np.inf, -1)
+            )
+
+    def test_bounds_and_area(self):
+        vertices, indices = _grid(4)
+        mesh = TriangleMesh(vertices, indices, transf=Transformer(translation_matrix(0.0, 0.0, 2.0)))
+        mins, maxs = mesh.prim_bounds()
+        assert np.array_equal(mins[0], [0.0, 0.0, 0.0])
+        assert np.array_equal(maxs[0], [0.25, 0.25, 0.0])
+        assert np.allclose(mesh.world_prim_bounds()[0][:, 2], 2.0)
+        assert np.allclose(mesh.prim_centroids()[0], [0.5 / 3.0, 0.25 / 3.0, 0.0])
+        assert Point3D(1.0, 1.0, 0.0) == mesh.bounding_box().max_point
+        assert abs(mesh.surface_area() - 1.0) < 1e-12
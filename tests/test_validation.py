@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Andreas Nazlidis
+# Licensed under the GNU General Public License v3.
+# See LICENSE file for details.
+import pytest
+
+import numpy as np
+
+from raymann.acceleration.bounding_box import BoundingBox
+from raymann.common import validation
+from raymann.common.intersection import Intersection
+from raymann.geometry.sphere import Sphere
+from raymann.math_tools.math_utils import cross, dot, scale_matrix, translation_matrix
+from raymann.math_tools.normal3d import Normal3D
+from raymann.math_tools.point3d import Point3D
+from raymann.math_tools.ray import Ray
+from raymann.math_tools.vector2d import Vector2D
+from raymann.math_tools.vector3d import Vector3D
+from raymann.math_tools.vector4d import Vector4D
+from raymann.transformation.transformer import Transformer
+
+
+def _compute():
+    """a mix of user facing calls whose results are compared between modes"""
+    a = Vector3D(1, 2, 3)
+    b = Vector3D(-0.7, 4.5, -0.232)
+    p = Point3D(5, 6, 7)
+    n = Normal3D(0.3, -1, 2)
+    res = [
+        -a + b - b * np.abs(a) + 2.0 - 1.5,
+        (a * 3.0).normalized(),
+        p - Point3D(1, 1, 1),
+        p + a,
+        p - a,
+        -(p * 0.5),
+        n * 2.0 + n - 1.0,
+        n.normalized(),
+        cross(a, b),
+        Vector2D(1, 2) * 3.0 - Vector2D(0.5, 0.5),
+        Vector4D(1, 2, 3, 4) + Vector4D(a) * 2.0,
+        translation_matrix(1, 2, 3) * scale_matrix(2, 2, 2) * p,
+    ]
+    values = [r.coordinates for r in res] + [dot(a, b), a.length()]
+
+    sphere = Sphere(Transformer(scale_matrix(2.0, 2.0, 2.0)))
+    record = Intersection()
+    ray = Ray(origin=Point3D(0.0, 0.5, -5.0), direction=Vector3D(0.0, 0.0, 1.0))
+    values.append(sphere.intersect(ray, record))
+    values.append(record.t_hit)
+    values.append(record.hit_point.coordinates)
+    values.append(record.normal.coordinates)
+
+    box = BoundingBox(Point3D(np.inf, np.inf, np.inf), Point3D(-np.inf, -np.inf, -np.inf))
+    box.add_point(Point3D(-5, 2, 0))
+    box.add_point(Point3D(7, 0, -3))
+    values.append(box.min_point.coordinates)
+    values.append(box.max_point.coordinates)
+    return values
+
+
+class TestValidation:
+
+    def test_checked_is_default(self):
+        assert validation.is_checked()
+
+    def test_unchecked_context_restores_mode(self):
+        with validation.unchecked():
+            assert not validation.is_checked()
+            with validation.unchecked():
+                assert not validation.is_checked()
+            assert not validation.is_checked()
+        assert validation.is_checked()
+        with pytest.raises(TypeError):
+            validation.set_checked(0)
+
+    def test_modes_produce_identical_results(self):
+        checked = _compute()
+        with validation.unchecked():
+            unchecked = _compute()
+        assert len(checked) == len(unchecked)
+        for c, u in zip(checked, unchecked):
+            assert np.array_equal(c, u)
+
+    def test_checked_mode_validates(self):
+        with pytest.raises(TypeError):
+            Vector3D("a", [1], 2)
+        with pytest.raises(TypeError):
+            Point3D(1, 2, 3).x = "1"
+        with pytest.raises(TypeError):
+            Intersection().t_hit = "inf"
+        with pytest.raises(TypeError):
+            BoundingBox().add_point(Vector3D())
+
+    def test_unchecked_mode_skips_validation(self):
+        with validation.unchecked():
+            record = Intersection()
+            record.t_hit = np.float32(2.0)
+            assert 2.0 == record.t_hit
+            v = Vector3D(np.int64(1), np.int64(2), np.int64(3))
+            assert Vector3D(1, 2, 3) == v
+
+    def test_trusted_constructor_wraps_array(self):
+        data = np.array([1.0, 2.0, 3.0])
+        p = Point3D._from_array(data)
+        assert Point3D(1, 2, 3) == p
+        data[0] = 5.0
+        assert 5.0 == p.x
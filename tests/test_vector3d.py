@@ -50,3 +50,31 @@ class TestVector3D:
             v.y = "2"
         with pytest.raises(TypeError):
             v.z = "3"
+
+    def test_in_place_operators(self):
+        a = Vector3D(1, 2, 3)
+        data = a._data
+        a += Vector3D(1, 1, 1)
+        a -= 0.5
+        a *= 2
+        a *= Vector3D(1, -1, 0.5)
+        assert a._data is data
+        assert Vector3D(3, -5, 3.5) == a
+        with pytest.raises(TypeError):
+            a += "1"
+
+    def test_out_methods(self):
+        a = Vector3D(1, 2, 3)
+        b = Vector3D(5, 6, 7)
+        out = Vector3D()
+        assert out is a.add(b, out=out)
+        assert a + b == out
+        a.sub(b, out=out)
+        assert a - b == out
+        a.mul(2.0, out=out)
+        assert a * 2.0 == out
+        assert a + b == a.add(b)
+        a.add(b, out=a)
+        assert Vector3D(6, 8, 10) == a
+        with pytest.raises(TypeError):
+            a.add(b, out=np.zeros(3))